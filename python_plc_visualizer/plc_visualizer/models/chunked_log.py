@@ -1,7 +1,11 @@
 """Chunked log data structure for memory-efficient large file handling."""
 
+import sys
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import islice
+from operator import attrgetter, le
 from typing import Optional, Dict, Set, List, Tuple
 from collections import OrderedDict
 
@@ -12,13 +16,16 @@ from .data_types import LogEntry
 class TimeChunk:
     """A time-based chunk of log entries.
 
-    Represents entries within a specific time window.
+    Represents entries within a specific time window. Entries are kept in
+    chronological order alongside a parallel ``timestamps`` column, so
+    sub-range lookups are a bisect and a slice instead of a scan.
     """
     start_time: datetime
     end_time: datetime
     entries: List[LogEntry] = field(default_factory=list)
     signals: Set[str] = field(default_factory=set)
     devices: Set[str] = field(default_factory=set)
+    timestamps: List[datetime] = field(default_factory=list, repr=False)
 
     @property
     def entry_count(self) -> int:
@@ -30,16 +37,31 @@ class TimeChunk:
         """Duration of this chunk."""
         return self.end_time - self.start_time
 
+    def entries_between(self, start_time: datetime, end_time: datetime) -> List[LogEntry]:
+        """Get entries with start_time <= timestamp < end_time, in time order."""
+        timestamps = self.timestamps
+        lo = bisect_left(timestamps, start_time)
+        hi = bisect_left(timestamps, end_time, lo)
+        return self.entries[lo:hi]
+
     def __post_init__(self):
-        """Calculate signals and devices if not provided."""
+        """Build the timestamp column and calculate signals and devices if not provided."""
+        if len(self.timestamps) != len(self.entries):
+            get_timestamp = attrgetter("timestamp")
+            timestamps = list(map(get_timestamp, self.entries))
+            if not all(map(le, timestamps, islice(timestamps, 1, None))):
+                self.entries = sorted(self.entries, key=get_timestamp)
+                timestamps = list(map(get_timestamp, self.entries))
+            self.timestamps = timestamps
+
         if not self.signals and self.entries:
-            self.signals = {
-                f"{entry.device_id}::{entry.signal_name}"
-                for entry in self.entries
-            }
+            # Build each key once per distinct pair, interned so that every
+            # chunk shares the same key strings
+            pairs = {(entry.device_id, entry.signal_name) for entry in self.entries}
+            self.signals = {sys.intern(f"{device_id}::{signal_name}") for device_id, signal_name in pairs}
 
         if not self.devices and self.entries:
-            self.devices = {entry.device_id for entry in self.entries}
+            self.devices = {sys.intern(entry.device_id) for entry in self.entries}
 
 
 class ChunkedParsedLog:
@@ -140,32 +162,69 @@ class ChunkedParsedLog:
         # Load chunk
         try:
             chunk = self._chunk_loader(chunk_key, chunk_end)
+        except Exception as e:
+            print(f" Error loading chunk {chunk_key}: {e}")
+            return None
 
-            # Add to cache
-            self._chunks[chunk_key] = chunk
+        self._store_chunk(chunk_key, chunk)
+        return chunk
 
-            # Update global metadata
-            self._all_signals.update(chunk.signals)
-            self._all_devices.update(chunk.devices)
-            self._total_entry_count += chunk.entry_count
+    def _store_chunk(self, chunk_key: datetime, chunk: TimeChunk):
+        """Add a freshly loaded chunk to the cache, evicting LRU chunks."""
+        # Add to cache
+        self._chunks[chunk_key] = chunk
 
-            # Evict old chunks if over limit
-            evicted_count = 0
-            while len(self._chunks) > self.max_chunks_in_memory:
-                # Remove least recently used (first item)
-                old_key, old_chunk = self._chunks.popitem(last=False)
-                evicted_count += 1
-                # Note: We don't decrement _total_entry_count as it tracks
-                # total entries seen, not currently in memory
+        # Update global metadata
+        self._all_signals.update(chunk.signals)
+        self._all_devices.update(chunk.devices)
+        self._total_entry_count += chunk.entry_count
 
-            if evicted_count > 0:
-                print(f"  Evicted {evicted_count} old chunk(s) (LRU cache limit: {self.max_chunks_in_memory})")
+        # Evict old chunks if over limit
+        evicted_count = 0
+        while len(self._chunks) > self.max_chunks_in_memory:
+            # Remove least recently used (first item)
+            old_key, old_chunk = self._chunks.popitem(last=False)
+            evicted_count += 1
+            # Note: We don't decrement _total_entry_count as it tracks
+            # total entries seen, not currently in memory
 
-            return chunk
+        if evicted_count > 0:
+            print(f"  Evicted {evicted_count} old chunk(s) (LRU cache limit: {self.max_chunks_in_memory})")
 
-        except Exception as e:
-            print(f" Error loading chunk {chunk_key}: {e}")
-            return None
+    def add_chunk(self, chunk_key: datetime, chunk: TimeChunk) -> TimeChunk:
+        """Add a chunk that was loaded outside of the cache (e.g. by a prefetch).
+
+        If the chunk was loaded in the meantime, the resident copy is kept.
+
+        Returns:
+            The chunk now cached under ``chunk_key``
+        """
+        resident = self._chunks.get(chunk_key)
+        if resident is not None:
+            self._chunks.move_to_end(chunk_key)
+            return resident
+        self._store_chunk(chunk_key, chunk)
+        return chunk
+
+    def missing_chunks(self, start_time: datetime, end_time: datetime) -> List[datetime]:
+        """Get keys of chunks overlapping a time range that are not in memory.
+
+        Chunks of the range that are in memory are marked as recently used.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+
+        Returns:
+            List of chunk start times still to be loaded
+        """
+        missing = []
+        for chunk_key in self._get_overlapping_chunks(start_time, end_time):
+            if chunk_key in self._chunks:
+                self._chunks.move_to_end(chunk_key)
+            else:
+                missing.append(chunk_key)
+        return missing
 
     def get_entries_in_range(
         self,
@@ -189,19 +248,18 @@ class ChunkedParsedLog:
         # Find all chunks that overlap with requested range
         chunk_keys = self._get_overlapping_chunks(start_time, end_time)
 
+        # Chunks come back in time order and each is sorted, so clipping
+        # every chunk to its own window keeps the concatenation sorted
         entries = []
         for chunk_key in chunk_keys:
             chunk = self._ensure_chunk_loaded(chunk_key)
             if not chunk:
                 continue
 
-            # Filter entries in this chunk to the requested range
-            for entry in chunk.entries:
-                if start_time <= entry.timestamp < end_time:
-                    entries.append(entry)
-
-        # Sort by timestamp
-        entries.sort(key=lambda e: e.timestamp)
+            entries.extend(chunk.entries_between(
+                max(start_time, chunk.start_time),
+                min(end_time, chunk.end_time),
+            ))
 
         return entries
 
@@ -37,6 +37,11 @@ class ParsedLog:
     signals: set[str] = field(default_factory=set)
     devices: set[str] = field(default_factory=set)
     time_range: tuple[datetime, datetime] | None = None
+    # Set by producers that guarantee entries are in timestamp order
+    sorted_by_timestamp: bool = False
+    # Entries grouped per (device_id, signal_name), filled on first use by
+    # utils.waveform_data.group_by_signal. Entries must not change afterwards.
+    _grouped_entries: dict | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Calculate signals and time_range if not provided."""
@@ -23,6 +23,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Iterator, Optional, Dict, Set, List, Tuple, Iterable
 from datetime import datetime
+from operator import attrgetter
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import re
 import sys
@@ -125,7 +126,7 @@ def _parse_value_fast(s: str, stype: SignalType, infer_ok: bool, has_float: bool
         if u in _BOOL_FALSE:
             return False
         if infer_ok:
-            return s
+            return sys.intern(s)
         raise ValueError(f"Invalid boolean value: {s}")
 
     if stype == SignalType.INTEGER:
@@ -133,7 +134,7 @@ def _parse_value_fast(s: str, stype: SignalType, infer_ok: bool, has_float: bool
             return _parse_int_like(s)
         except ValueError:
             if infer_ok:
-                return s
+                return sys.intern(s)
             raise
 
     if hasattr(SignalType, "FLOAT") and stype == getattr(SignalType, "FLOAT"):
@@ -141,11 +142,13 @@ def _parse_value_fast(s: str, stype: SignalType, infer_ok: bool, has_float: bool
             return _parse_float_like(s)
         except ValueError:
             if infer_ok:
-                return s
+                return sys.intern(s)
             raise
 
-    # STRING or unknown enum → just return the original text
-    return s
+    # STRING or unknown enum → the original text. Interned because string
+    # signals repeat a handful of values (states, carrier IDs) across many
+    # lines, and every entry and signal state would otherwise hold its own copy.
+    return sys.intern(s)
 
 
 # ---------------------- Public base classes ----------------------
@@ -211,7 +214,8 @@ class BaseParser(ABC):
             entries=filtered_entries,
             signals=result.data.signals,  # Keep all signals metadata
             devices=result.data.devices,  # Keep all devices metadata
-            time_range=(start_time, end_time)
+            time_range=(start_time, end_time),
+            sorted_by_timestamp=result.data.sorted_by_timestamp,
         )
 
         return ParseResult(data=filtered_log, errors=result.errors)
@@ -413,9 +417,9 @@ class GenericTemplateLogParser(BaseParser):
             return ParseResult(data=None, errors=errors, processing_time=elapsed)
 
         if not self.USE_CHRONO_DETECTION or out_of_order:
-            entries.sort(key=lambda e: e.timestamp)
+            entries.sort(key=attrgetter("timestamp"))
 
-        parsed = ParsedLog(entries=entries, signals=signals, devices=devices)
+        parsed = ParsedLog(entries=entries, signals=signals, devices=devices, sorted_by_timestamp=True)
         elapsed = time.perf_counter() - start_time
         return ParseResult(data=parsed, errors=errors, processing_time=elapsed)
 
@@ -514,9 +518,11 @@ class GenericTemplateLogParser(BaseParser):
             return ParseResult(data=None, errors=errors, processing_time=elapsed)
 
         if not self.USE_CHRONO_DETECTION or out_of_order:
-            all_entries.sort(key=lambda e: e.timestamp)
+            all_entries.sort(key=attrgetter("timestamp"))
 
-        parsed = ParsedLog(entries=all_entries, signals=all_signals, devices=all_devices)
+        parsed = ParsedLog(
+            entries=all_entries, signals=all_signals, devices=all_devices, sorted_by_timestamp=True
+        )
         elapsed = time.perf_counter() - start_time
         return ParseResult(data=parsed, errors=errors, processing_time=elapsed)
 
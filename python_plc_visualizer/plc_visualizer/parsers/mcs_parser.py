@@ -28,6 +28,7 @@ import re
 import sys
 import logging
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional, List, Tuple
 from .base_parser import GenericTemplateLogParser, _infer_type_fast, _parse_value_fast, _fast_ts
 from plc_visualizer.models import LogEntry, ParseResult, ParsedLog, ParseError, SignalType
@@ -166,9 +167,10 @@ class MCSLogParser(GenericTemplateLogParser):
             try:
                 return int(value)
             except ValueError:
-                return value  # Fallback to string
+                return sys.intern(value)  # Fallback to string
         
-        return value
+        # Interned: the same states and IDs repeat across many lines
+        return sys.intern(value)
 
     def _parse_line_to_entries(self, line: str) -> List[Tuple[str, str, datetime, any, SignalType]]:
         """Parse a single line into multiple (device_id, signal_name, timestamp, value, type) tuples.
@@ -349,9 +351,9 @@ class MCSLogParser(GenericTemplateLogParser):
         
         # Sort if needed
         if not self.USE_CHRONO_DETECTION or out_of_order:
-            entries.sort(key=lambda e: e.timestamp)
+            entries.sort(key=attrgetter("timestamp"))
         
-        parsed = ParsedLog(entries=entries, signals=signals, devices=devices)
+        parsed = ParsedLog(entries=entries, signals=signals, devices=devices, sorted_by_timestamp=True)
         elapsed = time.perf_counter() - start_time
         
         logger.info(f"MCS parse complete: {len(entries)} entries, {len(devices)} devices, "
@@ -379,7 +381,7 @@ class MCSLogParser(GenericTemplateLogParser):
         max_consecutive = 1000
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            with open(file_path, 'r', encoding='utf-8', errors='replace', buffering=self.BUFFER_SIZE) as f:
                 for line_num, line in enumerate(f, 1):
                     line = line.strip()
                     if not line:
@@ -134,7 +134,7 @@ class PLCDebugParser(GenericTemplateLogParser):
         device_id_re = re.compile(r"([A-Za-z0-9_-]+)(?:@[^\]]+)?$")
 
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            with open(file_path, 'r', encoding='utf-8', errors='replace', buffering=self.BUFFER_SIZE) as f:
                 for line_num, line in enumerate(f, 1):
                     line = line.strip()
                     if not line:
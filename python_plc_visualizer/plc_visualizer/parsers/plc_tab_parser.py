@@ -127,7 +127,7 @@ class PLCTabParser(GenericTemplateLogParser):
         max_consecutive_out_of_range = 1000  # Stop after this many consecutive entries past end_time
 
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            with open(file_path, 'r', encoding='utf-8', errors='replace', buffering=self.BUFFER_SIZE) as f:
                 for line_num, line in enumerate(f, 1):
                     line = line.strip()
                     if not line:
@@ -55,6 +55,18 @@ class TestViewportState:
         assert viewport_state.visible_duration == timedelta(minutes=2)
         assert viewport_state.zoom_level == pytest.approx(1.0)
 
+    def test_full_duration_seconds_tracks_full_range(
+        self, viewport_state: ViewportState, long_range: tuple[datetime, datetime], short_range: tuple[datetime, datetime]
+    ):
+        assert viewport_state.full_duration_seconds == 0.0
+
+        viewport_state.set_full_time_range(*long_range)
+        assert viewport_state.full_duration_seconds == 3600.0
+
+        viewport_state.set_full_time_range(*short_range)
+        assert viewport_state.full_duration_seconds == 120.0
+        assert viewport_state.zoom_level == pytest.approx(1.0)
+
     def test_zoom_in_reduces_duration(self, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
         viewport_state.set_full_time_range(*long_range)
         baseline_duration = viewport_state.visible_duration
@@ -76,6 +88,31 @@ class TestViewportState:
         assert viewport_state.visible_duration >= zoomed_duration
         assert viewport_state.visible_duration == timedelta(seconds=ViewportState.MAX_VISIBLE_DURATION_SECONDS)
 
+    def test_zoom_round_trip_returns_to_the_same_window(self, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+        viewport_state.set_visible_duration(10.0)
+        visible = viewport_state.visible_time_range
+
+        for _ in range(7):
+            viewport_state.zoom_in(factor=1.2)
+        for _ in range(7):
+            viewport_state.zoom_out(factor=1.2)
+
+        assert viewport_state.visible_duration_seconds == 10.0
+        assert viewport_state.visible_time_range == visible
+
+    def test_zoom_round_trip_stays_within_rounding(self, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+        viewport_state.set_visible_duration(7.3)
+        start_duration = viewport_state.visible_duration_seconds
+
+        for _ in range(7):
+            viewport_state.zoom_in(factor=1.2)
+        for _ in range(7):
+            viewport_state.zoom_out(factor=1.2)
+
+        assert viewport_state.visible_duration_seconds == pytest.approx(start_duration, rel=1e-9)
+
     def test_zoom_in_hits_minimum(self, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
         viewport_state.set_full_time_range(*long_range)
 
@@ -116,6 +153,81 @@ class TestViewportState:
         assert clamped_start == viewport_state.full_time_range[0]
         assert clamped_end - clamped_start == viewport_state.visible_duration
 
+    def test_microsecond_ranges_round_trip_exactly(self, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+        start = long_range[0] + timedelta(seconds=1234, microseconds=567_891)
+        end = start + timedelta(seconds=7, microseconds=3)
+
+        viewport_state.set_time_range(start, end)
+        assert viewport_state.visible_time_range == (start, end)
+
+        viewport_state.jump_to_time(long_range[1])
+        assert viewport_state.visible_time_range == (long_range[1] - (end - start), long_range[1])
+
+    def test_pan_at_edge_is_a_no_op(self, qtbot, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+        emitted = []
+        viewport_state.time_range_changed.connect(lambda start, end: emitted.append((start, end)))
+        visible = viewport_state.visible_time_range
+
+        viewport_state.pan(delta_seconds=-5)
+        viewport_state.pan(delta_seconds=0)
+
+        assert viewport_state.visible_time_range == visible
+        qtbot.wait(ViewportState.PAN_EMIT_INTERVAL_MS * 3)
+        assert emitted == []
+
+    def test_rapid_pans_emit_once(self, qtbot, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+        emitted = []
+        viewport_state.time_range_changed.connect(lambda start, end: emitted.append((start, end)))
+
+        for _ in range(10):
+            viewport_state.pan(delta_seconds=1)
+
+        assert emitted == []
+        assert viewport_state.visible_time_range[0] == long_range[0] + timedelta(seconds=10)
+        qtbot.waitUntil(lambda: len(emitted) == 1)
+        assert emitted == [viewport_state.visible_time_range]
+
+    def test_pans_defer_datetime_conversion(self, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+
+        viewport_state.pan(delta_seconds=2.5)
+        assert viewport_state._visible_range is None
+
+        visible = viewport_state.visible_time_range
+        assert visible[0] == long_range[0] + timedelta(seconds=2.5)
+        assert viewport_state.visible_time_range is visible
+
+    def test_direct_update_supersedes_pending_pan(self, qtbot, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+        emitted = []
+        viewport_state.time_range_changed.connect(lambda start, end: emitted.append((start, end)))
+
+        viewport_state.pan(delta_seconds=30)
+        viewport_state.jump_to_time(long_range[0] + timedelta(minutes=20))
+        assert emitted == [viewport_state.visible_time_range]
+
+        qtbot.wait(ViewportState.PAN_EMIT_INTERVAL_MS * 3)
+        assert len(emitted) == 1
+
+    def test_rapid_zooms_emit_range_once(self, qtbot, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
+        viewport_state.set_full_time_range(*long_range)
+        emitted = []
+        durations = []
+        viewport_state.time_range_changed.connect(lambda start, end: emitted.append((start, end)))
+        viewport_state.duration_changed.connect(durations.append)
+
+        for _ in range(5):
+            viewport_state.zoom_in(factor=1.2)
+
+        assert emitted == []
+        assert durations[-1] == pytest.approx(viewport_state.visible_duration_seconds)
+        assert len(durations) == 5
+        qtbot.waitUntil(lambda: len(emitted) == 1)
+        assert emitted == [viewport_state.visible_time_range]
+
     def test_set_time_range_clamps_duration(self, viewport_state: ViewportState, long_range: tuple[datetime, datetime]):
         start, end = long_range
         viewport_state.set_full_time_range(start, end)
@@ -157,9 +157,17 @@ class DataTableWidget(QWidget):
             parsed_log: ParsedLog containing entries to display
         """
         self._parsed_log = parsed_log
-        self.model.set_entries(parsed_log.entries)
+        self._set_entries(parsed_log.entries)
         self.row_count_label.setText(f"{parsed_log.entry_count:,} entries")
 
+    def _set_entries(self, entries: list[LogEntry]):
+        """Swap the model rows without repainting the view mid-reset."""
+        self.table_view.setUpdatesEnabled(False)
+        try:
+            self.model.set_entries(entries)
+        finally:
+            self.table_view.setUpdatesEnabled(True)
+
     def clear(self):
         """Clear the table."""
         self.model.clear()
@@ -187,7 +195,7 @@ class DataTableWidget(QWidget):
                 if entry_key(entry) in signal_names
             ]
 
-        self.model.set_entries(filtered_entries)
+        self._set_entries(filtered_entries)
 
         total = self._parsed_log.entry_count
         filtered_count = len(filtered_entries)
@@ -13,6 +13,69 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QTime
 
 
+_INVALID_INPUT_QSS = "border: 2px solid red;"
+
+_PAN_CONTROLS_QSS = """
+    QWidget {
+        background-color: #f5f5f5;
+        border-radius: 4px;
+    }
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton:pressed {
+        background-color: #0D47A1;
+    }
+    QPushButton:disabled {
+        background-color: #BDBDBD;
+    }
+    QLabel {
+        background-color: transparent;
+        font-size: 12px;
+        color: #333;
+    }
+    QLineEdit {
+        background-color: white;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-size: 12px;
+    }
+    QLineEdit:focus {
+        border: 1px solid #2196F3;
+    }
+    QScrollBar:horizontal {
+        border: 1px solid #999999;
+        background: white;
+        height: 15px;
+        margin: 0px 0px 0px 0px;
+        border-radius: 3px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #2196F3;
+        min-width: 20px;
+        border-radius: 3px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: #1976D2;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+        background: #e0e0e0;
+    }
+"""
+
+
 class PanControls(QWidget):
     """Widget providing pan/navigation controls.
 
@@ -93,65 +156,7 @@ class PanControls(QWidget):
         layout.addWidget(self.go_btn)
 
         # Apply styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f5f5f5;
-                border-radius: 4px;
-            }
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-            QPushButton:disabled {
-                background-color: #BDBDBD;
-            }
-            QLabel {
-                background-color: transparent;
-                font-size: 12px;
-                color: #333;
-            }
-            QLineEdit {
-                background-color: white;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 12px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #2196F3;
-            }
-            QScrollBar:horizontal {
-                border: 1px solid #999999;
-                background: white;
-                height: 15px;
-                margin: 0px 0px 0px 0px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #2196F3;
-                min-width: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #1976D2;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: #e0e0e0;
-            }
-        """)
+        self.setStyleSheet(_PAN_CONTROLS_QSS)
 
     def _on_scroll_changed(self, value: int):
         """Handle scrollbar value change.
@@ -172,7 +177,7 @@ class PanControls(QWidget):
 
         selected_date = self.date_combo.currentData()
         if selected_date is None:
-            self.date_combo.setStyleSheet("border: 2px solid red;")
+            self.date_combo.setStyleSheet(_INVALID_INPUT_QSS)
             return
         else:
             self.date_combo.setStyleSheet("")
@@ -188,7 +193,7 @@ class PanControls(QWidget):
                 time_obj = QTime.fromString(time_text, "HH:mm")
 
             if not time_obj.isValid():
-                self.time_input.setStyleSheet("border: 2px solid red;")
+                self.time_input.setStyleSheet(_INVALID_INPUT_QSS)
                 return
 
             # Create datetime with the parsed time
@@ -210,7 +215,7 @@ class PanControls(QWidget):
             self.time_input.clear()
 
         except Exception:
-            self.time_input.setStyleSheet("border: 2px solid red;")
+            self.time_input.setStyleSheet(_INVALID_INPUT_QSS)
 
     def set_scroll_position(self, position: float, visible_fraction: float = 1.0):
         """Update scrollbar position and adjust handle size.
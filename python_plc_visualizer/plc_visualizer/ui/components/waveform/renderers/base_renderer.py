@@ -2,12 +2,18 @@
 
 from abc import ABC, abstractmethod
 from bisect import bisect_left, bisect_right
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from PySide6.QtGui import QPainterPath, QPen, QBrush, QColor
 from PySide6.QtCore import QRectF
 
 from plc_visualizer.utils import SignalData, SignalState
+from plc_visualizer.utils.waveform_mipmap import (
+    MIN_MIPMAP_STATES,
+    MipmapLevel,
+    build_signal_mipmap,
+    select_mipmap_level,
+)
 
 
 class BaseRenderer(ABC):
@@ -84,13 +90,19 @@ class BaseRenderer(ABC):
     def clip_states(
         self,
         signal_data: SignalData,
-        time_range: tuple[datetime, datetime]
+        time_range: tuple[datetime, datetime],
+        width: float | None = None
     ) -> list[SignalState]:
         """Clip signal states to the visible time range.
 
+        When ``width`` is given and more states are visible than there are
+        pixels, the states are taken from the signal's mipmap instead, so
+        the result stays proportional to the width rather than the data.
+
         Args:
             signal_data: Signal data containing states and cached offsets
             time_range: Visible time range (start, end)
+            width: Width in pixels the states will be drawn into
 
         Returns:
             List of SignalState objects covering the visible range
@@ -107,15 +119,31 @@ class BaseRenderer(ABC):
         start_seconds = (start_time - anchor).total_seconds()
         end_seconds = (end_time - anchor).total_seconds()
 
-        start_offsets = signal_data.start_offsets
-        end_offsets = signal_data.end_offsets
+        indexed = bool(signal_data.start_offsets and signal_data.end_offsets)
 
         start_idx = 0
         end_idx = len(states)
         last_value_before_range = None
 
-        if start_offsets and end_offsets:
-            start_idx = bisect_right(end_offsets, start_seconds)
+        if indexed:
+            start_idx, end_idx = signal_data.clip(start_seconds, end_seconds)
+
+        if width and len(states) >= MIN_MIPMAP_STATES and indexed:
+            if end_idx - start_idx > width:
+                if signal_data.mipmap is None:
+                    build_signal_mipmap(signal_data)
+                level = select_mipmap_level(signal_data, (end_seconds - start_seconds) / width)
+                if level is not None:
+                    return self._clip_mipmap_level(
+                        level,
+                        anchor,
+                        start_seconds,
+                        end_seconds,
+                        states[0].value,
+                        states[-1].value,
+                    )
+
+        if indexed:
             if start_idx > 0:
                 last_value_before_range = states[start_idx - 1].value
             if start_idx >= len(states):
@@ -124,7 +152,6 @@ class BaseRenderer(ABC):
                 filler.end_offset = end_seconds
                 return [filler]
 
-            end_idx = bisect_left(start_offsets, end_seconds, lo=start_idx)
             if end_idx <= start_idx:
                 end_idx = min(start_idx + 1, len(states))
 
@@ -179,6 +206,51 @@ class BaseRenderer(ABC):
 
         return clipped
 
+    @staticmethod
+    def _clip_mipmap_level(
+        level: MipmapLevel,
+        anchor: datetime,
+        start_seconds: float,
+        end_seconds: float,
+        first_value,
+        last_value
+    ) -> list[SignalState]:
+        """Clip a mipmap level to the visible range, padding both ends."""
+        starts = level.start_offsets
+        ends = level.end_offsets
+        values = level.values
+
+        lo = bisect_right(ends, start_seconds)
+        hi = bisect_left(starts, end_seconds, lo)
+
+        def make_state(segment_start: float, segment_end: float, value) -> SignalState:
+            state = SignalState(
+                start_time=anchor + timedelta(seconds=segment_start),
+                end_time=anchor + timedelta(seconds=segment_end),
+                value=value
+            )
+            state.start_offset = segment_start
+            state.end_offset = segment_end
+            return state
+
+        clipped: list[SignalState] = []
+        for index in range(lo, hi):
+            segment_start = max(starts[index], start_seconds)
+            segment_end = min(ends[index], end_seconds)
+            if segment_end > segment_start:
+                clipped.append(make_state(segment_start, segment_end, values[index]))
+
+        if not clipped:
+            value = last_value if lo >= len(values) else first_value
+            return [make_state(start_seconds, end_seconds, value)]
+
+        if clipped[0].start_offset > start_seconds:
+            clipped.insert(0, make_state(start_seconds, clipped[0].start_offset, first_value))
+        if clipped[-1].end_offset < end_seconds:
+            clipped.append(make_state(clipped[-1].end_offset, end_seconds, last_value))
+
+        return clipped
+
     def value_at_time(
         self,
         states: list[SignalState],
@@ -6,6 +6,7 @@ from PySide6.QtGui import QPainterPath, QColor
 from PySide6.QtCore import Qt
 
 from plc_visualizer.utils import SignalData, SignalState
+from plc_visualizer.utils.waveform_mipmap import MIXED
 from .base_renderer import BaseRenderer
 
 
@@ -34,7 +35,8 @@ class BooleanRenderer(BaseRenderer):
     ) -> list[tuple[QPainterPath, object, object]]:
         """Render boolean signal as square wave.
 
-        High = top of track, Low = bottom of track
+        High = top of track, Low = bottom of track. MIXED spans from a
+        zoomed-out mipmap are drawn as a band covering both levels.
         """
         items = []
         if clipped_states is None:
@@ -56,7 +58,7 @@ class BooleanRenderer(BaseRenderer):
         path = QPainterPath()
         first_state = clipped_states[0]
         first_x = max(0.0, min(width, (first_state.start_offset - range_start_offset) * pixel_factor))
-        current_y = high_y if first_state.value else low_y
+        current_y = high_y if first_state.value and first_state.value is not MIXED else low_y
         current_x = first_x
 
         path.moveTo(first_x, current_y)
@@ -67,11 +69,21 @@ class BooleanRenderer(BaseRenderer):
             x_start = max(0.0, min(width, (state.start_offset - range_start_offset) * pixel_factor))
             x_end = max(0.0, min(width, (state.end_offset - range_start_offset) * pixel_factor))
 
-            state_y = high_y if state.value else low_y
-
             if x_start > current_x:
                 path.lineTo(x_start, current_y)
 
+            if state.value is MIXED:
+                # Trace both rails; the band between them is filled below
+                path.lineTo(x_start, high_y)
+                path.lineTo(x_end, high_y)
+                path.moveTo(x_start, low_y)
+                path.lineTo(x_end, low_y)
+                current_x = x_end
+                current_y = low_y
+                continue
+
+            state_y = high_y if state.value else low_y
+
             if state_y != current_y:
                 path.lineTo(x_start, state_y)
 
@@ -80,7 +92,7 @@ class BooleanRenderer(BaseRenderer):
             current_x = x_end
             current_y = state_y
 
-        # Add filled regions for high states
+        # Add filled regions for high (and mixed) states
         for state in clipped_states:
             if state.value:  # High state
                 x_start = max(0.0, min(width, (state.start_offset - range_start_offset) * pixel_factor))
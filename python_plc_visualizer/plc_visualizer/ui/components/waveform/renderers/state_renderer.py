@@ -6,6 +6,7 @@ from PySide6.QtGui import QPainterPath, QColor, QPen, QFont
 from PySide6.QtCore import Qt, QRectF
 
 from plc_visualizer.utils import SignalData, SignalState
+from plc_visualizer.utils.waveform_mipmap import MIXED
 from .base_renderer import BaseRenderer
 
 
@@ -104,6 +105,10 @@ class StateRenderer(BaseRenderer):
         pixel_factor = width / range_duration
 
         for state in clipped_states:
+            # Spans summarised from the mipmap have no single value to show
+            if state.value is MIXED:
+                continue
+
             x_start = max(0.0, min(width, (state.start_offset - range_start_offset) * pixel_factor))
             x_end = max(0.0, min(width, (state.end_offset - range_start_offset) * pixel_factor))
 
@@ -8,6 +8,7 @@ from PySide6.QtCore import QRectF
 
 from plc_visualizer.models import SignalType
 from plc_visualizer.utils import SignalData, SignalState
+from plc_visualizer.utils.waveform_mipmap import MIXED
 from .renderers import BooleanRenderer, StateRenderer
 from .transition_marker_item import TransitionMarkerItem
 
@@ -75,7 +76,7 @@ class SignalItem(QGraphicsItem):
         self.path_items.clear()
         self.text_items.clear()
 
-        clipped_states = self.renderer.clip_states(self.signal_data, self.time_range)
+        clipped_states = self.renderer.clip_states(self.signal_data, self.time_range, self.width)
         self._last_clipped_states = clipped_states
 
         if not clipped_states:
@@ -232,7 +233,9 @@ class SignalItem(QGraphicsItem):
             if state.value == prev_state.value:
                 prev_state = state
                 continue
-            transitions.append((prev_state, state))
+            # Edges into or out of a mipmap MIXED span have no exact timestamp
+            if state.value is not MIXED and prev_state.value is not MIXED:
+                transitions.append((prev_state, state))
             prev_state = state
 
         if not transitions:
@@ -1,6 +1,8 @@
 """Graphics scene for waveform visualization."""
 
+from collections import defaultdict
 from datetime import datetime
+from operator import attrgetter
 
 from PySide6.QtWidgets import QGraphicsScene
 from PySide6.QtCore import QRect
@@ -418,7 +420,12 @@ class WaveformScene(QGraphicsScene):
             return
 
         # Get entries in the visible range
-        entries = self.chunk_manager.get_entries_in_range(start_time, end_time)
+        viewport = self._viewport_state
+        entries = self.chunk_manager.get_entries_in_range(
+            start_time,
+            end_time,
+            zoom_level=viewport.zoom_level if viewport else None,
+        )
 
         if not entries:
             # Clear all states if no entries in range
@@ -427,18 +434,16 @@ class WaveformScene(QGraphicsScene):
             return
 
         # Group entries by signal
-        from plc_visualizer.utils.waveform_data import calculate_signal_states
+        from plc_visualizer.utils.waveform_data import calculate_signal_states, count_transitions
 
-        grouped: dict[str, list] = {}
+        grouped: defaultdict[tuple[str, str], list] = defaultdict(list)
         for entry in entries:
-            key = f"{entry.device_id}::{entry.signal_name}"
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(entry)
+            grouped[(entry.device_id, entry.signal_name)].append(entry)
 
         # Sort entries by timestamp for each signal
-        for key in grouped:
-            grouped[key].sort(key=lambda e: e.timestamp)
+        by_timestamp = attrgetter("timestamp")
+        for signal_entries in grouped.values():
+            signal_entries.sort(key=by_timestamp)
 
         # Update states for visible signals
         for signal_key in self.visible_signal_names:
@@ -446,7 +451,7 @@ class WaveformScene(QGraphicsScene):
             if not signal_data:
                 continue
 
-            signal_entries = grouped.get(signal_key, [])
+            signal_entries = grouped.get((signal_data.device_id, signal_data.name), [])
 
             if signal_entries:
                 # Calculate states for this time window
@@ -454,13 +459,12 @@ class WaveformScene(QGraphicsScene):
                     signal_entries,
                     (start_time, end_time)
                 )
-                signal_data.build_time_index(start_time)
+                signal_data.build_time_index(start_time, offsets_anchor=start_time)
                 signal_data._entries_count = len(signal_entries)
-                if len(signal_entries) > 1:
-                    signal_data.transition_count = max(
-                        signal_data.transition_count,
-                        len(signal_entries) - 1,
-                    )
+                signal_data.transition_count = max(
+                    signal_data.transition_count,
+                    count_transitions(signal_entries),
+                )
 
                 # Update signal type from first entry
                 if signal_data.signal_type is None:
@@ -1,5 +1,9 @@
 """Zoom controls widget for waveform visualization."""
 
+from bisect import bisect_right
+from math import log
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -9,11 +13,84 @@ from PySide6.QtWidgets import (
     QLabel,
     QToolButton,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QIcon
 from ..clickable_label import ClickableLabel
 
 
+# Slider positions 0..1000 map logarithmically from the longest window to the shortest
+_SLIDER_STEPS = 1000
+_SLIDER_MIN_DURATION = 0.001  # 1ms
+_SLIDER_MAX_DURATION = 300.0  # 5 minutes
+_SLIDER_DURATIONS = (
+    (_SLIDER_MAX_DURATION,)
+    + tuple(
+        _SLIDER_MAX_DURATION * (_SLIDER_MIN_DURATION / _SLIDER_MAX_DURATION) ** (i / _SLIDER_STEPS)
+        for i in range(1, _SLIDER_STEPS)
+    )
+    + (_SLIDER_MIN_DURATION,)
+)
+# Negated so the table is ascending for bisect
+_NEGATED_SLIDER_DURATIONS = tuple(-duration for duration in _SLIDER_DURATIONS)
+# While the handle is dragged, zoom updates go out at most this often
+_SLIDER_THROTTLE_MS = 50
+
+
+_ZOOM_CONTROLS_QSS = """
+    QWidget {
+        background-color: #f5f5f5;
+        border-radius: 4px;
+    }
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton:pressed {
+        background-color: #0D47A1;
+    }
+    QPushButton:disabled {
+        background-color: #BDBDBD;
+    }
+    QLabel {
+        background-color: transparent;
+        font-size: 12px;
+        font-weight: bold;
+        color: #333;
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #999999;
+        height: 6px;
+        background: white;
+        margin: 2px 0;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #2196F3;
+        border: 1px solid #1976D2;
+        width: 16px;
+        height: 16px;
+        margin: -6px 0;
+        border-radius: 8px;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #1976D2;
+    }
+    QSlider::sub-page:horizontal {
+        background: #64B5F6;
+        border: 1px solid #999999;
+        height: 6px;
+        border-radius: 3px;
+    }
+"""
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to a human-readable string.
 
@@ -61,6 +138,11 @@ class ZoomControls(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._pending_slider_value: Optional[int] = None
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(_SLIDER_THROTTLE_MS)
+        self._slider_timer.timeout.connect(self._flush_slider)
         self._init_ui()
 
     def _init_ui(self):
@@ -86,7 +168,8 @@ class ZoomControls(QWidget):
         self.zoom_slider.setValue(0)  # Start at minimum (1x)
         self.zoom_slider.setFixedWidth(200)
         self.zoom_slider.setToolTip("Zoom level (1x to 100x)")
-        self.zoom_slider.valueChanged.connect(self._on_slider_changed)
+        self.zoom_slider.valueChanged.connect(self._on_slider_value_changed)
+        self.zoom_slider.sliderReleased.connect(self._flush_slider)
         slider_container.addWidget(self.zoom_slider)
 
         layout.addLayout(slider_container)
@@ -115,59 +198,28 @@ class ZoomControls(QWidget):
         layout.addStretch()
 
         # Apply styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f5f5f5;
-                border-radius: 4px;
-            }
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-            QPushButton:disabled {
-                background-color: #BDBDBD;
-            }
-            QLabel {
-                background-color: transparent;
-                font-size: 12px;
-                font-weight: bold;
-                color: #333;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #999999;
-                height: 6px;
-                background: white;
-                margin: 2px 0;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #2196F3;
-                border: 1px solid #1976D2;
-                width: 16px;
-                height: 16px;
-                margin: -6px 0;
-                border-radius: 8px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #1976D2;
-            }
-            QSlider::sub-page:horizontal {
-                background: #64B5F6;
-                border: 1px solid #999999;
-                height: 6px;
-                border-radius: 3px;
-            }
-        """)
+        self.setStyleSheet(_ZOOM_CONTROLS_QSS)
+
+    def _on_slider_value_changed(self, value: int):
+        """Apply clicks and key presses at once; throttle drags."""
+        if not self.zoom_slider.isSliderDown():
+            self._slider_timer.stop()
+            self._pending_slider_value = None
+            self._on_slider_changed(value)
+            return
+
+        self._pending_slider_value = value
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+
+    def _flush_slider(self):
+        """Emit the latest dragged slider value, if any."""
+        self._slider_timer.stop()
+        value = self._pending_slider_value
+        if value is None:
+            return
+        self._pending_slider_value = None
+        self._on_slider_changed(value)
 
     def _on_slider_changed(self, value: int):
         """Handle slider value change.
@@ -178,23 +230,8 @@ class ZoomControls(QWidget):
         # Map slider value (0-1000) to duration (max to min)
         # Slider at 0 = max duration (most zoomed out)
         # Slider at 1000 = min duration (most zoomed in)
-        # Using logarithmic scale for better control
-
-        import math
-        min_duration = 0.001  # 1ms
-        max_duration = 300.0  # 5 minutes
-
-        if value == 0:
-            duration = max_duration
-        elif value == 1000:
-            duration = min_duration
-        else:
-            # Logarithmic scale from max to min
-            # Invert the slider so left = more time (zoomed out), right = less time (zoomed in)
-            inverted_value = 1000 - value
-            duration = max_duration * math.pow(min_duration / max_duration, (1000 - inverted_value) / 1000.0)
-
-        self.duration_changed.emit(duration)
+        # Logarithmic scale, precomputed in _SLIDER_DURATIONS
+        self.duration_changed.emit(_SLIDER_DURATIONS[value])
 
     def set_visible_duration(self, duration_seconds: float, min_duration: float = 0.001, max_duration: float = 300.0):
         """Update the display to show the current visible duration.
@@ -208,8 +245,6 @@ class ZoomControls(QWidget):
         self.zoom_label.setText(f"Window: {format_duration(duration_seconds)}")
 
         # Update slider position (without triggering signal)
-        import math
-
         # Constrain duration to bounds
         duration_seconds = max(min_duration, min(duration_seconds, max_duration))
 
@@ -217,10 +252,13 @@ class ZoomControls(QWidget):
             slider_value = 0  # Most zoomed out
         elif duration_seconds <= min_duration:
             slider_value = 1000  # Most zoomed in
+        elif min_duration == _SLIDER_MIN_DURATION and max_duration == _SLIDER_MAX_DURATION:
+            # Last slider position whose duration is still >= the requested one
+            slider_value = bisect_right(_NEGATED_SLIDER_DURATIONS, -duration_seconds) - 1
         else:
             # Inverse logarithmic scale
             # Calculate how far we are from max_duration to min_duration
-            ratio = math.log(duration_seconds / max_duration) / math.log(min_duration / max_duration)
+            ratio = log(duration_seconds / max_duration) / log(min_duration / max_duration)
             slider_value = int(ratio * 1000.0)
 
         # Block signals to avoid feedback loop
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Sequence
 
 from PySide6.QtWidgets import (
@@ -84,8 +85,33 @@ def apply_secondary_button_style(button: QPushButton) -> None:
     button.setStyleSheet(SECONDARY_BUTTON_STYLE)
 
 
+@lru_cache(maxsize=None)
+def buttons_stylesheet(
+    primary: tuple[str, ...] = (),
+    secondary: tuple[str, ...] = (),
+) -> str:
+    """Return one stylesheet that styles buttons by object name.
+
+    Set it once on a window instead of calling ``setStyleSheet`` per button;
+    ``primary`` and ``secondary`` list the object names for each style.
+    """
+    parts = [
+        PRIMARY_BUTTON_STYLE.replace("QPushButton", f"QPushButton#{name}")
+        for name in primary
+    ]
+    parts.extend(
+        SECONDARY_BUTTON_STYLE.replace("QPushButton", f"QPushButton#{name}")
+        for name in secondary
+    )
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
 def surface_stylesheet(object_name: str) -> str:
-    """Return a stylesheet that paints a widget with the shared surface color."""
+    """Return a stylesheet that paints a widget with the shared surface color.
+
+    Results are cached per object name since every window asks for the same few.
+    """
     return f"""
     QWidget#{object_name} {{
         background-color: {SURFACE_BG};
@@ -93,8 +119,9 @@ def surface_stylesheet(object_name: str) -> str:
     """
 
 
+@lru_cache(maxsize=None)
 def card_panel_styles(object_name: str) -> str:
-    """Return a stylesheet for panels with rounded borders on white cards."""
+    """Return a stylesheet for panels with rounded borders on white cards (cached)."""
     return f"""
     QWidget#{object_name}, QFrame#{object_name} {{
         background-color: {CARD_BG};
@@ -175,6 +202,7 @@ __all__ = [
     "SURFACE_BG",
     "apply_primary_button_style",
     "apply_secondary_button_style",
+    "buttons_stylesheet",
     "card_panel_styles",
     "create_header_bar",
     "surface_stylesheet",
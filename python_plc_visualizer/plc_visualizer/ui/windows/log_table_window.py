@@ -7,6 +7,7 @@ from typing import Callable, Optional
 from bisect import bisect_left
 from datetime import datetime
 import csv
+import sys
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -19,30 +20,77 @@ from PySide6.QtWidgets import (
     QFrame,
     QSplitter,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, Signal
 
 from plc_visualizer.models import ParsedLog
 from plc_visualizer.utils import SignalData
 from plc_visualizer.app.session_manager import SessionManager
-from plc_visualizer.validation import SignalValidator, ValidationViolation
+from plc_visualizer.validation import SignalValidator, ValidationReport
 from ..components.signal_filter_widget import SignalFilterWidget
 from ..components.data_table_widget import DataTableWidget
 from ..theme import (
     MUTED_TEXT,
     PRIMARY_NAVY,
-    apply_primary_button_style,
-    apply_secondary_button_style,
+    buttons_stylesheet,
     card_panel_styles,
     create_header_bar,
     surface_stylesheet,
 )
 
 
+_RULES_LOADED_TMPL = (
+    "Validation rules loaded successfully from:\n{name}\n\n"
+    "Click 'Run Validation' to check the log data."
+)
+
+_SUMMARY_TMPL = (
+    "Found {total} violations in {devices} devices:\n\n"
+    "  Errors: {errors}\n"
+    "  Warnings: {warnings}\n"
+    "  Info: {info}\n\n"
+    "Check console output for details."
+)
+
+
+class ValidationThread(QThread):
+    """Background thread that runs the signal validator over a parsed log."""
+
+    finished = Signal(object)  # ValidationReport
+    error = Signal(str)
+
+    def __init__(
+        self,
+        validator: SignalValidator,
+        parsed_log: ParsedLog,
+        signal_data_list: list[SignalData],
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._validator = validator
+        self._parsed_log = parsed_log
+        self._signal_data_list = signal_data_list
+
+    def run(self):
+        """Validate every device within the worker thread."""
+        try:
+            report = self._validator.validate_all(
+                self._parsed_log,
+                self._signal_data_list
+            )
+            self.finished.emit(report)
+        except Exception as exc:  # pragma: no cover - reported in the UI
+            import traceback
+            traceback.print_exc()
+            self.error.emit(str(exc))
+
+
 class LogTableView(QWidget):
     """Embeddable view that displays the parsed log table with filtering controls."""
 
     VIEW_TYPE = "log_table"
 
+    validation_finished = Signal(object)  # ValidationReport
+
     def __init__(self, session_manager: SessionManager, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Log Table")
@@ -51,8 +99,10 @@ class LogTableView(QWidget):
         self._signal_data_list: list[SignalData] = []
         self._interval_request_handler: Optional[Callable[[str], None]] = None
         self._validator: Optional[SignalValidator] = None
-        self._violations: dict[str, list[ValidationViolation]] = {}
+        self._report: Optional[ValidationReport] = None
         self._loaded_rules_path: Optional[Path] = None
+        self._validation_thread: Optional[ValidationThread] = None
+        self._last_visible: Optional[frozenset[str]] = None
         self._session_manager = session_manager
         self._init_ui()
         self._connect_session_signals()
@@ -69,9 +119,10 @@ class LogTableView(QWidget):
     def clear(self):
         """Reset the window to an empty state."""
         self._parsed_log = None
-        self._signal_data_map.clear()
-        self._signal_data_list.clear()
-        self._violations.clear()
+        self._signal_data_map = {}
+        self._signal_data_list = []
+        self._report = None
+        self._last_visible = None
         self.signal_filter.clear()
         self.data_table.clear()
 
@@ -81,12 +132,23 @@ class LogTableView(QWidget):
             self.clear()
             return
 
+        # Re-sending the same objects (e.g. on view refresh) changes nothing.
+        if parsed_log is self._parsed_log and signal_data is self._signal_data_list:
+            return
+
         self._parsed_log = parsed_log
         self._signal_data_map = {item.key: item for item in signal_data}
         self._signal_data_list = signal_data
 
-        self.signal_filter.set_signals(signal_data)
-        self.data_table.set_data(parsed_log)
+        # Hold off repaints until both the filter and the table are populated.
+        self.setUpdatesEnabled(False)
+        try:
+            self.signal_filter.set_signals(signal_data)
+            self.data_table.set_data(parsed_log)
+        finally:
+            self.setUpdatesEnabled(True)
+        # The table now shows every row, whatever the filter emitted above.
+        self._last_visible = None
     
     def get_current_time(self):
         """Get the timestamp of the currently selected row, or None if no selection."""
@@ -163,6 +225,8 @@ class LogTableView(QWidget):
         Returns:
             True if rules loaded successfully, False otherwise.
         """
+        self._ensure_validation_toolbar()
+
         # Show file dialog if no path provided
         if rules_path is None:
             file_path, _ = QFileDialog.getOpenFileName(
@@ -175,9 +239,10 @@ class LogTableView(QWidget):
                 return False  # User cancelled
             rules_path = file_path
 
+        rules_path = Path(rules_path)
         try:
             self._validator = SignalValidator(rules_path)
-            self._loaded_rules_path = Path(rules_path)
+            self._loaded_rules_path = self._validator.rules_path
 
             # Update UI
             self._update_validation_ui()
@@ -185,8 +250,7 @@ class LogTableView(QWidget):
             QMessageBox.information(
                 self,
                 "Rules Loaded",
-                f"Validation rules loaded successfully from:\n{self._loaded_rules_path.name}\n\n"
-                f"Click 'Run Validation' to check the log data."
+                _RULES_LOADED_TMPL.format(name=self._loaded_rules_path.name),
             )
             return True
         except FileNotFoundError:
@@ -204,19 +268,24 @@ class LogTableView(QWidget):
             )
             return False
 
-    def run_validation(self) -> dict[str, list[ValidationViolation]]:
-        """Run validation on current log data.
+    def run_validation(self) -> bool:
+        """Start validating the current log data in a background thread.
+
+        Results are reported through ``validation_finished`` once the worker
+        completes, so the UI stays responsive on large logs.
 
         Returns:
-            Dictionary mapping device_id to list of violations.
+            True if a validation run was started, False otherwise.
         """
+        self._ensure_validation_toolbar()
+
         if self._validator is None:
             QMessageBox.warning(
                 self,
                 "No Rules Loaded",
                 "Please load validation rules first."
             )
-            return {}
+            return False
 
         if self._parsed_log is None or not self._signal_data_list:
             QMessageBox.warning(
@@ -224,85 +293,109 @@ class LogTableView(QWidget):
                 "No Data",
                 "Please load log data first."
             )
-            return {}
+            return False
 
-        try:
-            # Run validation
-            self._violations = self._validator.validate_all(
-                self._parsed_log,
-                self._signal_data_list
-            )
+        if self.is_validating:
+            return False
 
-            # Show summary
-            total_violations = sum(len(v) for v in self._violations.values())
-            devices_with_violations = len(self._violations)
-
-            if total_violations == 0:
-                QMessageBox.information(
-                    self,
-                    "Validation Complete",
-                    "No violations found! All signals follow expected patterns."
-                )
-            else:
-                # Count by severity
-                error_count = sum(
-                    1 for vlist in self._violations.values()
-                    for v in vlist if v.severity == "error"
-                )
-                warning_count = sum(
-                    1 for vlist in self._violations.values()
-                    for v in vlist if v.severity == "warning"
-                )
-                info_count = sum(
-                    1 for vlist in self._violations.values()
-                    for v in vlist if v.severity == "info"
-                )
-
-                QMessageBox.warning(
-                    self,
-                    "Validation Complete",
-                    f"Found {total_violations} violations in {devices_with_violations} devices:\n\n"
-                    f"  Errors: {error_count}\n"
-                    f"  Warnings: {warning_count}\n"
-                    f"  Info: {info_count}\n\n"
-                    f"Check console output for details."
-                )
-
-                # Print detailed violations to console
-                self._print_violations()
-
-            return self._violations
+        self.run_validation_btn.setEnabled(False)
+        self.run_validation_btn.setText("Validating...")
 
-        except Exception as e:
-            QMessageBox.critical(
+        self._validation_thread = ValidationThread(
+            self._validator,
+            self._parsed_log,
+            self._signal_data_list,
+            self,
+        )
+        self._validation_thread.finished.connect(self._on_validation_finished)
+        self._validation_thread.error.connect(self._on_validation_error)
+        self._validation_thread.start()
+        return True
+
+    @property
+    def is_validating(self) -> bool:
+        """Return True while a background validation run is in progress."""
+        return bool(self._validation_thread and self._validation_thread.isRunning())
+
+    def _on_validation_finished(self, report: ValidationReport):
+        """Summarize the results of a completed validation run."""
+        self._teardown_validation_thread()
+        self._report = report
+
+        if report.total == 0:
+            QMessageBox.information(
                 self,
-                "Validation Error",
-                f"Error during validation:\n{str(e)}"
+                "Validation Complete",
+                "No violations found! All signals follow expected patterns."
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Validation Complete",
+                _SUMMARY_TMPL.format(
+                    total=report.total,
+                    devices=len(report.sorted_device_ids),
+                    errors=report.error_count,
+                    warnings=report.warning_count,
+                    info=report.info_count,
+                ),
             )
-            import traceback
-            traceback.print_exc()
-            return {}
+
+            # Print detailed violations to console
+            self._print_violations()
+
+        self.validation_finished.emit(report)
+
+    def _on_validation_error(self, message: str):
+        """Report a failed validation run."""
+        self._teardown_validation_thread()
+        QMessageBox.critical(
+            self,
+            "Validation Error",
+            f"Error during validation:\n{message}"
+        )
+
+    def _teardown_validation_thread(self):
+        if self._validation_thread:
+            self._validation_thread.wait()
+            self._validation_thread.deleteLater()
+            self._validation_thread = None
+        self.run_validation_btn.setText("Run Validation")
+        self._update_validation_ui()
 
     def _print_violations(self):
-        """Print violations to console for debugging."""
-        print("\n" + "=" * 80)
-        print("VALIDATION VIOLATIONS")
-        print("=" * 80)
+        """Print violations to console for debugging.
 
-        for device_id in sorted(self._violations.keys()):
-            violations = self._violations[device_id]
-            print(f"\nDevice: {device_id}")
-            print("-" * 80)
+        The report is assembled up front and written in one call so large
+        violation sets don't pay for a stdout write per line.
+        """
+        report = self._report
+        if report is None:
+            return
 
-            for violation in violations:
-                print(f"  {violation}")
+        rule = "=" * 80
+        lines = ["", rule, "VALIDATION VIOLATIONS", rule]
 
-        print("\n" + "=" * 80 + "\n")
+        for device_id in report.sorted_device_ids:
+            violations = report.violations[device_id]
+            lines.append(f"\nDevice: {device_id}")
+            lines.append("-" * 80)
+            lines.extend(f"  {violation}" for violation in violations)
+
+        lines.append("\n" + rule + "\n\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     # Internal helpers ---------------------------------------------------
     def _init_ui(self):
         self.setObjectName("LogTableViewSurface")
-        self.setStyleSheet(surface_stylesheet("LogTableViewSurface"))
+        self.setStyleSheet(
+            surface_stylesheet("LogTableViewSurface")
+            + buttons_stylesheet(
+                primary=("RunValidationBtn",),
+                secondary=("LoadRulesBtn", "SaveTableBtn"),
+            )
+        )
 
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(0, 0, 0, 0)
@@ -323,9 +416,13 @@ class LogTableView(QWidget):
         content_layout.setSpacing(12)
         root_layout.addWidget(content, stretch=1)
 
-        # Validation toolbar
-        validation_panel = self._create_validation_toolbar()
-        content_layout.addWidget(validation_panel)
+        # Validation toolbar is built on first show (or first use); until then
+        # a zero-height placeholder holds its slot in the layout.
+        self._validation_panel: Optional[QFrame] = None
+        self._toolbar_placeholder = QWidget()
+        self._toolbar_placeholder.setFixedHeight(0)
+        self._toolbar_layout = content_layout
+        content_layout.addWidget(self._toolbar_placeholder)
 
         # Create splitter for collapsible filter panel
         splitter_frame = QWidget()
@@ -373,6 +470,23 @@ class LogTableView(QWidget):
         splitter.setStretchFactor(1, 1)
         splitter.setSizes([320, 900])
 
+    def showEvent(self, event):
+        """Build the validation toolbar the first time the view is shown."""
+        self._ensure_validation_toolbar()
+        super().showEvent(event)
+
+    def _ensure_validation_toolbar(self):
+        """Create the validation toolbar in place of its placeholder, once."""
+        if self._validation_panel is not None:
+            return
+        self._validation_panel = self._create_validation_toolbar()
+        self._toolbar_layout.replaceWidget(self._toolbar_placeholder, self._validation_panel)
+        self._toolbar_placeholder.deleteLater()
+        self._toolbar_placeholder = None
+        # Widgets added after the parent is shown stay hidden unless shown explicitly.
+        self._validation_panel.show()
+        self._update_validation_ui()
+
     def _create_validation_toolbar(self) -> QFrame:
         """Create the validation control toolbar."""
         frame = QFrame()
@@ -390,9 +504,9 @@ class LogTableView(QWidget):
 
         # Load Rules button
         self.load_rules_btn = QPushButton("Load Rules...")
+        self.load_rules_btn.setObjectName("LoadRulesBtn")
         self.load_rules_btn.setToolTip("Load validation rules from a YAML file")
         self.load_rules_btn.clicked.connect(self._on_load_rules_clicked)
-        apply_secondary_button_style(self.load_rules_btn)
         layout.addWidget(self.load_rules_btn)
 
         # Status label
@@ -404,10 +518,10 @@ class LogTableView(QWidget):
 
         # Run Validation button
         self.run_validation_btn = QPushButton("Run Validation")
+        self.run_validation_btn.setObjectName("RunValidationBtn")
         self.run_validation_btn.setToolTip("Validate log data against loaded rules")
         self.run_validation_btn.setEnabled(False)  # Disabled until rules are loaded
         self.run_validation_btn.clicked.connect(self._on_run_validation_clicked)
-        apply_primary_button_style(self.run_validation_btn)
         layout.addWidget(self.run_validation_btn)
 
         return frame
@@ -434,7 +548,11 @@ class LogTableView(QWidget):
     def _on_visible_signals_changed(self, visible_names: list[str]):
         if self._parsed_log is None:
             return
-        self.data_table.filter_signals(set(visible_names))
+        visible = frozenset(visible_names)
+        if visible == self._last_visible:
+            return
+        self._last_visible = visible
+        self.data_table.filter_signals(visible)
 
     def _handle_plot_intervals(self, signal_key: str):
         if not signal_key:
@@ -463,9 +581,9 @@ class LogTableView(QWidget):
     def _create_save_button(self) -> QPushButton:
         """Create the save button for the header."""
         btn = QPushButton("Save Table")
+        btn.setObjectName("SaveTableBtn")
         btn.setToolTip("Export current table data to CSV")
         btn.clicked.connect(self._on_save_clicked)
-        apply_secondary_button_style(btn)
         return btn
 
     def _on_save_clicked(self):
@@ -1,8 +1,12 @@
 """Embeddable Map Viewer that uses actual PLC signal data."""
 
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional
-from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta
 
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -19,13 +23,13 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import QSignalBlocker, QTimer, Qt
 from PySide6.QtGui import QKeyEvent
 
-from plc_visualizer.utils import SignalData
+from plc_visualizer.utils import SignalData, SignalState
 from plc_visualizer.app.session_manager import SessionManager
 from tools.map_viewer import MapParser, MapRenderer, MediaControls
-from tools.map_viewer.state_model import UnitStateModel, SignalEvent
+from tools.map_viewer.state_model import UnitStateModel
 from tools.map_viewer.config_loader import load_mapping_and_policy
 from ..theme import (
     apply_primary_button_style,
@@ -35,6 +39,17 @@ from ..theme import (
 )
 
 
+_UNSET = object()
+
+# Origin of the float start-time columns; fixed so reused columns stay comparable
+_EPOCH = datetime(1970, 1, 1)
+
+# Real time between playback ticks at 1× speed; other speeds scale it within the bounds
+_PLAYBACK_INTERVAL_MS = 100
+_MIN_PLAYBACK_INTERVAL_MS = 16
+_MAX_PLAYBACK_INTERVAL_MS = 250
+
+
 class MapViewerView(QWidget):
     """Embeddable map viewer integrated with PLC log data."""
 
@@ -66,25 +81,52 @@ class MapViewerView(QWidget):
         # Signal data from main window
         self._signal_data_list: List[SignalData] = signal_data_list or []
         self._signal_data_map: Dict[str, SignalData] = {}
+        # Column-wise copies of each signal's states for bisect lookups; start
+        # times are seconds since _EPOCH so no per-state objects are kept alive
+        self._signal_starts: Dict[str, array] = {}
+        self._signal_values: Dict[str, List[Any]] = {}
+        # (states, start_offsets) objects each signal's columns were copied from
+        self._signal_sources: Dict[str, Tuple[List[SignalState], array]] = {}
+        # (key, device_id, signal_name) per signal, in signal-map order
+        self._signal_ids: List[Tuple[str, str, str]] = []
+        # Last value sent to the state model per signal, and the time it was sent for
+        self._last_emitted: Dict[str, Any] = {}
+        self._last_emitted_time: Optional[datetime] = None
+        # State index per signal (in _signal_ids order) at the last refresh
+        self._last_indices: Optional[List[int]] = None
         self._current_time: Optional[datetime] = None
         self._available_dates: List[date] = []
+        # Combo index of each available date (items carry no per-item data)
+        self._date_index: Dict[date, int] = {}
+        self._populated_dates: Optional[Tuple[date, ...]] = None
 
         # Media player state
         self._is_playing = False
         self._playback_speed = 1.0
+        # Tick interval and the log time advanced per tick at the current speed
+        self._playback_interval_ms = _PLAYBACK_INTERVAL_MS
+        self._playback_step = timedelta(milliseconds=_PLAYBACK_INTERVAL_MS)
         self._start_time: Optional[datetime] = None
         self._end_time: Optional[datetime] = None
+        self._end_time_text = ""
         self._playback_timer = QTimer(self)
+        self._playback_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._playback_timer.timeout.connect(self._on_playback_tick)
+        self._playback_flush_scheduled = False
+        # Latest slider position, applied once per event-loop pass while dragging
+        self._pending_slider_pos: Optional[int] = None
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(0)
+        self._slider_timer.timeout.connect(self._apply_slider)
+        # Latest state-model output per unit, applied to the renderer in one pass
+        self._pending_unit_states: Dict[str, tuple] = {}
         
         # Carrier follow state
         self._following_carrier_id: Optional[str] = None
 
         # Build signal map by device_id and signal name
-        if self._signal_data_list:
-            for signal in self._signal_data_list:
-                key = f"{signal.device_id}::{signal.name}"
-                self._signal_data_map[key] = signal
+        self._index_signals()
 
         # UI components
         self.renderer = MapRenderer()
@@ -177,8 +219,10 @@ class MapViewerView(QWidget):
             device_map, color_policy = load_mapping_and_policy(yaml_cfg)
 
             # Create state model
+            self._forget_emitted()
+            self._pending_unit_states.clear()
             self.state_model = UnitStateModel(device_map, color_policy)
-            self.state_model.stateChanged.connect(self.renderer.update_rect_color_by_unit)
+            self.state_model.stateChanged.connect(self._queue_unit_state)
             
             # Connect state model to renderer for carrier info display
             self.renderer.set_state_model(self.state_model)
@@ -349,6 +393,11 @@ class MapViewerView(QWidget):
                 return
         
         self.state_model.enable_carrier_tracking = enabled
+
+        # CurrentLocation values are routed differently now; resend everything.
+        self._forget_emitted()
+        if self._current_time:
+            self.update_time_position(self._current_time)
         
         # Update UI state
         # If tracking is disabled, stop following and disable search input
@@ -528,18 +577,71 @@ class MapViewerView(QWidget):
             signal_data_list: List of SignalData objects
         """
         self._signal_data_list = signal_data_list
-        self._signal_data_map.clear()
-
-        # Build signal map
-        for signal in signal_data_list:
-            key = f"{signal.device_id}::{signal.name}"
-            self._signal_data_map[key] = signal
+        self._index_signals()
 
         # Calculate time range from signal data
         self._update_time_range()
 
         print(f"[MapViewer] Updated with {len(signal_data_list)} signals")
 
+    def _index_signals(self):
+        """Rebuild the signal map and the per-signal start/value columns.
+
+        Start times and values are copied out of ``SignalData.states`` once so
+        that each playback tick can bisect instead of scanning every state.
+        Columns are reused only while the signal still holds the same states
+        list and time index they were copied from (and the same number of
+        states), so appending a few signals does not re-copy all, but states
+        that were recomputed or cleared and refilled are always re-read.
+        """
+        previous = self._signal_data_map
+        previous_starts = self._signal_starts
+        previous_values = self._signal_values
+        previous_sources = self._signal_sources
+
+        signal_map: Dict[str, SignalData] = {}
+        for signal in self._signal_data_list:
+            signal_map[sys.intern(f"{signal.device_id}::{signal.name}")] = signal
+
+        starts: Dict[str, array] = {}
+        values: Dict[str, List[Any]] = {}
+        sources: Dict[str, Tuple[List[SignalState], array]] = {}
+        for key, signal in signal_map.items():
+            sources[key] = source = (signal.states, signal.start_offsets)
+            cached = previous_sources.get(key)
+            if (
+                cached is not None
+                and cached[0] is source[0]
+                and cached[1] is source[1]
+                and len(previous_starts[key]) == len(signal.states)
+            ):
+                starts[key] = previous_starts[key]
+                values[key] = previous_values[key]
+                continue
+            starts[key] = array("d", [(state.start_time - _EPOCH).total_seconds() for state in signal.states])
+            values[key] = [state.value for state in signal.states]
+            self._last_emitted.pop(key, None)
+
+        for key in previous.keys() - signal_map.keys():
+            self._last_emitted.pop(key, None)
+
+        self._signal_data_map = signal_map
+        self._signal_starts = starts
+        self._signal_values = values
+        self._signal_sources = sources
+
+        # Identifiers the playback loop needs, so it never touches SignalData attributes
+        self._signal_ids = [
+            (key, sys.intern(signal.device_id), sys.intern(signal.name))
+            for key, signal in self._signal_data_map.items()
+        ]
+        self._last_indices = None
+
+    def _forget_emitted(self):
+        """Drop what was last sent to the state model so the next refresh resends every value."""
+        self._last_emitted.clear()
+        self._last_indices = None
+
     def get_current_time(self):
         """Get the current playback time position."""
         return self._current_time
@@ -611,75 +713,98 @@ class MapViewerView(QWidget):
         self._current_time = current_time
         self._sync_selected_date()
 
-        # Find the signal values at this time and update the state model
-        for key, signal_data in self._signal_data_map.items():
-            device_id = signal_data.device_id
-            signal_name = signal_data.name
-
-            # Find the value at current_time
-            value = self._get_signal_value_at_time(signal_data, current_time)
-
-            if value is not None:
-                # Create signal event
-                event = SignalEvent(
-                    device_id=device_id,
-                    signal_name=signal_name,
-                    value=value,
-                    timestamp=current_time.timestamp()
-                )
-                self.state_model.on_signal(event)
+        # After seeking backwards, resend every value instead of trusting the cache.
+        if self._last_emitted_time is not None and current_time < self._last_emitted_time:
+            self._forget_emitted()
+        self._last_emitted_time = current_time
+
+        indices = self._state_indices_at(current_time)
+        previous_indices, self._last_indices = self._last_indices, indices
+        # Between state changes every signal stays on the same state: nothing to send.
+        if indices == previous_indices:
+            self._update_followed_carrier()
+            return
+
+        # Find the signal values at this time and hand the changes to the state model in one batch
+        last_emitted = self._last_emitted
+        timestamp = current_time.timestamp()
+        events: list[tuple] = []
+        signals = zip(
+            self._signal_ids,
+            self._signal_values.values(),
+            indices,
+            previous_indices or repeat(None),
+        )
+        for (key, device_id, signal_name), values, index, previous_index in signals:
+            if index < 0 or index == previous_index:
+                continue
+            value = values[index]
+
+            # Only changed values reach the state model
+            if value is None or last_emitted.get(key, _UNSET) == value:
+                continue
+            last_emitted[key] = value
+
+            # Plain tuple in SignalEvent field order; on_signals unpacks it directly
+            events.append((device_id, signal_name, value, timestamp))
+
+        if events:
+            self.state_model.on_signals(events)
         
         # Update followed carrier position if following
         self._update_followed_carrier()
 
-    def _get_signal_value_at_time(self, signal_data: SignalData, target_time: datetime):
+    def _state_indices_at(self, target_time: datetime) -> List[int]:
+        """Return the index of the state active at ``target_time`` for every signal.
+
+        Indices follow the order of ``_signal_data_map``; -1 means the signal
+        has not started yet. All signals are resolved in one pass so a playback
+        tick does not pay a method call and dict lookup per signal.
+        """
+        target = (target_time - _EPOCH).total_seconds()
+        return [bisect_right(starts, target) - 1 for starts in self._signal_starts.values()]
+
+    def _get_signal_value_at_time(self, key: str, target_time: datetime):
         """Get the signal value at a specific time.
 
         Args:
-            signal_data: The signal data
+            key: The signal key (``device_id::signal_name``)
             target_time: The target time
 
         Returns:
             The signal value at the target time, or None if not found
         """
-        if not signal_data.states:
+        starts = self._signal_starts.get(key)
+        if not starts:
             return None
 
-        # Find the state at the target time
-        # States are assumed to be ordered by time
-        current_value = None
-
-        for state in signal_data.states:
-            if state.start_time <= target_time:
-                current_value = state.value
-            else:
-                break
-
-        return current_value
+        # States are ordered by time: the last state starting at or before
+        # target_time holds the current value.
+        index = bisect_right(starts, (target_time - _EPOCH).total_seconds()) - 1
+        if index < 0:
+            return None
+        return self._signal_values[key][index]
 
     def _update_time_range(self):
         """Calculate and update the time range from signal data."""
         if not self._signal_data_list:
             self._start_time = None
             self._end_time = None
+            self._end_time_text = ""
             self._available_dates = []
             self._populate_date_options()
             return
 
-        # Find min and max times from all signals
-        min_time = None
-        max_time = None
+        # States are time-ordered, so each signal's span is its first start and last end
+        spans = [
+            (signal.states[0].start_time, signal.states[-1].end_time)
+            for signal in self._signal_data_list
+            if signal.states
+        ]
 
-        for signal in self._signal_data_list:
-            if signal.states:
-                for state in signal.states:
-                    if min_time is None or state.start_time < min_time:
-                        min_time = state.start_time
-                    if max_time is None or state.end_time > max_time:
-                        max_time = state.end_time
-
-        self._start_time = min_time
-        self._end_time = max_time
+        self._start_time = min(start for start, _ in spans) if spans else None
+        self._end_time = max(end for _, end in spans) if spans else None
+        self._end_time_text = self._format_datetime(self._end_time) if self._end_time else ""
         self._available_dates = self._build_available_dates(self._start_time, self._end_time)
         self._populate_date_options()
 
@@ -707,7 +832,7 @@ class MapViewerView(QWidget):
         # Update time label with actual timestamps
         if self._current_time:
             self.media_controls.lbl_current_time.setText(
-                f"{self._format_datetime(self._current_time)} / {self._format_datetime(self._end_time)}"
+                f"{self._format_datetime(self._current_time)} / {self._end_time_text}"
             )
             self._sync_selected_date()
 
@@ -720,7 +845,11 @@ class MapViewerView(QWidget):
 
     def _format_datetime(self, dt: datetime) -> str:
         """Format datetime as YYYY-MM-DD HH:MM:SS.mmm."""
-        return dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        # Plain integer formatting; this runs on every playback tick
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond // 1000:03d}"
+        )
 
     def _toggle_play(self):
         """Toggle play/pause state."""
@@ -746,8 +875,8 @@ class MapViewerView(QWidget):
         self._is_playing = True
         self.media_controls.btn_play.setText("⏸")
 
-        # Start timer (update every 100ms)
-        self._playback_timer.start(100)
+        # Start timer (interval scaled by playback speed)
+        self._playback_timer.start(self._playback_interval_ms)
 
     def _pause(self):
         """Pause playback."""
@@ -761,19 +890,43 @@ class MapViewerView(QWidget):
             return
 
         # Advance time based on playback speed
-        # 100ms real time = 100ms * speed playback time
-        time_delta = timedelta(milliseconds=100 * self._playback_speed)
-        self._current_time += time_delta
+        # interval real time = interval * speed playback time
+        self._current_time += self._playback_step
 
         # Check if we've reached the end
         if self._current_time >= self._end_time:
             self._current_time = self._end_time
             self._pause()
 
-        # Update map and controls
+        # Defer the map/control refresh to the event loop so that ticks which
+        # pile up behind a slow repaint collapse into a single refresh.
+        if not self._playback_flush_scheduled:
+            self._playback_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_playback)
+
+    def _flush_playback(self):
+        """Render the latest playback position queued by the tick handler."""
+        self._playback_flush_scheduled = False
+        if not self._current_time:
+            return
         self.update_time_position(self._current_time)
         self._update_media_controls()
 
+    def _queue_unit_state(self, unit_id: str, block_color, arrow_color, text_info):
+        """Collect a unit state change and schedule one renderer pass for the batch."""
+        if not self._pending_unit_states:
+            QTimer.singleShot(0, self._flush_unit_states)
+        self._pending_unit_states[unit_id] = (block_color, arrow_color, text_info)
+
+    def _flush_unit_states(self):
+        """Apply the queued unit states to the renderer and repaint once."""
+        pending, self._pending_unit_states = self._pending_unit_states, {}
+        if not pending:
+            return
+        for unit_id, (block_color, arrow_color, text_info) in pending.items():
+            self.renderer.update_rect_color_by_unit(unit_id, block_color, arrow_color, text_info)
+        self.renderer.viewport().update()
+
     def _skip_backward(self):
         """Skip backward 10 seconds."""
         if not self._current_time or not self._start_time:
@@ -802,13 +955,30 @@ class MapViewerView(QWidget):
         """Handle playback speed change."""
         try:
             speed = float(speed_text.replace('×', ''))
-            self._playback_speed = speed
         except ValueError:
-            pass
+            return
+
+        # Tick faster at high speeds so short states are not stepped over,
+        # and slower at low speeds where nothing changes between ticks.
+        self._playback_speed = speed
+        self._playback_interval_ms = max(
+            _MIN_PLAYBACK_INTERVAL_MS,
+            min(_MAX_PLAYBACK_INTERVAL_MS, int(_PLAYBACK_INTERVAL_MS / max(speed, 0.1))),
+        )
+        self._playback_step = timedelta(milliseconds=self._playback_interval_ms * speed)
+        if self._playback_timer.isActive():
+            self._playback_timer.setInterval(self._playback_interval_ms)
 
     def _on_slider_moved(self, position: int):
         """Handle slider position change."""
-        if not self._start_time or not self._end_time:
+        # sliderMoved fires per pixel while dragging; only the latest position is applied.
+        self._pending_slider_pos = position
+        self._slider_timer.start()
+
+    def _apply_slider(self):
+        """Seek to the most recent slider position."""
+        position, self._pending_slider_pos = self._pending_slider_pos, None
+        if position is None or not self._start_time or not self._end_time:
             return
 
         # Convert slider position (0-100) to time
@@ -824,7 +994,7 @@ class MapViewerView(QWidget):
         if not self._start_time or not self._end_time:
             return
 
-        selected_date = self.media_controls.cmb_date.currentData()
+        selected_date = self._selected_date()
         if selected_date is None:
             QMessageBox.warning(
                 self,
@@ -897,15 +1067,19 @@ class MapViewerView(QWidget):
         return days
 
     def _populate_date_options(self):
+        # Reloads that cover the same days keep the existing items
+        dates = tuple(self._available_dates)
+        if dates == self._populated_dates:
+            return
+        self._populated_dates = dates
+        self._date_index = {day: idx for idx, day in enumerate(dates)}
         combo = self.media_controls.cmb_date
-        combo.blockSignals(True)
-        combo.clear()
-        for day in self._available_dates:
-            combo.addItem(day.strftime("%Y-%m-%d"), day)
-        combo.setEnabled(bool(self._available_dates))
-        if self._available_dates:
-            combo.setCurrentIndex(0)
-        combo.blockSignals(False)
+        with QSignalBlocker(combo):
+            combo.clear()
+            combo.addItems([day.strftime("%Y-%m-%d") for day in self._available_dates])
+            combo.setEnabled(bool(self._available_dates))
+            if self._available_dates:
+                combo.setCurrentIndex(0)
         if not self._available_dates:
             combo.setToolTip("No data loaded")
             self.media_controls.txt_time.setEnabled(False)
@@ -913,18 +1087,22 @@ class MapViewerView(QWidget):
             combo.setToolTip("Select the date to preview")
             self.media_controls.txt_time.setEnabled(True)
 
+    def _selected_date(self) -> Optional[date]:
+        """Return the date chosen in the date combo, or None if nothing is selected."""
+        idx = self.media_controls.cmb_date.currentIndex()
+        if 0 <= idx < len(self._available_dates):
+            return self._available_dates[idx]
+        return None
+
     def _sync_selected_date(self):
         if not self._current_time:
             return
-        target_date = self._current_time.date()
+        idx = self._date_index.get(self._current_time.date())
         combo = self.media_controls.cmb_date
-        for idx in range(combo.count()):
-            if combo.itemData(idx) == target_date:
-                combo.blockSignals(True)
-                if combo.currentIndex() != idx:
-                    combo.setCurrentIndex(idx)
-                combo.blockSignals(False)
-                break
+        if idx is None or combo.currentIndex() == idx:
+            return
+        with QSignalBlocker(combo):
+            combo.setCurrentIndex(idx)
 
     def _on_date_changed(self, _index: int):
         # No immediate jump; user can enter a time and press Enter.
@@ -932,6 +1110,14 @@ class MapViewerView(QWidget):
 
     @staticmethod
     def _parse_time_only(time_text: str):
+        # Zero-padded HH:MM and HH:MM:SS are built directly; strptime handles the rest
+        parts = time_text.split(":")
+        if len(parts) in (2, 3) and all(len(part) == 2 and part.isdecimal() for part in parts):
+            try:
+                return time(*map(int, parts))
+            except ValueError:
+                raise ValueError("invalid time format") from None
+
         formats = ("%H:%M:%S.%f", "%H:%M:%S", "%H:%M")
         for fmt in formats:
             try:
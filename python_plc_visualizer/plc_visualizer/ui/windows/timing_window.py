@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Callable, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import (
+    QAbstractSlider,
     QWidget,
     QSplitter,
     QVBoxLayout,
@@ -25,6 +26,26 @@ from ..components.signal_filter_widget import SignalFilterWidget
 from ..theme import create_header_bar, card_panel_styles, surface_stylesheet
 
 
+# Every sender here lives in the GUI thread with the view, so slots are called directly
+_DIRECT = Qt.ConnectionType.DirectConnection
+
+# Fraction of the visible window moved by one pan step
+_PAN_FRACTION = 0.1
+# Zoom factor of the zoom buttons and +/- keys
+_ZOOM_STEP = 1.5
+# Loads with fewer computed states than this skip the mipmap prebuild
+_MIPMAP_PREBUILD_STATES = 50_000
+# Scroll updates closer than this to the last one pushed are dropped
+_SCROLL_EPSILON = 1e-4
+
+_SPLITTER_QSS = """
+    QSplitter::handle:horizontal {
+        background-color: #d7dee4;
+        margin: 0;
+    }
+"""
+
+
 class TimingDiagramView(QWidget):
     """Embeddable view that hosts the waveform view alongside signal filters."""
 
@@ -37,6 +58,15 @@ class TimingDiagramView(QWidget):
         self._signal_data_list: list[SignalData] = []
         self._signal_data_map: dict[str, SignalData] = {}
         self._interval_request_handler: Optional[Callable[[str], None]] = None
+        # Seconds moved per pan step, kept in sync with the visible duration
+        self._pan_step_seconds = viewport_state.visible_duration_seconds * _PAN_FRACTION
+        # Latest viewport values not yet pushed to the zoom/pan/range controls
+        self._pending_range: Optional[tuple[datetime, datetime]] = None
+        self._pending_duration: Optional[float] = None
+        self._controls_flush_scheduled = False
+        # Last values pushed to the range selector and pan scrollbar
+        self._last_selector_range: Optional[tuple[datetime, datetime]] = None
+        self._last_scroll: tuple[float, float] = (-1.0, -1.0)
 
         self._viewport_state = viewport_state
         self._session_manager = session_manager
@@ -94,17 +124,13 @@ class TimingDiagramView(QWidget):
             
             # Up Arrow - Scroll up through signals
             if key == Qt.Key_Up:
-                scrollbar = self.waveform_view.verticalScrollBar()
-                if scrollbar:
-                    scrollbar.setValue(scrollbar.value() - scrollbar.singleStep())
+                self._vscrollbar.triggerAction(QAbstractSlider.SliderAction.SliderSingleStepSub)
                 event.accept()
                 return
             
             # Down Arrow - Scroll down through signals
             if key == Qt.Key_Down:
-                scrollbar = self.waveform_view.verticalScrollBar()
-                if scrollbar:
-                    scrollbar.setValue(scrollbar.value() + scrollbar.singleStep())
+                self._vscrollbar.triggerAction(QAbstractSlider.SliderAction.SliderSingleStepAdd)
                 event.accept()
                 return
             
@@ -128,13 +154,13 @@ class TimingDiagramView(QWidget):
             
             # + or = - Zoom in
             if key in (Qt.Key_Plus, Qt.Key_Equal):
-                self._viewport_state.zoom_in(factor=1.5)
+                self._on_zoom_in()
                 event.accept()
                 return
             
             # - - Zoom out
             if key == Qt.Key_Minus:
-                self._viewport_state.zoom_out(factor=1.5)
+                self._on_zoom_out()
                 event.accept()
                 return
         
@@ -146,6 +172,7 @@ class TimingDiagramView(QWidget):
         self._parsed_log = None
         self._signal_data_list = []
         self._signal_data_map.clear()
+        self._forget_synced_controls()
         self.waveform_view.clear()
         self.signal_filter.clear()
         self._update_controls_enabled(False)
@@ -156,14 +183,25 @@ class TimingDiagramView(QWidget):
         Args:
             parsed_log: Parsed log entries to visualize.
             signal_data: Pre-processed signal data for waveform rendering.
+                A list is kept by reference rather than copied, so callers
+                should not mutate it after handing it over.
         """
         if parsed_log is None:
             self.clear()
             return
 
+        # Re-sending the loaded objects (e.g. view switching) changes nothing
+        if parsed_log is self._parsed_log and signal_data is self._signal_data_list:
+            return
+
         self._parsed_log = parsed_log
-        self._signal_data_list = list(signal_data)
-        self._signal_data_map = {item.key: item for item in signal_data}
+        if not isinstance(signal_data, list):
+            signal_data = list(signal_data)
+        self._signal_data_list = signal_data
+        self._update_signal_data_map(signal_data)
+        if sum(len(item.states) for item in signal_data) > _MIPMAP_PREBUILD_STATES:
+            from plc_visualizer.utils.waveform_mipmap import build_waveform_mipmap
+            build_waveform_mipmap(signal_data)
 
         self.waveform_view.set_data(parsed_log, signal_data)
         self.signal_filter.set_signals(signal_data)
@@ -171,17 +209,40 @@ class TimingDiagramView(QWidget):
 
         if parsed_log.time_range:
             start_time, end_time = parsed_log.time_range
-            self._viewport_state.set_full_time_range(start_time, end_time)
-
             initial_end = start_time + timedelta(seconds=10)
             if initial_end > end_time:
                 initial_end = end_time
 
-            self._viewport_state.set_time_range(start_time, initial_end)
+            # Configure everything first so listeners see one finished load
+            viewport = self._viewport_state
+            was_blocked = viewport.blockSignals(True)
+            try:
+                viewport.set_full_time_range(start_time, end_time)
+                viewport.set_time_range(start_time, initial_end)
+            finally:
+                viewport.blockSignals(was_blocked)
             self.time_range_selector.set_full_time_range(start_time, end_time)
             self.pan_controls.set_time_range(start_time, end_time)
+            self._forget_synced_controls()
+
+            if not was_blocked:
+                viewport.time_range_changed.emit(*viewport.visible_time_range)
+                viewport.duration_changed.emit(viewport.visible_duration_seconds)
 
     # Internal helpers ---------------------------------------------------
+    def _update_signal_data_map(self, signal_data: list[SignalData]):
+        """Sync the key lookup in place, leaving unchanged entries untouched."""
+        data_map = self._signal_data_map
+        current_ids = set()
+        for item in signal_data:
+            current_ids.add(id(item))
+            if data_map.get(item.key) is not item:
+                data_map[item.key] = item
+
+        stale = [key for key, item in data_map.items() if id(item) not in current_ids]
+        for key in stale:
+            del data_map[key]
+
     def _init_ui(self):
         self.setObjectName("TimingViewSurface")
         self.setStyleSheet(surface_stylesheet("TimingViewSurface"))
@@ -213,12 +274,7 @@ class TimingDiagramView(QWidget):
 
         splitter = QSplitter(Qt.Orientation.Horizontal)
         splitter.setHandleWidth(10)
-        splitter.setStyleSheet("""
-            QSplitter::handle:horizontal {
-                background-color: #d7dee4;
-                margin: 0;
-            }
-        """)
+        splitter.setStyleSheet(_SPLITTER_QSS)
         splitter_frame_layout.addWidget(splitter, stretch=1)
         content_layout.addWidget(splitter_frame, stretch=1)
 
@@ -229,8 +285,8 @@ class TimingDiagramView(QWidget):
         filter_layout.setSpacing(0)
 
         self.signal_filter = SignalFilterWidget()
-        self.signal_filter.visible_signals_changed.connect(self._on_visible_signals_changed)
-        self.signal_filter.plot_intervals_requested.connect(self._handle_plot_intervals)
+        self.signal_filter.visible_signals_changed.connect(self._on_visible_signals_changed, _DIRECT)
+        self.signal_filter.plot_intervals_requested.connect(self._handle_plot_intervals, _DIRECT)
         filter_layout.addWidget(self.signal_filter)
 
         splitter.addWidget(filter_container)
@@ -242,26 +298,28 @@ class TimingDiagramView(QWidget):
         waveform_layout.setSpacing(8)
 
         self.zoom_controls = ZoomControls()
-        self.zoom_controls.zoom_in_clicked.connect(lambda: self._viewport_state.zoom_in(factor=1.5))
-        self.zoom_controls.zoom_out_clicked.connect(lambda: self._viewport_state.zoom_out(factor=1.5))
-        self.zoom_controls.reset_zoom_clicked.connect(self._viewport_state.reset_zoom)
-        self.zoom_controls.duration_changed.connect(self._on_duration_slider_changed)
+        self.zoom_controls.zoom_in_clicked.connect(self._on_zoom_in, _DIRECT)
+        self.zoom_controls.zoom_out_clicked.connect(self._on_zoom_out, _DIRECT)
+        self.zoom_controls.reset_zoom_clicked.connect(self._viewport_state.reset_zoom, _DIRECT)
+        self.zoom_controls.duration_changed.connect(self._on_duration_slider_changed, _DIRECT)
         waveform_layout.addWidget(self.zoom_controls)
 
         self.waveform_view = WaveformView()
         self.waveform_view.set_viewport_state(self._viewport_state)
-        self.waveform_view.wheel_zoom.connect(self._on_wheel_zoom)
+        # Cached for the Up/Down shortcuts, which can autorepeat quickly
+        self._vscrollbar = self.waveform_view.verticalScrollBar()
+        self.waveform_view.wheel_zoom.connect(self._on_wheel_zoom, _DIRECT)
         waveform_layout.addWidget(self.waveform_view, stretch=1)
 
         self.pan_controls = PanControls()
-        self.pan_controls.pan_left_clicked.connect(self._on_pan_left)
-        self.pan_controls.pan_right_clicked.connect(self._on_pan_right)
-        self.pan_controls.jump_to_time.connect(self._on_jump_to_time)
-        self.pan_controls.scroll_changed.connect(self._on_scroll_changed)
+        self.pan_controls.pan_left_clicked.connect(self._on_pan_left, _DIRECT)
+        self.pan_controls.pan_right_clicked.connect(self._on_pan_right, _DIRECT)
+        self.pan_controls.jump_to_time.connect(self._on_jump_to_time, _DIRECT)
+        self.pan_controls.scroll_changed.connect(self._on_scroll_changed, _DIRECT)
         waveform_layout.addWidget(self.pan_controls)
 
         self.time_range_selector = TimeRangeSelector()
-        self.time_range_selector.time_range_changed.connect(self._on_time_range_selector_changed)
+        self.time_range_selector.time_range_changed.connect(self._on_time_range_selector_changed, _DIRECT)
         waveform_layout.addWidget(self.time_range_selector)
 
         splitter.addWidget(waveform_container)
@@ -270,8 +328,8 @@ class TimingDiagramView(QWidget):
         splitter.setSizes([320, 900])
 
     def _connect_viewport_signals(self):
-        self._viewport_state.duration_changed.connect(self._on_viewport_duration_changed)
-        self._viewport_state.time_range_changed.connect(self._on_viewport_time_range_changed)
+        self._viewport_state.duration_changed.connect(self._on_viewport_duration_changed, _DIRECT)
+        self._viewport_state.time_range_changed.connect(self._on_viewport_time_range_changed, _DIRECT)
 
     def _update_controls_enabled(self, enabled: bool):
         self.zoom_controls.set_enabled(enabled)
@@ -283,11 +341,15 @@ class TimingDiagramView(QWidget):
         self._viewport_state.set_visible_duration(duration_seconds)
 
     def _on_viewport_duration_changed(self, duration_seconds: float):
-        self.zoom_controls.set_visible_duration(
-            duration_seconds,
-            min_duration=self._viewport_state.min_visible_duration,
-            max_duration=self._viewport_state.max_visible_duration,
-        )
+        self._pan_step_seconds = duration_seconds * _PAN_FRACTION
+        self._pending_duration = duration_seconds
+        self._schedule_controls_flush()
+
+    def _on_zoom_in(self):
+        self._viewport_state.zoom_in(_ZOOM_STEP)
+
+    def _on_zoom_out(self):
+        self._viewport_state.zoom_out(_ZOOM_STEP)
 
     def _on_wheel_zoom(self, delta: int):
         if delta > 0:
@@ -296,63 +358,96 @@ class TimingDiagramView(QWidget):
             self._viewport_state.zoom_out(factor=1.2)
 
     def _on_pan_left(self):
-        if self._viewport_state.visible_duration:
-            delta = -self._viewport_state.visible_duration.total_seconds() * 0.1
-            self._viewport_state.pan(delta)
+        self._viewport_state.pan(-self._pan_step_seconds)
 
     def _on_pan_right(self):
-        if self._viewport_state.visible_duration:
-            delta = self._viewport_state.visible_duration.total_seconds() * 0.1
-            self._viewport_state.pan(delta)
+        self._viewport_state.pan(self._pan_step_seconds)
 
     def _on_jump_to_time(self, target_time):
         self._viewport_state.jump_to_time(target_time)
 
     def _on_scroll_changed(self, position: float):
-        full_range = self._viewport_state.full_time_range
-        visible_range = self._viewport_state.visible_time_range
+        viewport = self._viewport_state
+        full_range = viewport.full_time_range
+        visible_range = viewport.visible_time_range
 
         if not full_range or not visible_range:
             return
 
-        full_start, full_end = full_range
-        visible_start, visible_end = visible_range
-        visible_duration = visible_end - visible_start
-
-        full_duration = full_end - full_start
-        max_start_offset = full_duration - visible_duration
-        if max_start_offset.total_seconds() <= 0:
+        max_start_offset = viewport.full_duration_seconds - viewport.visible_duration_seconds
+        if max_start_offset <= 0:
             return
 
-        new_start = full_start + timedelta(seconds=position * max_start_offset.total_seconds())
-        new_end = new_start + visible_duration
-        self._viewport_state.set_time_range(new_start, new_end)
+        visible_start, visible_end = visible_range
+        new_start = full_range[0] + timedelta(seconds=position * max_start_offset)
+        new_end = new_start + (visible_end - visible_start)
+        viewport.set_time_range(new_start, new_end)
 
     def _on_time_range_selector_changed(self, start, end):
         self._viewport_state.set_time_range(start, end)
 
     def _on_viewport_time_range_changed(self, start, end):
-        self.time_range_selector.set_visible_time_range(start, end)
+        self._pending_range = (start, end)
+        self._schedule_controls_flush()
+
+    def _schedule_controls_flush(self):
+        # Wheel zoom and drags change the viewport many times per frame; the
+        # controls only need the latest values once per event-loop pass.
+        if not self._controls_flush_scheduled:
+            self._controls_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_viewport_controls)
+
+    def _flush_viewport_controls(self):
+        self._controls_flush_scheduled = False
+        pending_duration, self._pending_duration = self._pending_duration, None
+        pending_range, self._pending_range = self._pending_range, None
+
+        if pending_duration is not None:
+            self.zoom_controls.set_visible_duration(
+                pending_duration,
+                min_duration=self._viewport_state.min_visible_duration,
+                max_duration=self._viewport_state.max_visible_duration,
+            )
+        if pending_range is not None:
+            self._sync_range_controls(*pending_range)
 
-        full_range = self._viewport_state.full_time_range
+    def _forget_synced_controls(self):
+        """Force the next flush to push to the selector and scrollbar."""
+        self._last_selector_range = None
+        self._last_scroll = (-1.0, -1.0)
+
+    def _sync_range_controls(self, start, end):
+        if self._last_selector_range != (start, end):
+            self._last_selector_range = (start, end)
+            self.time_range_selector.set_visible_time_range(start, end)
+
+        viewport = self._viewport_state
+        full_range = viewport.full_time_range
         if not full_range:
             return
 
-        full_start, full_end = full_range
-        full_duration = (full_end - full_start).total_seconds()
+        full_start = full_range[0]
+        full_duration = viewport.full_duration_seconds
         visible_duration = (end - start).total_seconds()
         visible_fraction = 1.0
 
         if full_duration > 0:
             visible_fraction = min(1.0, visible_duration / full_duration)
 
+        position = 0.0
         if full_duration > visible_duration and full_duration > 0:
             offset = (start - full_start).total_seconds()
             max_offset = full_duration - visible_duration
             position = offset / max_offset if max_offset > 0 else 0.0
-            self.pan_controls.set_scroll_position(position, visible_fraction)
-        else:
-            self.pan_controls.set_scroll_position(0.0, visible_fraction)
+
+        last_position, last_fraction = self._last_scroll
+        if (
+            abs(position - last_position) < _SCROLL_EPSILON
+            and abs(visible_fraction - last_fraction) < _SCROLL_EPSILON
+        ):
+            return
+        self._last_scroll = (position, visible_fraction)
+        self.pan_controls.set_scroll_position(position, visible_fraction)
 
     # Filter integration -------------------------------------------------
     def _on_visible_signals_changed(self, visible_names: list[str]):
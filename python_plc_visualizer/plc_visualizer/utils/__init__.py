@@ -1,27 +1,54 @@
-"""Utility functions and helpers."""
-
-from .waveform_data import (
-    SignalData,
-    SignalState,
-    group_by_signal,
-    calculate_signal_states,
-    process_signals_for_waveform,
-    compute_signal_states,
-)
-from .merge import merge_parsed_logs, merge_parse_results
-from .chunk_manager import ChunkManager, create_chunked_log
-from .viewport_state import ViewportState
-
-__all__ = [
-    'SignalData',
-    'SignalState',
-    'group_by_signal',
-    'calculate_signal_states',
-    'process_signals_for_waveform',
-    'compute_signal_states',
-    'merge_parsed_logs',
-    'merge_parse_results',
-    'ChunkManager',
-    'create_chunked_log',
-    'ViewportState',
-]
+"""Utility functions and helpers.
+
+Names are re-exported lazily (PEP 562) so that importing one helper does not
+load every submodule; ``chunk_manager`` in particular pulls in the parser
+registry.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .waveform_data import (
+        SignalData,
+        SignalState,
+        group_by_signal,
+        calculate_signal_states,
+        process_signals_for_waveform,
+        compute_signal_states,
+    )
+    from .waveform_mipmap import build_waveform_mipmap
+    from .merge import merge_parsed_logs, merge_parse_results
+    from .chunk_manager import ChunkManager, create_chunked_log
+    from .viewport_state import ViewportState
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'SignalData': '.waveform_data',
+    'SignalState': '.waveform_data',
+    'group_by_signal': '.waveform_data',
+    'calculate_signal_states': '.waveform_data',
+    'process_signals_for_waveform': '.waveform_data',
+    'compute_signal_states': '.waveform_data',
+    'build_waveform_mipmap': '.waveform_mipmap',
+    'merge_parsed_logs': '.merge',
+    'merge_parse_results': '.merge',
+    'ChunkManager': '.chunk_manager',
+    'create_chunked_log': '.chunk_manager',
+    'ViewportState': '.viewport_state',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
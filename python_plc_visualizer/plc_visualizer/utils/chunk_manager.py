@@ -1,12 +1,29 @@
 """Chunk manager for loading time-windowed log data on-demand."""
 
+import math
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
+from operator import attrgetter, le
 from pathlib import Path
 from typing import Optional, Callable
 
-from plc_visualizer.models import TimeChunk, ChunkedParsedLog
+from plc_visualizer.models import LogEntry, TimeChunk, ChunkedParsedLog
 from plc_visualizer.parsers import parser_registry
 
+# Number of recently prefetched windows remembered to skip requests still queued
+_RECENT_PREFETCH_LIMIT = 32
+# Number of recent pan steps used to guess the direction of travel
+_PAN_HISTORY_LENGTH = 4
+# Number of recently served windows kept for repeat requests (repaints)
+_WINDOW_CACHE_SIZE = 4
+# Upper bound on windows prefetched per side when zoomed in
+_MAX_PREFETCH_AHEAD = 4
+
 
 class ChunkManager:
     """Manages loading and caching of time-windowed log chunks.
@@ -42,6 +59,57 @@ class ChunkManager:
         # Prefetch configuration
         self.prefetch_enabled = True
         self.prefetch_chunks_ahead = 1  # Prefetch 1 chunk ahead when panning
+        # Direction (+1/-1) of the last few pans; prefetch favours the way
+        # the user is heading
+        self._pan_history: deque[int] = deque(maxlen=_PAN_HISTORY_LENGTH)
+        self._last_start: Optional[datetime] = None
+        # LRU of (start, end) windows recently prefetched, with their
+        # futures; repaints and jittery pans ask for the same neighbours
+        # over and over while the first request is still queued
+        self._recent_prefetch: OrderedDict[tuple[datetime, datetime], Future] = OrderedDict()
+
+        # Prefetches run on a background worker (created on first use) so
+        # panning does not wait for them. ChunkedParsedLog is not
+        # thread-safe, so every access to it goes through the lock; the
+        # worker parses outside it and only takes it to install chunks.
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.RLock()
+
+        # Entries of the last few fully loaded windows served, keyed on
+        # (start, end), most recently used last. Guarded by _lock.
+        self._window_cache: OrderedDict[tuple[datetime, datetime], tuple[LogEntry, ...]] = OrderedDict()
+
+        # Full-file parse for the fallback path, sorted by time, plus its
+        # timestamps as a bisect key (built on first use). Its own lock, as
+        # both the UI thread and the prefetch worker may trigger the parse.
+        self._full_entries: Optional[list[LogEntry]] = None
+        self._full_timestamps: list[datetime] = []
+        self._full_parse_lock = threading.Lock()
+
+    def _get_full_entries(self) -> Optional[list[LogEntry]]:
+        """Parse the whole file once for parsers without time-window support.
+
+        Returns:
+            Entries sorted by timestamp, or None if the file failed to parse
+        """
+        with self._full_parse_lock:
+            if self._full_entries is None:
+                result = self.parser.parse(str(self.file_path))
+                if not result.success or not result.data:
+                    return None
+
+                # map/attrgetter keep the per-entry work out of the interpreter loop
+                get_timestamp = attrgetter("timestamp")
+                entries = result.data.entries
+                timestamps = list(map(get_timestamp, entries))
+                if not all(map(le, timestamps, islice(timestamps, 1, None))):
+                    entries = sorted(entries, key=get_timestamp)
+                    timestamps = list(map(get_timestamp, entries))
+
+                self._full_entries = entries
+                self._full_timestamps = timestamps
+
+            return self._full_entries
 
     def _load_chunk(self, start_time: datetime, end_time: datetime) -> TimeChunk:
         """Load a time chunk from the log file.
@@ -74,15 +142,15 @@ class ChunkManager:
                     start_time=start_time,
                     end_time=end_time,
                     entries=result.data.entries,
-                    signals=result.data.signals,
-                    devices=result.data.devices
+                    # Interned so chunks share one copy of each name
+                    signals=set(map(sys.intern, result.data.signals)),
+                    devices=set(map(sys.intern, result.data.devices)),
                 )
 
-        # Fallback: Parse entire file and filter
-        # This is inefficient but ensures compatibility
-        result = self.parser.parse(str(self.file_path))
+        # Fallback: Parse entire file once and slice out the window
+        entries = self._get_full_entries()
 
-        if not result.success or not result.data:
+        if entries is None:
             # Return empty chunk on error
             return TimeChunk(
                 start_time=start_time,
@@ -92,17 +160,17 @@ class ChunkManager:
                 devices=set()
             )
 
-        # Filter entries to time window
-        filtered_entries = [
-            entry for entry in result.data.entries
-            if start_time <= entry.timestamp < end_time
-        ]
+        # Entries are sorted, so the window is a contiguous slice
+        timestamps = self._full_timestamps
+        lo = bisect_left(timestamps, start_time)
+        hi = bisect_left(timestamps, end_time, lo)
 
-        # Build chunk
+        # Build chunk (signals/devices are derived from the slice)
         chunk = TimeChunk(
             start_time=start_time,
             end_time=end_time,
-            entries=filtered_entries
+            entries=entries[lo:hi],
+            timestamps=timestamps[lo:hi],
         )
 
         return chunk
@@ -111,7 +179,8 @@ class ChunkManager:
         self,
         start_time: datetime,
         end_time: datetime,
-        with_prefetch: bool = True
+        with_prefetch: bool = True,
+        zoom_level: Optional[float] = None,
     ) -> list:
         """Get entries in a time range, with optional prefetching.
 
@@ -119,59 +188,183 @@ class ChunkManager:
             start_time: Start of time range
             end_time: End of time range
             with_prefetch: If True, prefetch adjacent chunks for smooth panning
+            zoom_level: Current viewport zoom (full / visible duration). When
+                given, deeper zoom prefetches more windows ahead; otherwise
+                prefetch_chunks_ahead is used.
 
         Returns:
             List of LogEntry objects
         """
-        # Get entries from chunked log
-        entries = self.chunked_log.get_entries_in_range(start_time, end_time)
+        # Get entries from chunked log (a copy, so callers cannot alter the cache)
+        entries = list(self._window_entries(start_time, end_time))
 
         # Prefetch adjacent chunks if enabled
         if with_prefetch and self.prefetch_enabled:
-            self._prefetch_adjacent(start_time, end_time)
+            self._prefetch_adjacent(start_time, end_time, zoom_level)
 
         return entries
 
-    def _prefetch_adjacent(self, start_time: datetime, end_time: datetime):
+    def _window_entries(self, start_time: datetime, end_time: datetime) -> tuple[LogEntry, ...]:
+        """Collect a window's entries from the chunked log (memoized per window).
+
+        A window is only memoized when all of its chunks are in memory
+        afterwards, so a chunk that failed to load is retried on the next
+        request instead of leaving a cached gap.
+        """
+        key = (start_time, end_time)
+        with self._lock:
+            cached = self._window_cache.get(key)
+            if cached is not None:
+                self._window_cache.move_to_end(key)
+                return cached
+
+            entries = tuple(self.chunked_log.get_entries_in_range(start_time, end_time))
+            if not self.chunked_log.missing_chunks(start_time, end_time):
+                self._window_cache[key] = entries
+                if len(self._window_cache) > _WINDOW_CACHE_SIZE:
+                    self._window_cache.popitem(last=False)
+            return entries
+
+    def _prefetch_depth(self, window_seconds: float, sides: int, zoom_level: Optional[float]) -> int:
+        """Number of windows to prefetch on each prefetched side.
+
+        Grows with log2 of the zoom level, but is capped so the visible window
+        plus everything prefetched fits in the chunk cache; prefetching more
+        would only evict the chunks on screen.
+        """
+        depth = self.prefetch_chunks_ahead
+        if zoom_level is not None:
+            depth = min(_MAX_PREFETCH_AHEAD, max(1, int(math.log2(max(zoom_level, 1.0)))))
+
+        chunk_seconds = self.chunked_log.chunk_duration.total_seconds()
+        chunks_per_window = max(1, math.ceil(window_seconds / chunk_seconds))
+        spare_windows = self.chunked_log.max_chunks_in_memory // chunks_per_window - 1
+        return max(0, min(depth, spare_windows // sides))
+
+    def _prefetch_adjacent(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        zoom_level: Optional[float] = None,
+    ):
         """Prefetch chunks adjacent to the current time range.
 
         Args:
             start_time: Current start time
             end_time: Current end time
+            zoom_level: Current viewport zoom, see get_entries_in_range
         """
-        # Prefetch chunks ahead (in the direction user is likely to pan)
+        # Prefetch chunks ahead (in the direction user is likely to pan).
+        # Repaints of the same window do not count as a pan.
+        if self._last_start is not None and start_time != self._last_start:
+            self._pan_history.append(1 if start_time > self._last_start else -1)
+        self._last_start = start_time
+        direction = sum(self._pan_history)
+
+        full_range = self.chunked_log.full_time_range
+        if not full_range:
+            return
+        full_start, full_end = full_range
+
         duration = end_time - start_time
         prefetch_count = 0
-
-        for i in range(1, self.prefetch_chunks_ahead + 1):
-            # Prefetch forward
-            prefetch_start = start_time + (duration * i)
-            prefetch_end = end_time + (duration * i)
-
-            # Check if within bounds
-            if self.chunked_log.full_time_range:
-                _, full_end = self.chunked_log.full_time_range
-                if prefetch_start < full_end:
-                    self.chunked_log.prefetch_chunks(prefetch_start, prefetch_end)
+        depth = self._prefetch_depth(duration.total_seconds(), 1 if direction else 2, zoom_level)
+
+        # Step the offset by one window per iteration (exact timedelta
+        # addition) and only build the bounds for the sides being fetched
+        offset = timedelta(0)
+        for _ in range(depth):
+            offset += duration
+
+            # Prefetch forward, if still within bounds
+            if direction >= 0:
+                prefetch_start = start_time + offset
+                if prefetch_start < full_end and self._prefetch_window(prefetch_start, end_time + offset):
                     prefetch_count += 1
 
-            # Prefetch backward
-            prefetch_start = start_time - (duration * i)
-            prefetch_end = end_time - (duration * i)
-
-            # Check if within bounds
-            if self.chunked_log.full_time_range:
-                full_start, _ = self.chunked_log.full_time_range
-                if prefetch_end > full_start:
-                    self.chunked_log.prefetch_chunks(prefetch_start, prefetch_end)
+            # Prefetch backward, if still within bounds
+            if direction <= 0:
+                prefetch_end = end_time - offset
+                if prefetch_end > full_start and self._prefetch_window(start_time - offset, prefetch_end):
                     prefetch_count += 1
 
         if prefetch_count > 0:
-            print(f" Prefetched {prefetch_count} adjacent chunk(s) | Chunks in memory: {self.chunked_log.chunks_in_memory}")
+            print(f" Queued prefetch of {prefetch_count} adjacent window(s) | Chunks in memory: {self.chunked_log.chunks_in_memory}")
+
+    def _prefetch_window(self, start_time: datetime, end_time: datetime) -> bool:
+        """Queue a background prefetch unless one for the window is still pending.
 
-    def clear_cache(self):
-        """Clear all cached chunks."""
-        self.chunked_log.clear_cache()
+        Finished prefetches are queued again: their chunks may have been
+        evicted since, and a prefetch of resident chunks is cheap and marks
+        them as recently used.
+
+        Returns:
+            True if the prefetch was queued, False if it was skipped.
+        """
+        key = (start_time, end_time)
+        pending = self._recent_prefetch.get(key)
+        if pending is not None and not pending.done():
+            self._recent_prefetch.move_to_end(key)
+            return False
+
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-prefetch")
+        self._recent_prefetch[key] = self._prefetch_pool.submit(self._run_prefetch, start_time, end_time)
+        if len(self._recent_prefetch) > _RECENT_PREFETCH_LIMIT:
+            self._recent_prefetch.popitem(last=False)
+        return True
+
+    def _run_prefetch(self, start_time: datetime, end_time: datetime):
+        """Load a window's chunks (runs on the prefetch worker).
+
+        Chunks are parsed without holding the lock, so the UI thread can
+        keep serving windows meanwhile; the lock is only taken to look up
+        and install chunks.
+        """
+        with self._lock:
+            missing = self.chunked_log.missing_chunks(start_time, end_time)
+
+        chunk_duration = self.chunked_log.chunk_duration
+        for chunk_key in missing:
+            try:
+                chunk = self._load_chunk(chunk_key, chunk_key + chunk_duration)
+            except Exception as e:
+                print(f" Error prefetching chunk {chunk_key}: {e}")
+                continue
+            with self._lock:
+                self.chunked_log.add_chunk(chunk_key, chunk)
+
+    def _cancel_pending_prefetch(self):
+        """Cancel queued prefetches and forget the recent windows."""
+        for future in self._recent_prefetch.values():
+            future.cancel()
+        self._recent_prefetch.clear()
+
+    def clear_cache(self, full_reload: bool = False):
+        """Clear all cached chunks.
+
+        Args:
+            full_reload: Also drop the full-file parse kept for parsers without
+                time-window support, so the file is re-read on the next load.
+                Only needed if the file on disk has changed.
+        """
+        self._cancel_pending_prefetch()
+        self._pan_history.clear()
+        self._last_start = None
+        with self._lock:
+            self._window_cache.clear()
+            self.chunked_log.clear_cache()
+            if full_reload:
+                with self._full_parse_lock:
+                    self._full_entries = None
+                    self._full_timestamps = []
+
+    def close(self):
+        """Stop the prefetch worker. The manager must not be used afterwards."""
+        self._cancel_pending_prefetch()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=True)
+            self._prefetch_pool = None
 
     @property
     def chunks_in_memory(self) -> int:
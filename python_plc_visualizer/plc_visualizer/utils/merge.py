@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import replace
-from typing import Iterable
+from itertools import chain
+from operator import attrgetter
+from typing import Iterable, Iterator
 
 from plc_visualizer.models import ParseError, ParseResult, ParsedLog
 
@@ -11,6 +14,9 @@ from plc_visualizer.models import ParseError, ParseResult, ParsedLog
 def merge_parsed_logs(parsed_logs: Iterable[ParsedLog]) -> ParsedLog | None:
     """Merge multiple ParsedLog objects into a single combined log.
 
+    Each log's entries must already be in chronological order, as the
+    parsers return them.
+
     Args:
         parsed_logs: Iterable of ParsedLog instances to merge
 
@@ -21,37 +27,58 @@ def merge_parsed_logs(parsed_logs: Iterable[ParsedLog]) -> ParsedLog | None:
     if not logs:
         return None
 
-    combined_entries: list = []
-    combined_signals: set[str] = set()
-    combined_devices: set[str] = set()
-    start_times = []
-    end_times = []
+    # Files whose time ranges do not overlap (e.g. rotated logs) can then be concatenated in
+    # start order with no sort at all; otherwise the sort only has to merge
+    # the already-sorted runs.
+    ranged = all(log.time_range for log in logs)
+    if ranged:
+        logs.sort(key=lambda log: log.time_range[0])
 
+    # Fill a preallocated list instead of growing one with repeated extends
+    combined_entries: list = [None] * sum(len(log.entries) for log in logs)
+    offset = 0
     for log in logs:
-        combined_entries.extend(log.entries)
-        combined_signals.update(log.signals)
-        combined_devices.update(log.devices)
+        count = len(log.entries)
+        combined_entries[offset:offset + count] = log.entries
+        offset += count
 
-        if log.time_range:
-            start, end = log.time_range
-            start_times.append(start)
-            end_times.append(end)
+    overlapping = not ranged or any(
+        later.time_range[0] < earlier.time_range[1]
+        for earlier, later in zip(logs, logs[1:])
+    )
+    if overlapping:
+        combined_entries.sort(key=attrgetter("timestamp"))
+    sorted_by_timestamp = overlapping or all(log.sorted_by_timestamp for log in logs)
 
-    # Ensure entries are sorted chronologically across files
-    combined_entries.sort(key=lambda entry: entry.timestamp)
+    # Interned so the merged log shares name strings with the chunks and views
+    combined_signals: set[str] = set(map(sys.intern, set().union(*(log.signals for log in logs))))
+    combined_devices: set[str] = set(map(sys.intern, set().union(*(log.devices for log in logs))))
 
     combined_range = None
-    if start_times and end_times:
-        combined_range = (min(start_times), max(end_times))
+    if ranged:
+        # Logs are in start order, so only the end needs a scan
+        combined_range = (logs[0].time_range[0], max(log.time_range[1] for log in logs))
+    elif any(log.time_range for log in logs):
+        combined_range = (
+            min(log.time_range[0] for log in logs if log.time_range),
+            max(log.time_range[1] for log in logs if log.time_range),
+        )
 
     return ParsedLog(
         entries=combined_entries,
         signals=combined_signals,
         devices=combined_devices,
         time_range=combined_range,
+        sorted_by_timestamp=sorted_by_timestamp,
     )
 
 
+def _errors_for_file(file_path: str, errors: Iterable[ParseError]) -> Iterator[ParseError]:
+    """Yield errors with file_path set, copying only those that need it."""
+    for error in errors:
+        yield error if error.file_path == file_path else replace(error, file_path=file_path)
+
+
 def merge_parse_results(results_by_file: dict[str, ParseResult]) -> ParseResult:
     """Merge ParseResult objects keyed by file path.
 
@@ -67,30 +94,23 @@ def merge_parse_results(results_by_file: dict[str, ParseResult]) -> ParseResult:
     Returns:
         ParseResult representing merged data and aggregated errors
     """
-    merged_logs = []
-    aggregated_errors: list[ParseError] = []
-
-    for file_path, result in results_by_file.items():
-        if result.data:
-            merged_logs.append(result.data)
-
-        for error in result.errors:
-            # Preserve existing error details but ensure file_path is set
-            if error.file_path == file_path:
-                aggregated_errors.append(error)
-            else:
-                aggregated_errors.append(
-                    replace(error, file_path=file_path)
-                )
-
-        # Capture total-failure cases (no data but also no explicit errors)
-        if not result.success and not result.errors:
-            aggregated_errors.append(ParseError(
-                line=0,
-                content="",
-                reason="Parsing failed with no additional details",
-                file_path=file_path,
-            ))
+    merged_logs = [result.data for result in results_by_file.values() if result.data]
+    aggregated_errors: list[ParseError] = list(chain.from_iterable(
+        _errors_for_file(file_path, result.errors)
+        for file_path, result in results_by_file.items()
+    ))
+
+    # Capture total-failure cases (no data but also no explicit errors)
+    aggregated_errors.extend(
+        ParseError(
+            line=0,
+            content="",
+            reason="Parsing failed with no additional details",
+            file_path=file_path,
+        )
+        for file_path, result in results_by_file.items()
+        if not result.success and not result.errors
+    )
 
     merged_log = merge_parsed_logs(merged_logs)
 
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 
 class ViewportState(QObject):
@@ -20,24 +20,91 @@ class ViewportState(QObject):
     MAX_VISIBLE_DURATION_SECONDS = 300.0  # 5 minutes maximum visible window
     MIN_VISIBLE_DURATION_SECONDS = 0.001  # 1 millisecond minimum (max zoom in)
 
+    # Pans and zoom steps are reported at most once per frame (~60 Hz)
+    PAN_EMIT_INTERVAL_MS = 16
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # Full log time range
         self._full_start: Optional[datetime] = None
         self._full_end: Optional[datetime] = None
+        self._full_duration_seconds: float = 0.0  # Cached (full_end - full_start) in seconds
+        self._initialized = False  # Set once a full range (and so a visible range) exists
 
-        # Current visible time range
-        self._visible_start: Optional[datetime] = None
-        self._visible_end: Optional[datetime] = None
+        # Current visible time range. The math runs on the float offsets
+        # (seconds from _full_start); the datetimes are derived from them
+        # only when read or emitted, so rapid pans stay float-only.
+        self._visible_range: Optional[Tuple[datetime, datetime]] = None
+        self._visible_start_offset: float = 0.0
+        self._visible_end_offset: float = 0.0
 
         # Visible duration in seconds (replaces zoom_level)
         self._visible_duration_seconds: float = 300.0
 
+        # Zoom steps are counted from an anchor duration rather than applied
+        # to the current one, so rounding does not accumulate over repeated
+        # steps and zooming back out returns to the starting duration to
+        # within float rounding.
+        self._zoom_anchor_seconds: float = 0.0
+        self._zoom_factor: float = 0.0
+        self._zoom_steps: int = 0
+        self._zoom_result_seconds: Optional[float] = None  # Duration left by the last step
+
         # Duration constraints (will be updated when data is loaded)
         self.min_visible_duration = self.MIN_VISIBLE_DURATION_SECONDS  # Minimum window (max zoom in)
         self.max_visible_duration = self.MAX_VISIBLE_DURATION_SECONDS  # Maximum window (max zoom out)
 
+        # Coalesces time_range_changed for rapid pans and zooms (held arrow
+        # keys, wheel zoom, dragging the duration slider)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.PAN_EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._emit_time_range)
+
+    def _emit_time_range(self):
+        """Emit the current visible range, superseding any pending pan emit."""
+        self._emit_timer.stop()
+        self.time_range_changed.emit(*self._current_visible_range())
+
+    def _schedule_time_range_emit(self):
+        """Report the visible range once the current burst of updates settles.
+
+        Listeners redraw on every emit, so repeated steps within one frame
+        share a single emit carrying the latest range.
+        """
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _set_visible_offsets(self, start_offset: float, end_offset: float):
+        """Move the visible range to the given offsets from the full start."""
+        self._visible_start_offset = start_offset
+        self._visible_end_offset = end_offset
+        self._visible_range = None  # Rebuilt from the offsets on next read
+
+    def _current_visible_range(self) -> Tuple[datetime, datetime]:
+        """Return the visible range as datetimes, converting the offsets once."""
+        visible_range = self._visible_range
+        if visible_range is None:
+            full_start = self._full_start
+            visible_range = self._visible_range = (
+                full_start + timedelta(seconds=self._visible_start_offset),
+                full_start + timedelta(seconds=self._visible_end_offset),
+            )
+        return visible_range
+
+    def _clamp_window(self, start_offset: float, duration_seconds: float) -> Tuple[float, float]:
+        """Shift a window of the given length so it lies inside the full range."""
+        full_duration_seconds = self._full_duration_seconds
+        end_offset = start_offset + duration_seconds
+        if start_offset < 0.0:
+            start_offset = 0.0
+            end_offset = duration_seconds
+        if end_offset > full_duration_seconds:
+            end_offset = full_duration_seconds
+            start_offset = end_offset - duration_seconds
+        return max(start_offset, 0.0), min(end_offset, full_duration_seconds)
+
     def _update_duration_constraints(self):
         """Calculate and update duration constraints based on loaded data.
 
@@ -49,12 +116,12 @@ class ViewportState(QObject):
 
         If full duration is less than MAX_VISIBLE_DURATION, allow viewing the full range.
         """
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             self.max_visible_duration = self.MAX_VISIBLE_DURATION_SECONDS
             self.min_visible_duration = self.MIN_VISIBLE_DURATION_SECONDS
             return
 
-        full_duration_seconds = (self._full_end - self._full_start).total_seconds()
+        full_duration_seconds = self._full_duration_seconds
         if full_duration_seconds <= 0:
             self.max_visible_duration = self.MAX_VISIBLE_DURATION_SECONDS
             self.min_visible_duration = self.MIN_VISIBLE_DURATION_SECONDS
@@ -78,34 +145,39 @@ class ViewportState(QObject):
 
         self._full_start = start
         self._full_end = end
+        self._initialized = True
+        self._full_duration_seconds = full_duration_seconds = (end - start).total_seconds()
 
         # Update duration constraints based on data
         self._update_duration_constraints()
 
         # Initialize visible range to max visible duration (most zoomed out view allowed)
-        full_duration_seconds = (self._full_end - self._full_start).total_seconds()
         initial_duration_seconds = min(full_duration_seconds, self.max_visible_duration)
 
         self._visible_duration_seconds = initial_duration_seconds
-        self._visible_start = start
-        self._visible_end = start + timedelta(seconds=initial_duration_seconds)
+        self._set_visible_offsets(0.0, initial_duration_seconds)
 
-        # self.time_range_changed.emit(self._visible_start, self._visible_end)
+        # self.time_range_changed.emit(*self._current_visible_range())
         # self.duration_changed.emit(self._visible_duration_seconds)
 
     @property
     def full_time_range(self) -> Optional[Tuple[datetime, datetime]]:
         """Get the full time range."""
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             return None
         return (self._full_start, self._full_end)
 
     @property
     def visible_time_range(self) -> Optional[Tuple[datetime, datetime]]:
         """Get the current visible time range."""
-        if self._visible_start is None or self._visible_end is None:
+        if not self._initialized:
             return None
-        return (self._visible_start, self._visible_end)
+        return self._current_visible_range()
+
+    @property
+    def full_duration_seconds(self) -> float:
+        """Get the full duration in seconds (0.0 before a range is set)."""
+        return self._full_duration_seconds
 
     @property
     def visible_duration_seconds(self) -> float:
@@ -118,9 +190,9 @@ class ViewportState(QObject):
 
         Calculated as full_duration / visible_duration.
         """
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             return 1.0
-        full_duration_seconds = (self._full_end - self._full_start).total_seconds()
+        full_duration_seconds = self._full_duration_seconds
         if full_duration_seconds <= 0 or self._visible_duration_seconds <= 0:
             return 1.0
         return full_duration_seconds / self._visible_duration_seconds
@@ -128,16 +200,17 @@ class ViewportState(QObject):
     @property
     def full_duration(self) -> Optional[timedelta]:
         """Get the full time duration."""
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             return None
         return self._full_end - self._full_start
 
     @property
     def visible_duration(self) -> Optional[timedelta]:
         """Get the visible time duration."""
-        if self._visible_start is None or self._visible_end is None:
+        if not self._initialized:
             return None
-        return self._visible_end - self._visible_start
+        visible_start, visible_end = self._current_visible_range()
+        return visible_end - visible_start
 
     def zoom_in(self, factor: float = 2.0):
         """Zoom in by decreasing the visible duration.
@@ -145,8 +218,7 @@ class ViewportState(QObject):
         Args:
             factor: Factor to divide duration by (default 2.0 = show half the time)
         """
-        new_duration = max(self._visible_duration_seconds / factor, self.min_visible_duration)
-        self._apply_duration_change(new_duration)
+        self._zoom_by(factor, 1)
 
     def zoom_out(self, factor: float = 2.0):
         """Zoom out by increasing the visible duration.
@@ -154,8 +226,27 @@ class ViewportState(QObject):
         Args:
             factor: Factor to multiply duration by (default 2.0 = show twice the time)
         """
-        new_duration = min(self._visible_duration_seconds * factor, self.max_visible_duration)
+        self._zoom_by(factor, -1)
+
+    def _zoom_by(self, factor: float, steps: int):
+        """Move ``steps`` zoom steps of ``factor`` (positive = zoom in)."""
+        # Any other duration change since the last step starts a new count
+        if factor != self._zoom_factor or self._visible_duration_seconds != self._zoom_result_seconds:
+            self._zoom_anchor_seconds = self._visible_duration_seconds
+            self._zoom_factor = factor
+            self._zoom_steps = 0
+
+        zoom_steps = self._zoom_steps + steps
+        new_duration = self._zoom_anchor_seconds / factor ** zoom_steps
+        if not self.min_visible_duration < new_duration < self.max_visible_duration:
+            # Pinned at a limit: count from there so the way back is not padded
+            new_duration = max(self.min_visible_duration, min(new_duration, self.max_visible_duration))
+            self._zoom_anchor_seconds = new_duration
+            zoom_steps = 0
+        self._zoom_steps = zoom_steps
+
         self._apply_duration_change(new_duration)
+        self._zoom_result_seconds = self._visible_duration_seconds
 
     def set_visible_duration(self, duration_seconds: float):
         """Set the visible duration directly.
@@ -174,9 +265,9 @@ class ViewportState(QObject):
         Args:
             zoom: Desired zoom level (higher = more zoomed in)
         """
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             return
-        full_duration_seconds = (self._full_end - self._full_start).total_seconds()
+        full_duration_seconds = self._full_duration_seconds
         if full_duration_seconds <= 0:
             return
 
@@ -186,18 +277,16 @@ class ViewportState(QObject):
 
     def reset_zoom(self):
         """Reset to show maximum allowed time range (most zoomed out)."""
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             return
 
         # Reset to max visible duration (or full duration if smaller)
-        full_duration_seconds = (self._full_end - self._full_start).total_seconds()
-        reset_duration = min(full_duration_seconds, self.max_visible_duration)
+        reset_duration = min(self._full_duration_seconds, self.max_visible_duration)
 
         self._visible_duration_seconds = reset_duration
-        self._visible_start = self._full_start
-        self._visible_end = self._full_start + timedelta(seconds=reset_duration)
+        self._set_visible_offsets(0.0, reset_duration)
 
-        self.time_range_changed.emit(self._visible_start, self._visible_end)
+        self._emit_time_range()
         self.duration_changed.emit(self._visible_duration_seconds)
 
     def _apply_duration_change(self, new_duration_seconds: float):
@@ -206,43 +295,23 @@ class ViewportState(QObject):
         Args:
             new_duration_seconds: The new visible duration in seconds
         """
-        if self._full_start is None or self._full_end is None:
-            return
-        if self._visible_start is None or self._visible_end is None:
-            return
-
         if abs(new_duration_seconds - self._visible_duration_seconds) < 0.0001:
             return  # No significant change
+        if not self._initialized:
+            return
 
-        # Calculate the center of the current visible range
-        visible_duration = self._visible_end - self._visible_start
-        center = self._visible_start + visible_duration / 2
-
-        # Calculate new start and end, centered on the same point
-        new_duration = timedelta(seconds=new_duration_seconds)
-        new_start = center - new_duration / 2
-        new_end = center + new_duration / 2
-
-        # Constrain to full range
-        if new_start < self._full_start:
-            new_start = self._full_start
-            new_end = new_start + new_duration
-        if new_end > self._full_end:
-            new_end = self._full_end
-            new_start = new_end - new_duration
-
-        # Ensure we don't exceed bounds
-        new_start = max(new_start, self._full_start)
-        new_end = min(new_end, self._full_end)
-
-        # Update actual duration based on constrained range
-        actual_duration = (new_end - new_start).total_seconds()
+        # Keep the center of the current visible range, constrained to the full range
+        center = (self._visible_start_offset + self._visible_end_offset) / 2
+        new_start, new_end = self._clamp_window(center - new_duration_seconds / 2, new_duration_seconds)
+        if new_start == self._visible_start_offset and new_end == self._visible_end_offset:
+            return  # Already pinned at this window by the range bounds
 
-        self._visible_start = new_start
-        self._visible_end = new_end
-        self._visible_duration_seconds = actual_duration
+        self._set_visible_offsets(new_start, new_end)
+        self._visible_duration_seconds = new_end - new_start
 
-        self.time_range_changed.emit(self._visible_start, self._visible_end)
+        # The duration is cheap to consume (pan step, zoom controls) and is
+        # reported right away; the redraw-triggering range is coalesced
+        self._schedule_time_range_emit()
         self.duration_changed.emit(self._visible_duration_seconds)
 
     def pan(self, delta_seconds: float):
@@ -251,34 +320,38 @@ class ViewportState(QObject):
         Args:
             delta_seconds: Time delta in seconds (positive = forward, negative = backward)
         """
-        if self._visible_start is None or self._visible_end is None:
+        if delta_seconds == 0.0:
+            return
+        if not self._initialized:
             return
-        if self._full_start is None or self._full_end is None:
+
+        # Already at the edge we are panning towards (e.g. key repeat at the end)
+        if delta_seconds > 0.0:
+            if self._visible_end_offset >= self._full_duration_seconds:
+                return
+        elif self._visible_start_offset <= 0.0:
             return
 
-        delta = timedelta(seconds=delta_seconds)
-        new_start = self._visible_start + delta
-        new_end = self._visible_end + delta
+        new_start = self._visible_start_offset + delta_seconds
+        new_end = self._visible_end_offset + delta_seconds
+        full_duration_seconds = self._full_duration_seconds
 
         # Constrain to full range
-        if new_start < self._full_start:
-            diff = self._full_start - new_start
-            new_start = self._full_start
-            new_end = new_end + diff
+        if new_start < 0.0:
+            new_end -= new_start
+            new_start = 0.0
 
-        if new_end > self._full_end:
-            diff = new_end - self._full_end
-            new_end = self._full_end
-            new_start = new_start - diff
+        if new_end > full_duration_seconds:
+            new_start -= new_end - full_duration_seconds
+            new_end = full_duration_seconds
 
         # Final bounds check
-        new_start = max(new_start, self._full_start)
-        new_end = min(new_end, self._full_end)
+        new_start = max(new_start, 0.0)
+        new_end = min(new_end, full_duration_seconds)
 
-        if new_start != self._visible_start or new_end != self._visible_end:
-            self._visible_start = new_start
-            self._visible_end = new_end
-            self.time_range_changed.emit(self._visible_start, self._visible_end)
+        if new_start != self._visible_start_offset or new_end != self._visible_end_offset:
+            self._set_visible_offsets(new_start, new_end)
+            self._schedule_time_range_emit()
 
     def set_time_range(self, start: datetime, end: datetime):
         """Set the visible time range directly.
@@ -287,7 +360,7 @@ class ViewportState(QObject):
             start: New visible start time
             end: New visible end time
         """
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             return
 
         if start >= end:
@@ -295,42 +368,32 @@ class ViewportState(QObject):
         elif start == end:
             start -= timedelta(seconds=1)
 
-        start = max(start, self._full_start)
-        end = min(end, self._full_end)
+        full_duration_seconds = self._full_duration_seconds
+        start_offset = max((start - self._full_start).total_seconds(), 0.0)
+        end_offset = min((end - self._full_start).total_seconds(), full_duration_seconds)
 
-        full_duration_seconds = (self._full_end - self._full_start).total_seconds()
         max_allowed = min(self.max_visible_duration, full_duration_seconds)
         min_allowed = min(self.min_visible_duration, full_duration_seconds)
         if max_allowed <= 0:
             return
 
-        requested_seconds = (end - start).total_seconds()
+        requested_seconds = end_offset - start_offset
         if requested_seconds <= 0:
             requested_seconds = min_allowed
 
         requested_seconds = min(requested_seconds, max_allowed)
         requested_seconds = max(requested_seconds, min_allowed)
 
-        new_duration = timedelta(seconds=requested_seconds)
-        new_start = start
-        new_end = new_start + new_duration
+        # Keep the requested start unless the window would run past the end
+        new_start = start_offset
+        new_end = new_start + requested_seconds
+        if new_end > full_duration_seconds:
+            new_start, new_end = self._clamp_window(full_duration_seconds - requested_seconds, requested_seconds)
 
-        if new_end > self._full_end:
-            new_end = self._full_end
-            new_start = new_end - new_duration
+        self._set_visible_offsets(new_start, new_end)
+        self._visible_duration_seconds = new_end - new_start
 
-        if new_start < self._full_start:
-            new_start = self._full_start
-            new_end = new_start + new_duration
-            if new_end > self._full_end:
-                new_end = self._full_end
-                new_start = new_end - new_duration
-
-        self._visible_start = new_start
-        self._visible_end = new_end
-        self._visible_duration_seconds = (new_end - new_start).total_seconds()
-
-        self.time_range_changed.emit(self._visible_start, self._visible_end)
+        self._emit_time_range()
         self.duration_changed.emit(self._visible_duration_seconds)
 
     def jump_to_time(self, target_time: datetime):
@@ -339,33 +402,18 @@ class ViewportState(QObject):
         Args:
             target_time: Time to jump to
         """
-        if self._visible_start is None or self._visible_end is None:
-            return
-        if self._full_start is None or self._full_end is None:
+        if not self._initialized:
             return
 
         # Constrain target to full range
-        target_time = max(target_time, self._full_start)
-        target_time = min(target_time, self._full_end)
-
-        # Calculate new range centered on target
-        visible_duration = self._visible_end - self._visible_start
-        new_start = target_time - visible_duration / 2
-        new_end = target_time + visible_duration / 2
+        full_duration_seconds = self._full_duration_seconds
+        target_offset = (target_time - self._full_start).total_seconds()
+        target_offset = min(max(target_offset, 0.0), full_duration_seconds)
 
-        # Constrain to full range
-        if new_start < self._full_start:
-            new_start = self._full_start
-            new_end = new_start + visible_duration
-        if new_end > self._full_end:
-            new_end = self._full_end
-            new_start = new_end - visible_duration
-
-        # Final bounds check
-        new_start = max(new_start, self._full_start)
-        new_end = min(new_end, self._full_end)
+        # Calculate new range centered on target, constrained to full range
+        visible_seconds = self._visible_end_offset - self._visible_start_offset
+        new_start, new_end = self._clamp_window(target_offset - visible_seconds / 2, visible_seconds)
 
-        if new_start != self._visible_start or new_end != self._visible_end:
-            self._visible_start = new_start
-            self._visible_end = new_end
-            self.time_range_changed.emit(self._visible_start, self._visible_end)
+        if new_start != self._visible_start_offset or new_end != self._visible_end_offset:
+            self._set_visible_offsets(new_start, new_end)
+            self._emit_time_range()
@@ -1,16 +1,24 @@
 """Data processing utilities for waveform visualization."""
 
 from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import compress, count
+from operator import attrgetter, ne
 from typing import Union
 
 from plc_visualizer.models import LogEntry, ParsedLog, SignalType
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalState:
-    """Represents a state/value over a time period."""
+    """Represents a state/value over a time period.
+
+    Instances use ``__slots__`` since a long log produces one per
+    transition; the offsets are also kept column-wise on ``SignalData``.
+    """
     start_time: datetime
     end_time: datetime
     value: Union[bool, str, int]
@@ -23,7 +31,7 @@ class SignalState:
         return (self.end_time - self.start_time).total_seconds()
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalData:
     """Processed signal data for visualization.
 
@@ -39,8 +47,9 @@ class SignalData:
     start_offsets: array = field(default_factory=lambda: array("d"), repr=False)
     end_offsets: array = field(default_factory=lambda: array("d"), repr=False)
     _entries_count: int = 0  # Track count for stats without storing entries
-    transition_count: int = 0  # Cached total transitions (entries - 1)
+    transition_count: int = 0  # Cached number of value changes (see count_transitions)
     pinned: bool = False  # Prevent clearing when another view depends on the data
+    mipmap: list | None = field(default=None, repr=False)  # Zoomed-out summaries, see waveform_mipmap
 
     @property
     def has_transitions(self) -> bool:
@@ -59,32 +68,65 @@ class SignalData:
         """Number of entries for this signal (for stats)."""
         return self._entries_count
 
-    def build_time_index(self, anchor: datetime):
-        """Pre-compute numeric offsets for fast viewport clipping."""
+    def build_time_index(self, anchor: datetime, offsets_anchor: datetime | None = None):
+        """Pre-compute numeric offsets for fast viewport clipping.
+
+        Args:
+            anchor: Time the offsets are measured from
+            offsets_anchor: Anchor the states' own offsets were computed
+                against (as by calculate_signal_states); when it matches
+                ``anchor`` those offsets are copied instead of recomputed
+        """
         self.time_anchor = anchor
+        self.mipmap = None
 
         if not self.states:
             self.start_offsets = array("d")
             self.end_offsets = array("d")
             return
 
-        # States already carry offsets relative to the global start; however, if
-        # the provided anchor differs we recompute.
+        if offsets_anchor is not None and offsets_anchor == anchor:
+            self.start_offsets = array("d", map(attrgetter("start_offset"), self.states))
+            self.end_offsets = array("d", map(attrgetter("end_offset"), self.states))
+            return
+
+        # States are normally contiguous (each starts at the previous one's
+        # end time object), so each boundary is converted only once.
         start_offsets = array("d")
         end_offsets = array("d")
+        add_start = start_offsets.append
+        add_end = end_offsets.append
+        prev_end_time = None
+        prev_end_seconds = 0.0
         for state in self.states:
-            start_seconds = (state.start_time - anchor).total_seconds()
-            end_seconds = (state.end_time - anchor).total_seconds()
+            start_time = state.start_time
+            if start_time is prev_end_time:
+                start_seconds = prev_end_seconds
+            else:
+                start_seconds = (start_time - anchor).total_seconds()
+            prev_end_time = state.end_time
+            prev_end_seconds = end_seconds = (prev_end_time - anchor).total_seconds()
 
             state.start_offset = start_seconds
             state.end_offset = end_seconds
 
-            start_offsets.append(start_seconds)
-            end_offsets.append(end_seconds)
+            add_start(start_seconds)
+            add_end(end_seconds)
 
         self.start_offsets = start_offsets
         self.end_offsets = end_offsets
 
+    def clip(self, t_start: float, t_end: float) -> tuple[int, int]:
+        """Return the index range of states overlapping ``[t_start, t_end)``.
+
+        Both bounds are offsets from ``time_anchor`` and are found by binary
+        search on the time index, so the cost does not grow with the number
+        of states scanned.
+        """
+        lo = bisect_right(self.end_offsets, t_start)
+        hi = bisect_left(self.start_offsets, t_end, lo)
+        return lo, hi
+
     def clear_states(self, *, force: bool = False):
         """Clear computed states to free memory when signal is hidden.
 
@@ -96,30 +138,50 @@ class SignalData:
         self.states.clear()
         self.start_offsets = array("d")
         self.end_offsets = array("d")
+        self.mipmap = None
 
 
 def group_by_signal(parsed_log: ParsedLog) -> dict[tuple[str, str], list[LogEntry]]:
     """Group log entries by (device, signal) pair.
 
+    The grouping is computed once and cached on the ParsedLog, so lazy
+    per-signal loads do not rescan every entry. The result is shared and
+    must not be modified.
+
     Args:
         parsed_log: ParsedLog containing entries to group
 
     Returns:
         Dictionary mapping (device_id, signal_name) to their entries (sorted by time)
     """
-    grouped: dict[tuple[str, str], list[LogEntry]] = {}
+    if parsed_log._grouped_entries is not None:
+        return parsed_log._grouped_entries
 
+    collected: defaultdict[tuple[str, str], list[LogEntry]] = defaultdict(list)
     for entry in parsed_log.entries:
-        key = (entry.device_id, entry.signal_name)
-        if key not in grouped:
-            grouped[key] = []
-        grouped[key].append(entry)
+        collected[(entry.device_id, entry.signal_name)].append(entry)
+
+    # Grouping keeps the log's order, so per-signal sorting is only needed
+    # when the producer did not guarantee chronological entries
+    if not parsed_log.sorted_by_timestamp:
+        by_timestamp = attrgetter("timestamp")
+        for signal_entries in collected.values():
+            signal_entries.sort(key=by_timestamp)
+
+    # Plain dict so lookups of unknown signals cannot insert empty lists
+    grouped = dict(collected)
+    parsed_log._grouped_entries = grouped
+    return grouped
 
-    # Sort entries by timestamp for each signal
-    for key in grouped:
-        grouped[key].sort(key=lambda e: e.timestamp)
 
-    return grouped
+def count_transitions(entries: list[LogEntry]) -> int:
+    """Count the value changes in a signal's time-ordered entries.
+
+    Matches the number of boundaries between the states built by
+    calculate_signal_states, so it can be cached before states exist.
+    """
+    values = list(map(attrgetter("value"), entries))
+    return sum(map(ne, values[1:], values))
 
 
 def calculate_signal_states(
@@ -128,6 +190,9 @@ def calculate_signal_states(
 ) -> list[SignalState]:
     """Calculate signal states with durations.
 
+    Consecutive entries repeating the current value (polled samples) do not
+    start a new state; the state runs until the value actually changes.
+
     Args:
         entries: List of log entries for a signal (must be sorted by time)
         time_range: Overall time range (start, end)
@@ -138,28 +203,37 @@ def calculate_signal_states(
     if not entries:
         return []
 
-    states = []
     overall_start, overall_end = time_range
 
-    for i, entry in enumerate(entries):
-        start_time = entry.timestamp
-
-        # End time is either the next entry's timestamp or the overall end
-        if i < len(entries) - 1:
-            end_time = entries[i + 1].timestamp
-        else:
-            end_time = overall_end
-
-        state = SignalState(
-            start_time=start_time,
-            end_time=end_time,
-            value=entry.value
-        )
-        state.start_offset = (start_time - overall_start).total_seconds()
-        state.end_offset = (end_time - overall_start).total_seconds()
-        states.append(state)
-
-    return states
+    values = list(map(attrgetter("value"), entries))
+    start_times = list(map(attrgetter("timestamp"), entries))
+
+    # Indices of the entries that change the value (the first always does)
+    changes = [0]
+    changes += compress(count(1), map(ne, values[1:], values))
+    if len(changes) < len(values):
+        values = [values[index] for index in changes]
+        start_times = [start_times[index] for index in changes]
+
+    # Built column by column: each state ends where the next begins, so the
+    # end times are the start times shifted by one and every timestamp is
+    # converted to an offset once. SignalState is then constructed by map()
+    # without a per-state Python loop body.
+    end_times = start_times[1:]
+    end_times.append(overall_end)
+
+    end_offsets = [(end_time - overall_start).total_seconds() for end_time in end_times]
+    start_offsets = [(start_times[0] - overall_start).total_seconds()]
+    start_offsets += end_offsets[:-1]
+
+    return list(map(
+        SignalState,
+        start_times,
+        end_times,
+        values,
+        start_offsets,
+        end_offsets,
+    ))
 
 
 def process_signals_for_waveform(
@@ -199,12 +273,12 @@ def process_signals_for_waveform(
             signal_type=signal_type,
             states=states,
             _entries_count=len(entries),  # Store count, not entries
-            transition_count=max(0, len(entries) - 1)
+            transition_count=count_transitions(entries)
         )
 
         if not lazy:
             anchor = range_start or entries[0].timestamp
-            signal_data.build_time_index(anchor)
+            signal_data.build_time_index(anchor, offsets_anchor=range_start)
 
         signal_data_list.append(signal_data)
 
@@ -226,24 +300,18 @@ def compute_signal_states(
         signal_data: SignalData object to populate with states
         parsed_log: Original parsed log containing all entries
     """
-    # Extract entries for this signal from the main entry list
-    entries = [
-        entry for entry in parsed_log.entries
-        if entry.device_id == signal_data.device_id
-        and entry.signal_name == signal_data.name
-    ]
+    # Look up this signal's entries (already sorted) in the cached grouping
+    entries = group_by_signal(parsed_log).get((signal_data.device_id, signal_data.name))
 
     if not entries:
         return
 
-    # Sort by timestamp
-    entries.sort(key=lambda e: e.timestamp)
-
     # Calculate states
     signal_data.states = calculate_signal_states(entries, parsed_log.time_range)
 
     # Build time index
-    anchor = parsed_log.time_range[0] if parsed_log.time_range else entries[0].timestamp
-    signal_data.build_time_index(anchor)
+    range_start = parsed_log.time_range[0] if parsed_log.time_range else None
+    anchor = range_start or entries[0].timestamp
+    signal_data.build_time_index(anchor, offsets_anchor=range_start)
     signal_data._entries_count = len(entries)
-    signal_data.transition_count = max(signal_data.transition_count, len(entries) - 1)
+    signal_data.transition_count = max(signal_data.transition_count, count_transitions(entries))
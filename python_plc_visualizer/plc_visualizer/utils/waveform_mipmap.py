@@ -0,0 +1,179 @@
+"""Multi-resolution summaries of signal states for zoomed-out rendering."""
+
+from array import array
+from dataclasses import dataclass, field
+from math import ceil, floor
+from typing import Iterable, Optional
+
+from .waveform_data import SignalData
+
+# Signals with fewer states than this are always drawn from their raw states
+MIN_MIPMAP_STATES = 256
+# Tolerance (in buckets) when snapping MIXED spans that already sit on the grid
+_EDGE_EPSILON = 1e-6
+
+
+class _Mixed:
+    """Marker value for a bucket that holds more than one signal value."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MIXED"
+
+
+MIXED = _Mixed()
+
+
+@dataclass
+class MipmapLevel:
+    """Signal states reduced to a fixed bucket width.
+
+    Runs of a single value are kept as-is; every bucket containing a
+    transition is folded into a MIXED segment, so a level never holds more
+    segments than it has buckets.
+    """
+    bucket_width: float
+    start_offsets: array = field(default_factory=lambda: array("d"), repr=False)
+    end_offsets: array = field(default_factory=lambda: array("d"), repr=False)
+    values: list = field(default_factory=list, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _reduce_level(
+    starts: array,
+    ends: array,
+    values: list,
+    width: float,
+) -> MipmapLevel:
+    """Reduce a step function to segments no finer than ``width`` seconds.
+
+    The input may itself be a finer level: its MIXED spans sit on a grid
+    that divides ``width``, so reducing level N gives the same result as
+    reducing the raw states, in time proportional to level N's size.
+    """
+    level = MipmapLevel(bucket_width=width)
+    add_start = level.start_offsets.append
+    add_end = level.end_offsets.append
+    add_value = level.values.append
+
+    first_start = starts[0]
+    last_end = ends[-1]
+    const_start = first_start
+    const_value = prev = values[0]
+    mixed_start: Optional[float] = None
+    mixed_end = 0.0
+
+    for start, end, value in zip(starts, ends, values):
+        if value is MIXED:
+            lo_index = floor(start / width + _EDGE_EPSILON)
+            hi_index = max(ceil(end / width - _EDGE_EPSILON), lo_index + 1)
+        elif prev is not MIXED and value != prev:
+            lo_index = floor(start / width)
+            hi_index = lo_index + 1
+        else:
+            prev = const_value = value
+            continue
+        lo = lo_index * width
+        hi = hi_index * width
+
+        if mixed_start is not None and lo <= mixed_end:
+            if hi > mixed_end:
+                mixed_end = hi
+        else:
+            if mixed_start is not None:
+                add_start(mixed_start)
+                add_end(mixed_end)
+                add_value(MIXED)
+            if lo > const_start:
+                add_start(const_start)
+                add_end(lo)
+                add_value(const_value)
+            mixed_start = max(lo, first_start)
+            mixed_end = hi
+
+        const_start = mixed_end
+        prev = const_value = value
+
+    if mixed_start is not None:
+        add_start(mixed_start)
+        add_end(min(mixed_end, last_end))
+        add_value(MIXED)
+    if const_start < last_end:
+        add_start(const_start)
+        add_end(last_end)
+        add_value(const_value)
+
+    return level
+
+
+def build_signal_mipmap(
+    signal: SignalData,
+    levels: int = 8,
+    factor: int = 4,
+) -> Optional[list[MipmapLevel]]:
+    """Build and attach the mipmap for a single signal.
+
+    Level 0 splits the signal's time span into ``factor ** levels`` buckets;
+    each following level is ``factor`` times coarser and is reduced from
+    the level before it rather than from the raw states. Offsets share the
+    signal's ``time_anchor`` so buckets line up with ``start_offsets``.
+
+    Returns:
+        The list of levels (finest first), or None when the signal is too
+        small to benefit from one.
+    """
+    states = signal.states
+    if len(states) < MIN_MIPMAP_STATES or not signal.end_offsets:
+        signal.mipmap = None
+        return None
+
+    span = signal.end_offsets[-1]
+    if span <= 0:
+        signal.mipmap = None
+        return None
+
+    starts = signal.start_offsets
+    ends = signal.end_offsets
+    values = [state.value for state in states]
+
+    width = span / (factor ** levels)
+    mipmap = []
+    for _ in range(levels):
+        level = _reduce_level(starts, ends, values, width)
+        mipmap.append(level)
+        starts, ends, values = level.start_offsets, level.end_offsets, level.values
+        width *= factor
+
+    signal.mipmap = mipmap
+    return mipmap
+
+
+def build_waveform_mipmap(
+    signals: Iterable[SignalData],
+    levels: int = 8,
+    factor: int = 4,
+):
+    """Attach a mipmap to every signal whose states are already computed."""
+    for signal in signals:
+        if signal.states:
+            build_signal_mipmap(signal, levels=levels, factor=factor)
+
+
+def select_mipmap_level(
+    signal: SignalData,
+    seconds_per_pixel: float,
+) -> Optional[MipmapLevel]:
+    """Return the coarsest level whose buckets are no wider than one pixel."""
+    mipmap = signal.mipmap
+    if not mipmap:
+        return None
+
+    selected = None
+    for level in mipmap:
+        if level.bucket_width > seconds_per_pixel:
+            break
+        selected = level
+    return selected
@@ -1,11 +1,14 @@
 """Signal validation module for PLC log analysis."""
 
-from .violation import ValidationViolation
+from .violation import Severity, ValidationViolation
+from .report import ValidationReport
 from .validator import SignalValidator
 from .rule_loader import RuleLoader
 
 __all__ = [
+    "Severity",
     "ValidationViolation",
+    "ValidationReport",
     "SignalValidator",
     "RuleLoader",
 ]
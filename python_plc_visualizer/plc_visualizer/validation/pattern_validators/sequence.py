@@ -8,7 +8,7 @@ from enum import Enum
 from typing import Any, Optional
 
 from plc_visualizer.utils import SignalData
-from plc_visualizer.validation.violation import ValidationViolation
+from plc_visualizer.validation.violation import Severity, ValidationViolation
 from .base import PatternValidator
 
 
@@ -284,7 +284,7 @@ class SequenceValidator(PatternValidator):
                             device_id=device_id,
                             signal_name="SEQUENCE_COMPLETE",
                             timestamp=timestamp,
-                            severity="info",
+                            severity=Severity.INFO,
                             rule_name=sequence_id,
                             message=rule_config.get("on_complete", {}).get("message",
                                                                           f"Sequence completed in {duration:.1f}s"),
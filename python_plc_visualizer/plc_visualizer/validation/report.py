@@ -0,0 +1,66 @@
+"""Aggregated result of a validation run."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .violation import Severity, ValidationViolation
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationReport:
+    """Violations from one validation run plus precomputed summary figures.
+
+    Built once by ``SignalValidator.validate_all`` so consumers can show
+    totals and walk devices in order without re-scanning the violations.
+    """
+
+    violations: dict[str, list[ValidationViolation]]
+    """Violations keyed by device_id, in ``sorted_device_ids`` order."""
+
+    sorted_device_ids: tuple[str, ...]
+    """Devices with at least one violation, sorted."""
+
+    counts: tuple[int, int, int]
+    """Violation counts indexed by ``Severity``."""
+
+    total: int
+    """Total number of violations across all devices."""
+
+    @classmethod
+    def from_violations(
+        cls,
+        violations_by_device: dict[str, list[ValidationViolation]],
+    ) -> ValidationReport:
+        """Build a report, sorting devices and tallying severities in one pass."""
+        sorted_device_ids = tuple(sorted(violations_by_device))
+        violations = {
+            device_id: violations_by_device[device_id]
+            for device_id in sorted_device_ids
+        }
+
+        counts = [0] * len(Severity)
+        total = 0
+        for device_violations in violations.values():
+            total += len(device_violations)
+            for violation in device_violations:
+                counts[violation.severity] += 1
+
+        return cls(
+            violations=violations,
+            sorted_device_ids=sorted_device_ids,
+            counts=tuple(counts),
+            total=total,
+        )
+
+    @property
+    def error_count(self) -> int:
+        return self.counts[Severity.ERROR]
+
+    @property
+    def warning_count(self) -> int:
+        return self.counts[Severity.WARNING]
+
+    @property
+    def info_count(self) -> int:
+        return self.counts[Severity.INFO]
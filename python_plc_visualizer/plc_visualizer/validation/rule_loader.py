@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import fnmatch
+import logging
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from .violation import Severity
+
+logger = logging.getLogger(__name__)
+
 
 class RuleLoader:
     """Loads and parses validation rules from YAML files."""
@@ -40,8 +45,39 @@ class RuleLoader:
         if "validation_rules" not in rules:
             raise ValueError("YAML must contain 'validation_rules' key")
 
+        RuleLoader._resolve_severities(rules)
         return rules
 
+    @staticmethod
+    def _resolve_severities(rules: dict[str, Any]) -> None:
+        """Convert pattern severities to Severity in place.
+
+        Doing this once at load time names the offending rule when a
+        severity is misspelled, and spares each violation the string lookup.
+        Unknown severities are logged and replaced with the pattern's default.
+        """
+        for rule in rules.get("validation_rules") or []:
+            for pattern in rule.get("patterns") or []:
+                where = f"rule '{rule.get('name', 'unknown')}', pattern '{pattern.get('id', 'unknown')}'"
+                if "severity" in pattern:
+                    pattern["severity"] = RuleLoader._resolve_severity(
+                        pattern["severity"], Severity.ERROR, where
+                    )
+                options = pattern.get("options")
+                if options and "partial_match_severity" in options:
+                    options["partial_match_severity"] = RuleLoader._resolve_severity(
+                        options["partial_match_severity"], Severity.WARNING, where
+                    )
+
+    @staticmethod
+    def _resolve_severity(value: Any, default: Severity, where: str) -> Severity:
+        """Return ``value`` as a Severity, or ``default`` if it is unknown."""
+        try:
+            return Severity.coerce(value)
+        except ValueError as exc:
+            logger.warning(f"{where}: {exc}; using '{default}'")
+            return default
+
     @staticmethod
     def get_rules_for_device(
         rules: dict[str, Any],
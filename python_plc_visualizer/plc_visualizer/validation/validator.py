@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any, Optional
 
 from plc_visualizer.models import ParsedLog
 from plc_visualizer.utils import SignalData
 from .rule_loader import RuleLoader
-from .violation import ValidationViolation
+from .violation import Severity, ValidationViolation
+from .report import ValidationReport
 from .pattern_validators import SequenceValidator
 
 
 class SignalValidator:
     """Main validator that orchestrates all validation rules."""
 
-    def __init__(self, rules_path: str | Path):
+    def __init__(self, rules_path: str | os.PathLike[str]):
         """Initialize validator with rules from a YAML file.
 
         Args:
@@ -25,9 +27,9 @@ class SignalValidator:
             FileNotFoundError: If rules file doesn't exist.
             ValueError: If rules file is invalid.
         """
-        self.rules = RuleLoader.load(rules_path)
-        self.settings = RuleLoader.get_settings(self.rules)
         self.rules_path = Path(rules_path)
+        self.rules = RuleLoader.load(self.rules_path)
+        self.settings = RuleLoader.get_settings(self.rules)
 
         # Initialize pattern validators
         self.pattern_validators = {
@@ -81,7 +83,7 @@ class SignalValidator:
         self,
         parsed_log: ParsedLog,
         signal_data_list: list[SignalData]
-    ) -> dict[str, list[ValidationViolation]]:
+    ) -> ValidationReport:
         """Validate all devices in a log.
 
         Args:
@@ -89,7 +91,8 @@ class SignalValidator:
             signal_data_list: List of all signal data.
 
         Returns:
-            Dictionary mapping device_id to list of violations.
+            Report with violations grouped by device_id (in sorted device
+            order) and per-severity totals.
         """
         violations_by_device = {}
 
@@ -107,7 +110,7 @@ class SignalValidator:
             if device_violations:
                 violations_by_device[device_id] = device_violations
 
-        return violations_by_device
+        return ValidationReport.from_violations(violations_by_device)
 
     def _validate_rule(
         self,
@@ -127,7 +130,7 @@ class SignalValidator:
                     device_id=device_id,
                     signal_name=signal_name,
                     timestamp=None,
-                    severity="error",
+                    severity=Severity.ERROR,
                     rule_name=rule.get("name", "unknown"),
                     message=f"Required signal '{signal_name}' not found in log data",
                     context={"rule": rule.get("name")}
@@ -144,7 +147,7 @@ class SignalValidator:
                     device_id=device_id,
                     signal_name="VALIDATOR",
                     timestamp=None,
-                    severity="warning",
+                    severity=Severity.WARNING,
                     rule_name=rule.get("name", "unknown"),
                     message=f"Unknown pattern type: {pattern_type}",
                     context={"pattern_type": pattern_type}
@@ -2,17 +2,56 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
 from typing import Optional, Any
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+class Severity(IntEnum):
+    """Severity levels for validation violations.
+
+    Values are small contiguous ints so counts can be kept in a plain list
+    indexed by severity.
+    """
+
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def coerce(cls, value: Severity | str, default: Severity | None = None) -> Severity:
+        """Convert a rule-file severity string (e.g. ``"error"``) to a Severity.
+
+        Unknown values raise ValueError, unless a ``default`` is given, in
+        which case a warning is logged and the default is returned.
+        """
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls[str(value).upper()]
+        except KeyError:
+            if default is None:
+                raise ValueError(
+                    f"Unknown severity '{value}' (expected 'error', 'warning', or 'info')"
+                ) from None
+            logger.warning(f"Unknown severity '{value}', using '{default}'")
+            return default
+
+
+@dataclass(slots=True)
 class ValidationViolation:
     """Represents a single validation rule violation.
 
     This is a log analysis result - it indicates when and where
-    a signal pattern deviated from expected behavior.
+    a signal pattern deviated from expected behavior. Instances use
+    ``__slots__`` since a validation run can produce many of them.
     """
 
     device_id: str
@@ -24,8 +63,9 @@ class ValidationViolation:
     timestamp: datetime
     """When the violation occurred."""
 
-    severity: str
-    """Severity level: 'error', 'warning', or 'info'."""
+    severity: Severity
+    """Severity level; rule-file strings ('error', 'warning', 'info') are coerced,
+    and unknown ones fall back to ERROR."""
 
     rule_name: str
     """Name/ID of the rule that was violated."""
@@ -42,10 +82,13 @@ class ValidationViolation:
     context: dict[str, Any] = field(default_factory=dict)
     """Additional context information."""
 
+    def __post_init__(self):
+        self.severity = Severity.coerce(self.severity, Severity.ERROR)
+
     def __str__(self) -> str:
         """Human-readable string representation."""
         parts = [
-            f"[{self.severity.upper()}]",
+            f"[{self.severity.name}]",
             f"{self.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}",
             f"{self.device_id}",
             f"{self.signal_name}:",
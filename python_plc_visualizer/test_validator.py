@@ -170,12 +170,12 @@ def run_test(name: str, parsed_log: ParsedLog, signal_data_list: list[SignalData
     print(f"TEST: {name}")
     print(f"{'=' * 80}")
 
-    violations = validator.validate_all(parsed_log, signal_data_list)
+    report = validator.validate_all(parsed_log, signal_data_list)
 
-    if not violations:
+    if not report.total:
         print(" NO VIOLATIONS - Sequence is perfect!")
     else:
-        for device_id, device_violations in violations.items():
+        for device_id, device_violations in report.violations.items():
             print(f"\nDevice: {device_id}")
             print("-" * 80)
             for violation in device_violations:
@@ -0,0 +1,274 @@
+"""Tests for ChunkManager's chunk loading."""
+
+import threading
+from concurrent.futures import wait
+from datetime import datetime, timedelta
+
+import pytest
+
+from plc_visualizer.models import LogEntry, ParsedLog, ParseResult, SignalType, TimeChunk
+from plc_visualizer.utils import chunk_manager
+from plc_visualizer.utils.chunk_manager import create_chunked_log
+
+BASE_TIME = datetime(2024, 1, 1, 8, 0, 0)
+
+
+def _entry(seconds, device="DEV1", signal="SIG"):
+    return LogEntry(device, signal, BASE_TIME + timedelta(seconds=seconds), True, SignalType.BOOLEAN)
+
+
+class FullParseOnlyParser:
+    """Parser stub without parse_time_window, forcing the fallback path."""
+
+    name = "stub"
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.parse_calls = 0
+
+    def parse(self, file_path):
+        self.parse_calls += 1
+        return ParseResult(data=ParsedLog(entries=list(self.entries)))
+
+
+class BlockingWindowParser(FullParseOnlyParser):
+    """Parser stub whose time-window parses wait until ``release`` is set."""
+
+    def __init__(self, entries):
+        super().__init__(entries)
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def parse_time_window(self, file_path, start_time, end_time):
+        self.started.set()
+        self.release.wait(5)
+        entries = [entry for entry in self.entries if start_time <= entry.timestamp < end_time]
+        return ParseResult(data=ParsedLog(entries=entries))
+
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    managers = []
+
+    def factory(entries, parser_class=FullParseOnlyParser):
+        parser = parser_class(entries)
+        monkeypatch.setattr(chunk_manager.parser_registry, "detect_parser", lambda path: parser)
+        time_range = (BASE_TIME, BASE_TIME + timedelta(seconds=100))
+        _, manager = create_chunked_log("dummy.log", time_range, chunk_duration_seconds=10.0)
+        managers.append(manager)
+        return manager, parser
+
+    yield factory
+    for manager in managers:
+        manager.close()
+
+
+def _wait_for_prefetch(manager):
+    wait(list(manager._recent_prefetch.values()))
+
+
+class TestFallbackLoading:
+    def test_chunk_holds_only_its_window(self, make_manager):
+        entries = [_entry(seconds) for seconds in range(0, 100, 3)]
+        manager, _ = make_manager(entries)
+
+        chunk = manager._load_chunk(BASE_TIME + timedelta(seconds=9), BASE_TIME + timedelta(seconds=21))
+
+        assert [entry.timestamp.second for entry in chunk.entries] == [9, 12, 15, 18]
+
+    def test_window_edges_are_half_open(self, make_manager):
+        manager, _ = make_manager([_entry(10), _entry(20)])
+
+        chunk = manager._load_chunk(BASE_TIME + timedelta(seconds=10), BASE_TIME + timedelta(seconds=20))
+
+        assert [entry.timestamp.second for entry in chunk.entries] == [10]
+
+    def test_unsorted_parser_output_is_sorted_once(self, make_manager):
+        manager, _ = make_manager([_entry(30), _entry(5), _entry(12), _entry(8)])
+
+        chunk = manager._load_chunk(BASE_TIME, BASE_TIME + timedelta(seconds=15))
+
+        assert [entry.timestamp.second for entry in chunk.entries] == [5, 8, 12]
+
+    def test_signals_and_devices_come_from_the_slice(self, make_manager):
+        manager, _ = make_manager([_entry(1, "A", "X"), _entry(50, "B", "Y")])
+
+        chunk = manager._load_chunk(BASE_TIME, BASE_TIME + timedelta(seconds=10))
+
+        assert chunk.signals == {"A::X"}
+        assert chunk.devices == {"A"}
+
+    def test_file_is_parsed_once_across_chunks(self, make_manager):
+        manager, parser = make_manager([_entry(seconds) for seconds in range(100)])
+
+        for start in range(0, 100, 10):
+            manager._load_chunk(BASE_TIME + timedelta(seconds=start), BASE_TIME + timedelta(seconds=start + 10))
+
+        assert parser.parse_calls == 1
+
+    def test_clear_cache_keeps_full_parse_unless_reloading(self, make_manager):
+        manager, parser = make_manager([_entry(1)])
+        window = (BASE_TIME, BASE_TIME + timedelta(seconds=10))
+
+        manager._load_chunk(*window)
+        manager.clear_cache()
+        manager._load_chunk(*window)
+        assert parser.parse_calls == 1
+
+        parser.entries = [_entry(1), _entry(2)]
+        manager.clear_cache(full_reload=True)
+        assert len(manager._load_chunk(*window).entries) == 2
+        assert parser.parse_calls == 2
+
+
+class TestRangeQueries:
+    def test_range_spanning_chunks_is_sorted_and_clipped(self, make_manager):
+        manager, _ = make_manager([_entry(seconds) for seconds in range(0, 100, 2)])
+
+        entries = manager.get_entries_in_range(
+            BASE_TIME + timedelta(seconds=5), BASE_TIME + timedelta(seconds=33), with_prefetch=False
+        )
+
+        assert [entry.timestamp.second for entry in entries] == list(range(6, 33, 2))
+
+    def test_chunks_share_signal_key_strings(self):
+        first = TimeChunk(BASE_TIME, BASE_TIME + timedelta(seconds=10), entries=[_entry(1), _entry(2)])
+        second = TimeChunk(BASE_TIME + timedelta(seconds=10), BASE_TIME + timedelta(seconds=20), entries=[_entry(11)])
+
+        (first_key,), (second_key,) = first.signals, second.signals
+        assert first_key == "DEV1::SIG"
+        assert first_key is second_key
+
+    def test_repeated_window_is_served_from_cache(self, make_manager, monkeypatch):
+        manager, _ = make_manager([_entry(seconds) for seconds in range(100)])
+        window = (BASE_TIME + timedelta(seconds=5), BASE_TIME + timedelta(seconds=15))
+        first = manager.get_entries_in_range(*window, with_prefetch=False)
+        first.clear()
+
+        lookups = []
+        monkeypatch.setattr(manager.chunked_log, "get_entries_in_range", lambda *args: lookups.append(args) or [])
+        assert len(manager.get_entries_in_range(*window, with_prefetch=False)) == 10
+        assert lookups == []
+
+        manager.clear_cache()
+        assert manager.get_entries_in_range(*window, with_prefetch=False) == []
+        assert len(lookups) == 1
+
+    def test_failed_chunk_load_is_not_cached(self, make_manager):
+        manager, _ = make_manager([_entry(seconds) for seconds in range(100)])
+        window = (BASE_TIME + timedelta(seconds=5), BASE_TIME + timedelta(seconds=15))
+        failures = []
+
+        def flaky_loader(start, end):
+            if not failures:
+                failures.append(start)
+                raise OSError("read failed")
+            return manager._load_chunk(start, end)
+
+        manager.chunked_log.set_chunk_loader(flaky_loader)
+
+        assert len(manager.get_entries_in_range(*window, with_prefetch=False)) == 5
+        assert len(manager.get_entries_in_range(*window, with_prefetch=False)) == 10
+        assert len(failures) == 1
+
+    def test_chunk_sorts_unordered_entries(self):
+        chunk = TimeChunk(BASE_TIME, BASE_TIME + timedelta(seconds=10), entries=[_entry(7), _entry(2), _entry(4)])
+
+        assert [entry.timestamp.second for entry in chunk.entries] == [2, 4, 7]
+        assert chunk.timestamps == [entry.timestamp for entry in chunk.entries]
+        assert chunk.entries_between(BASE_TIME + timedelta(seconds=3), BASE_TIME + timedelta(seconds=7)) == [chunk.entries[1]]
+
+
+class TestPrefetch:
+    def test_pending_windows_are_queued_once(self, make_manager, monkeypatch):
+        manager, _ = make_manager([_entry(seconds) for seconds in range(100)])
+        prefetched = []
+        release = threading.Event()
+        monkeypatch.setattr(manager, "_run_prefetch", lambda start, end: prefetched.append(start) or release.wait(5))
+        window = (BASE_TIME + timedelta(seconds=40), BASE_TIME + timedelta(seconds=50))
+
+        manager._prefetch_adjacent(*window)
+        manager._prefetch_adjacent(*window)
+        release.set()
+        _wait_for_prefetch(manager)
+        assert len(prefetched) == 2  # one forward, one backward
+
+        # Finished prefetches are queued again (their chunks may be evicted)
+        manager._prefetch_adjacent(*window)
+        _wait_for_prefetch(manager)
+        assert len(prefetched) == 4
+
+    def test_evicted_window_is_prefetched_again(self, make_manager):
+        manager, _ = make_manager([_entry(seconds) for seconds in range(100)])
+        window = (BASE_TIME + timedelta(seconds=40), BASE_TIME + timedelta(seconds=50))
+
+        manager._prefetch_window(*window)
+        _wait_for_prefetch(manager)
+        manager.chunked_log.clear_cache()  # As if evicted by later loads
+
+        assert manager._prefetch_window(*window)
+        _wait_for_prefetch(manager)
+        assert manager.chunks_in_memory == 1
+
+    def test_steady_pans_only_prefetch_ahead(self, make_manager, monkeypatch):
+        manager, _ = make_manager([_entry(1)])
+        prefetched = []
+        monkeypatch.setattr(manager, "_prefetch_window", lambda start, end: prefetched.append(start) or True)
+
+        for start in (30, 35, 40):
+            manager._prefetch_adjacent(BASE_TIME + timedelta(seconds=start), BASE_TIME + timedelta(seconds=start + 10))
+        assert prefetched[-1:] == [BASE_TIME + timedelta(seconds=50)]
+
+        prefetched.clear()
+        for start in (38, 36, 34):
+            manager._prefetch_adjacent(BASE_TIME + timedelta(seconds=start), BASE_TIME + timedelta(seconds=start + 10))
+        # The history turns over one pan at a time: still forward, balanced, then backward
+        assert prefetched == [
+            BASE_TIME + timedelta(seconds=48),
+            BASE_TIME + timedelta(seconds=46), BASE_TIME + timedelta(seconds=26),
+            BASE_TIME + timedelta(seconds=24),
+        ]
+
+    def test_prefetch_depth_follows_zoom_and_cache_size(self, make_manager):
+        manager, _ = make_manager([_entry(1)])  # 10s chunks, five kept in memory
+
+        assert manager._prefetch_depth(10.0, 2, None) == 1
+        assert manager._prefetch_depth(10.0, 2, 1.0) == 1
+        assert manager._prefetch_depth(10.0, 1, 16.0) == 4
+        # Both sides share the four spare chunk slots
+        assert manager._prefetch_depth(10.0, 2, 16.0) == 2
+        # A window spanning the whole cache leaves nothing to prefetch into
+        assert manager._prefetch_depth(50.0, 1, 16.0) == 0
+
+    def test_recent_windows_are_bounded(self, make_manager, monkeypatch):
+        manager, _ = make_manager([_entry(1)])
+        monkeypatch.setattr(manager, "_run_prefetch", lambda start, end: None)
+
+        for offset in range(100):
+            manager._prefetch_window(BASE_TIME + timedelta(seconds=offset), BASE_TIME + timedelta(seconds=offset + 1))
+
+        assert len(manager._recent_prefetch) == chunk_manager._RECENT_PREFETCH_LIMIT
+
+    def test_prefetch_loads_chunks_in_the_background(self, make_manager):
+        manager, _ = make_manager([_entry(seconds) for seconds in range(100)])
+        window = (BASE_TIME + timedelta(seconds=40), BASE_TIME + timedelta(seconds=50))
+
+        manager.get_entries_in_range(*window)
+        _wait_for_prefetch(manager)
+
+        assert manager._prefetch_pool is not None
+        assert manager.chunks_in_memory == 3  # visible chunk plus both neighbours
+
+    def test_prefetch_parses_without_holding_the_lock(self, make_manager):
+        manager, parser = make_manager([_entry(seconds) for seconds in range(100)], BlockingWindowParser)
+        window = (BASE_TIME + timedelta(seconds=50), BASE_TIME + timedelta(seconds=60))
+
+        manager._prefetch_window(*window)
+        assert parser.started.wait(5)
+        # The UI thread can still get at the chunked log during the parse
+        assert manager._lock.acquire(timeout=1)
+        manager._lock.release()
+
+        parser.release.set()
+        _wait_for_prefetch(manager)
+        assert manager.chunks_in_memory == 1
@@ -0,0 +1,136 @@
+"""Tests for running signal validation from the log table view."""
+
+import pytest
+from datetime import datetime, timedelta
+
+from plc_visualizer.app.session_manager import SessionManager
+from plc_visualizer.models import LogEntry, ParsedLog, SignalType
+from plc_visualizer.utils import SignalData, SignalState
+from plc_visualizer.ui.windows import log_table_window
+from plc_visualizer.ui.windows.log_table_window import LogTableView
+
+
+RULES_YAML = """
+validation_settings:
+  enabled: true
+validation_rules:
+  - device_pattern: "OTHER*"
+    name: "Unmatched Rule"
+    required_signals:
+      - "SIGNAL_A"
+"""
+
+
+@pytest.fixture
+def session_manager():
+    """Create a session manager for testing."""
+    return SessionManager()
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    """Write a minimal rules file to disk."""
+    path = tmp_path / "rules.yaml"
+    path.write_text(RULES_YAML, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def silent_message_boxes(monkeypatch):
+    """Replace modal message boxes with recorders so tests never block."""
+    calls = []
+
+    def record(kind):
+        def _record(_parent, title, text, *args, **kwargs):
+            calls.append((kind, title, text))
+        return _record
+
+    box = log_table_window.QMessageBox
+    for kind in ("information", "warning", "critical"):
+        monkeypatch.setattr(box, kind, record(kind))
+    return calls
+
+
+@pytest.fixture
+def sample_log_data():
+    """Create a small parsed log with matching signal data."""
+    base_time = datetime(2024, 1, 1, 10, 0, 0)
+    device_id = "TEST_DEVICE"
+
+    entries = [
+        LogEntry(device_id, "SIGNAL_A", base_time, True, SignalType.BOOLEAN),
+        LogEntry(device_id, "SIGNAL_A", base_time + timedelta(seconds=2), False, SignalType.BOOLEAN),
+    ]
+    parsed_log = ParsedLog(
+        entries=entries,
+        signals={f"{device_id}::SIGNAL_A"},
+        devices={device_id},
+        time_range=(base_time, base_time + timedelta(seconds=2))
+    )
+
+    states = [
+        SignalState(
+            start_time=base_time,
+            end_time=base_time + timedelta(seconds=2),
+            value=True,
+            start_offset=0.0,
+            end_offset=2.0
+        ),
+        SignalState(
+            start_time=base_time + timedelta(seconds=2),
+            end_time=base_time + timedelta(seconds=2),
+            value=False,
+            start_offset=2.0,
+            end_offset=2.0
+        ),
+    ]
+    signal_data = SignalData(
+        name="SIGNAL_A",
+        device_id=device_id,
+        key=f"{device_id}::SIGNAL_A",
+        signal_type=SignalType.BOOLEAN,
+        states=states,
+        _entries_count=len(entries)
+    )
+    return parsed_log, [signal_data]
+
+
+class TestLogTableValidation:
+    """Validation runs should not block the GUI thread."""
+
+    def test_toolbar_built_on_first_show(self, qtbot, session_manager):
+        view = LogTableView(session_manager)
+        qtbot.addWidget(view)
+        assert not hasattr(view, "run_validation_btn")
+
+        view.show()
+        qtbot.waitExposed(view)
+
+        assert view.load_rules_btn.isVisible()
+        assert not view.run_validation_btn.isEnabled()
+
+    def test_run_validation_without_rules(self, qtbot, session_manager, silent_message_boxes):
+        view = LogTableView(session_manager)
+        qtbot.addWidget(view)
+
+        assert view.run_validation() is False
+        assert silent_message_boxes[-1][1] == "No Rules Loaded"
+
+    def test_run_validation_reports_in_background(
+        self, qtbot, session_manager, rules_file, sample_log_data, silent_message_boxes
+    ):
+        view = LogTableView(session_manager)
+        qtbot.addWidget(view)
+        view.set_data(*sample_log_data)
+        assert view.load_validation_rules(rules_file)
+
+        with qtbot.waitSignal(view.validation_finished, timeout=5000) as blocker:
+            assert view.run_validation() is True
+            assert not view.run_validation_btn.isEnabled()
+
+        report = blocker.args[0]
+        assert report.total == 0
+        assert report.sorted_device_ids == ()
+        assert not view.is_validating
+        assert view.run_validation_btn.isEnabled()
+        assert silent_message_boxes[-1][1] == "Validation Complete"
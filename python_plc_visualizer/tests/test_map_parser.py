@@ -0,0 +1,54 @@
+"""Tests for the map viewer XML parser."""
+
+import pytest
+
+from tools.map_viewer import MapParser
+from tools.map_viewer.config import ATTRIBUTES_TO_EXTRACT, CHILD_ELEMENTS_TO_EXTRACT
+
+
+MAP_XML = """<?xml version="1.0" ?>
+<ConveyorMap version="1.0">
+  <Object name="Outer" type="Panel">
+    <Text>outer</Text>
+    <Object name="Inner" type="Belt">
+      <Text>inner</Text>
+      <UnitId>U1</UnitId>
+    </Object>
+    <UnitId>U0</UnitId>
+  </Object>
+  <Object type="Unnamed">
+    <Text>skipped</Text>
+  </Object>
+  <Object name="Last" type="Label">
+    <Text>last</Text>
+  </Object>
+</ConveyorMap>
+"""
+
+
+@pytest.fixture
+def map_file(tmp_path):
+    path = tmp_path / "map.xml"
+    path.write_text(MAP_XML, encoding="utf-8")
+    return str(path)
+
+
+def test_objects_in_document_order(qtbot, map_file):
+    parser = MapParser()
+    with qtbot.waitSignal(parser.objectsParsed) as blocker:
+        objects = parser.parse_file(map_file)
+
+    assert list(objects) == ["Outer", "Inner", "Last"]
+    assert blocker.args == [objects]
+
+
+def test_children_are_read_from_own_object(map_file):
+    if "Text" not in CHILD_ELEMENTS_TO_EXTRACT or "type" not in ATTRIBUTES_TO_EXTRACT:
+        pytest.skip("map config does not extract Text/type")
+
+    objects = MapParser().parse_file(map_file)
+
+    assert objects["Outer"]["Text"] == "outer"
+    assert objects["Outer"]["type"] == "Panel"
+    assert objects["Inner"]["Text"] == "inner"
+    assert objects["Last"]["Text"] == "last"
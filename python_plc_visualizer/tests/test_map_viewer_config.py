@@ -6,7 +6,7 @@ import yaml
 from pathlib import Path
 from PySide6.QtGui import QColor
 
-from tools.map_viewer.config_loader import load_xml_parsing_config
+from tools.map_viewer.config_loader import load_mapping_and_policy, load_xml_parsing_config
 from tools.map_viewer import config as map_config
 
 
@@ -152,6 +152,29 @@ class TestLoadXMLParsingConfig:
             Path(temp_path).unlink()
 
 
+class TestLoadMappingAndPolicy:
+    """Test device mapping and color policy loading."""
+
+    def test_mapping_resolves_devices(self, tmp_path):
+        yaml_path = tmp_path / "mapping.yaml"
+        yaml_path.write_text(yaml.dump({
+            "device_to_unit": [
+                {"pattern": "B1ACNV13301-*", "unit_id": "B1ACNV13301-104"},
+                {"pattern": "*@*", "unit_id": "*"},
+            ],
+            "rules": [{"signal": "Status", "value": "Running", "color": "#00C853"}],
+        }))
+
+        device_map, policy = load_mapping_and_policy(str(yaml_path))
+
+        assert device_map.map("B1ACNV13301-120") == "B1ACNV13301-104"
+        assert device_map.map("B1ACNV13302-104@D19") == "B1ACNV13302-104"
+        assert device_map.map("unmapped") is None
+        # Repeated lookups are served from the resolved cache
+        assert device_map.map("B1ACNV13301-120") == "B1ACNV13301-104"
+        assert len(policy.rules) == 1
+
+
 class TestConfigModuleIntegration:
     """Test integration with the config module."""
     
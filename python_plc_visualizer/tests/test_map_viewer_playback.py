@@ -0,0 +1,337 @@
+"""Tests for map viewer playback lookups against PLC signal data."""
+
+from dataclasses import replace
+from datetime import datetime, time, timedelta
+from pathlib import Path
+
+import pytest
+
+from plc_visualizer.app.session_manager import SessionManager
+from plc_visualizer.models import SignalType
+from plc_visualizer.utils import SignalData, SignalState
+from plc_visualizer.ui.windows.map_viewer_window import MapViewerView
+from tools.map_viewer.state_model import SignalEvent
+
+
+MAP_DIR = Path(__file__).parent.parent / "tools" / "map_viewer"
+BASE_TIME = datetime(2024, 1, 1, 10, 0, 0)
+
+
+def make_signal(device_id: str, name: str, changes: list[tuple[float, object]], end: float) -> SignalData:
+    """Build SignalData whose states change at the given second offsets."""
+    states = []
+    for i, (offset, value) in enumerate(changes):
+        end_offset = changes[i + 1][0] if i + 1 < len(changes) else end
+        states.append(SignalState(
+            start_time=BASE_TIME + timedelta(seconds=offset),
+            end_time=BASE_TIME + timedelta(seconds=end_offset),
+            value=value,
+            start_offset=offset,
+            end_offset=end_offset,
+        ))
+    return SignalData(
+        name=name,
+        device_id=device_id,
+        key=f"{device_id}::{name}",
+        signal_type=SignalType.BOOLEAN,
+        states=states,
+        _entries_count=len(states),
+    )
+
+
+class _RecordingDict(dict):
+    """dict that records which keys are looked up with get()."""
+
+    def __init__(self, data, lookups):
+        super().__init__(data)
+        self._lookups = lookups
+
+    def get(self, key, default=None):
+        self._lookups.append(key)
+        return super().get(key, default)
+
+
+@pytest.fixture
+def signal_data_list():
+    return [
+        make_signal("B1ACNV13301-104", "CARRIER_DETECTED", [(1.0, True), (5.0, False)], 10.0),
+        make_signal("B1ACNV13302-104", "CARRIER_DETECTED", [(0.0, False), (3.0, True)], 10.0),
+    ]
+
+
+@pytest.fixture
+def map_view(qtbot, signal_data_list):
+    view = MapViewerView(
+        SessionManager(),
+        signal_data_list,
+        str(MAP_DIR / "test_map.xml"),
+        str(MAP_DIR / "mappings_and_rules.yaml"),
+    )
+    qtbot.addWidget(view)
+    return view
+
+
+class TestSignalLookup:
+    """Value lookups should match the state active at the requested time."""
+
+    @pytest.mark.parametrize(
+        "offset, expected",
+        [(0.5, None), (1.0, True), (4.9, True), (5.0, False), (9.0, False)],
+    )
+    def test_value_at_time(self, map_view, offset, expected):
+        key = "B1ACNV13301-104::CARRIER_DETECTED"
+        target = BASE_TIME + timedelta(seconds=offset)
+        assert map_view._get_signal_value_at_time(key, target) == expected
+
+    def test_state_indices_for_all_signals(self, map_view):
+        assert map_view._state_indices_at(BASE_TIME + timedelta(seconds=0.5)) == [-1, 0]
+        assert map_view._state_indices_at(BASE_TIME + timedelta(seconds=5)) == [1, 1]
+
+    def test_microsecond_boundaries(self, map_view):
+        signal = make_signal("DEV", "SIG", [(0.0, 1), (1.000001, 2)], 2.0)
+        map_view.set_signal_data([signal])
+        assert map_view._get_signal_value_at_time("DEV::SIG", BASE_TIME + timedelta(seconds=1)) == 1
+        assert map_view._get_signal_value_at_time("DEV::SIG", BASE_TIME + timedelta(seconds=1.000001)) == 2
+
+    def test_lookups_survive_cleared_states(self, map_view, signal_data_list):
+        signal_data_list[0].clear_states()
+        key = "B1ACNV13301-104::CARRIER_DETECTED"
+        assert map_view._get_signal_value_at_time(key, BASE_TIME + timedelta(seconds=2)) is True
+
+    def test_unknown_signal(self, map_view):
+        assert map_view._get_signal_value_at_time("NOPE::NOPE", BASE_TIME) is None
+
+    def test_time_range_covers_all_signals(self, map_view):
+        assert map_view._start_time == BASE_TIME
+        assert map_view._end_time == BASE_TIME + timedelta(seconds=10)
+        assert map_view.get_current_time() == BASE_TIME
+
+
+class TestSignalIndexing:
+    def test_unchanged_signals_keep_their_columns(self, map_view, signal_data_list):
+        kept_key = "B1ACNV13301-104::CARRIER_DETECTED"
+        kept_starts = map_view._signal_starts[kept_key]
+        replaced_key = "B1ACNV13302-104::CARRIER_DETECTED"
+        added = make_signal("B1ACNV13303-104", "CARRIER_DETECTED", [(2.0, True)], 10.0)
+        replacement = make_signal("B1ACNV13302-104", "CARRIER_DETECTED", [(0.0, True)], 10.0)
+
+        map_view.set_signal_data([signal_data_list[0], replacement, added])
+
+        assert map_view._signal_starts[kept_key] is kept_starts
+        assert map_view._signal_values[replaced_key] == [True]
+        assert map_view._get_signal_value_at_time("B1ACNV13303-104::CARRIER_DETECTED", BASE_TIME + timedelta(seconds=3))
+        assert [key for key, _, _ in map_view._signal_ids] == [
+            kept_key, replaced_key, "B1ACNV13303-104::CARRIER_DETECTED",
+        ]
+
+    def test_replaced_states_rebuild_their_columns(self, map_view, signal_data_list):
+        key = "B1ACNV13301-104::CARRIER_DETECTED"
+        signal = signal_data_list[0]
+        signal.states = make_signal(signal.device_id, signal.name, [(2.0, "X"), (6.0, "Y")], 10.0).states
+
+        map_view.set_signal_data(signal_data_list)
+
+        assert map_view._signal_values[key] == ["X", "Y"]
+        assert map_view._get_signal_value_at_time(key, BASE_TIME + timedelta(seconds=1.5)) is None
+
+    def test_refilled_states_rebuild_their_columns(self, map_view, signal_data_list):
+        key = "B1ACNV13301-104::CARRIER_DETECTED"
+        signal = signal_data_list[0]
+        refilled = [replace(state, value="X") for state in signal.states]
+        signal.clear_states()
+        signal.states.extend(refilled)
+
+        map_view.set_signal_data(signal_data_list)
+
+        assert map_view._signal_values[key] == ["X"] * len(refilled)
+
+    def test_removed_signals_are_dropped(self, map_view, signal_data_list):
+        map_view.set_signal_data(signal_data_list[:1])
+        assert list(map_view._signal_starts) == ["B1ACNV13301-104::CARRIER_DETECTED"]
+
+
+class TestPlaybackEmission:
+    """Only changed signal values should be forwarded to the state model."""
+
+    @pytest.fixture
+    def events(self, map_view, monkeypatch):
+        received = []
+        monkeypatch.setattr(
+            map_view.state_model, "on_signals",
+            lambda events: received.extend(SignalEvent._make(event) for event in events),
+        )
+        return received
+
+    def test_unchanged_values_are_not_resent(self, map_view, events):
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=1.5))
+        first = len(events)
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=1.6))
+        assert len(events) == first
+
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=3.5))
+        assert [(e.device_id, e.value) for e in events[first:]] == [("B1ACNV13302-104", True)]
+
+    def test_only_signals_that_moved_state_are_checked(self, map_view, events, monkeypatch):
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=1.5))
+        assert map_view._last_indices == [0, 0]
+        events.clear()
+
+        checked = []
+        monkeypatch.setattr(map_view, "_last_emitted", _RecordingDict(map_view._last_emitted, checked))
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=1.6))
+        assert checked == []
+
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=3.5))
+        assert checked == ["B1ACNV13302-104::CARRIER_DETECTED"]
+
+    def test_seeking_backwards_resends(self, map_view, events):
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=6))
+        events.clear()
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=4))
+        assert {e.device_id for e in events} == {"B1ACNV13301-104", "B1ACNV13302-104"}
+
+
+class TestBatchedStateUpdates:
+    def test_batch_emits_once_per_changed_unit(self, map_view):
+        model = map_view.state_model
+        changes = []
+        model.stateChanged.connect(lambda unit_id, *state: changes.append(unit_id))
+
+        model.on_signals([
+            SignalEvent("B1ACNV13301-104", "Status", "Idle", 0.0),
+            SignalEvent("B1ACNV13301-104", "Status", "Error", 0.0),
+            SignalEvent("B1ACNV13301-104", "Status", "Running", 0.0),
+        ])
+        assert len(changes) == 1
+
+        changes.clear()
+        model.on_signals([SignalEvent("B1ACNV13301-104", "Status", "Running", 0.0)])
+        assert changes == []
+
+    def test_batch_accepts_plain_tuples(self, map_view):
+        model = map_view.state_model
+        model.on_signals([("B1ACNV13301-104", "Status", "Running", 0.0)])
+        assert model.block_color_of("B1ACNV13301-104").name() == "#00c853"
+
+    def test_batch_tracks_carriers_from_plain_tuples(self, map_view):
+        model = map_view.state_model
+        model.enable_carrier_tracking = True
+        model.on_signals([("CARRIER1", "CurrentLocation", "B1ACNV13301-104", 0.0)])
+        assert model.get_carrier_location("CARRIER1") == "B1ACNV13301-104"
+
+
+class TestPlaybackTicks:
+    def test_ticks_coalesce_into_one_refresh(self, qtbot, map_view, monkeypatch):
+        refreshed = []
+        monkeypatch.setattr(map_view, "update_time_position", refreshed.append)
+        map_view._is_playing = True
+
+        map_view._on_playback_tick()
+        map_view._on_playback_tick()
+        assert refreshed == []
+
+        qtbot.waitUntil(lambda: len(refreshed) == 1)
+        assert refreshed[0] == map_view.get_current_time()
+
+    @pytest.mark.parametrize(
+        "speed, interval_ms, step_ms",
+        [("0.25×", 250, 62.5), ("1.0×", 100, 100), ("2.0×", 50, 100), ("16.0×", 16, 256)],
+    )
+    def test_tick_interval_scales_with_speed(self, map_view, speed, interval_ms, step_ms):
+        map_view._on_speed_changed(speed)
+        map_view._is_playing = True
+        assert map_view._playback_interval_ms == interval_ms
+
+        map_view._on_playback_tick()
+        assert map_view.get_current_time() == BASE_TIME + timedelta(milliseconds=step_ms)
+
+    def test_slider_drag_applies_latest_position(self, qtbot, map_view, monkeypatch):
+        refreshed = []
+        monkeypatch.setattr(map_view, "update_time_position", refreshed.append)
+
+        for position in (10, 30, 50):
+            map_view._on_slider_moved(position)
+        assert refreshed == []
+
+        qtbot.waitUntil(lambda: len(refreshed) == 1)
+        assert refreshed[0] == BASE_TIME + timedelta(seconds=5)
+
+
+class TestDateOptions:
+    @pytest.fixture
+    def signal_data_list(self):
+        return [make_signal("B1ACNV13301-104", "CARRIER_DETECTED", [(0.0, False), (86400.0, True)], 2 * 86400.0)]
+
+    def test_one_entry_per_day(self, map_view):
+        combo = map_view.media_controls.cmb_date
+        labels = [combo.itemText(i) for i in range(combo.count())]
+        assert labels == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        assert map_view._selected_date() == BASE_TIME.date()
+
+    def test_same_dates_keep_existing_items(self, map_view, signal_data_list, monkeypatch):
+        combo = map_view.media_controls.cmb_date
+        cleared = []
+        monkeypatch.setattr(combo, "clear", lambda: cleared.append(True))
+
+        map_view.set_signal_data(list(signal_data_list))
+        assert cleared == []
+        assert combo.count() == 3
+
+    def test_current_time_selects_its_date(self, map_view):
+        map_view.update_time_position(BASE_TIME + timedelta(days=1, hours=1))
+        assert map_view.media_controls.cmb_date.currentIndex() == 1
+        assert map_view._selected_date() == (BASE_TIME + timedelta(days=1)).date()
+
+
+class TestTimeLabels:
+    @pytest.mark.parametrize(
+        "dt",
+        [datetime(2024, 1, 1, 10, 0, 0), datetime(2024, 12, 31, 23, 59, 59, 999999), datetime(2024, 3, 5, 7, 8, 9, 1500)],
+    )
+    def test_format_matches_strftime(self, map_view, dt):
+        assert map_view._format_datetime(dt) == dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+    def test_label_shows_current_and_end(self, map_view):
+        map_view.update_time_position(BASE_TIME + timedelta(seconds=2))
+        map_view._update_media_controls()
+        assert map_view.media_controls.lbl_current_time.text() == (
+            "2024-01-01 10:00:02.000 / 2024-01-01 10:00:10.000"
+        )
+
+
+class TestRendererUpdates:
+    def test_unit_states_reach_renderer_in_one_pass(self, qtbot, map_view, monkeypatch):
+        applied = []
+        monkeypatch.setattr(
+            map_view.renderer, "update_rect_color_by_unit",
+            lambda unit_id, *state: applied.append(unit_id),
+        )
+
+        map_view.state_model.on_signals([
+            SignalEvent("B1ACNV13301-104", "Status", "Idle", 0.0),
+            SignalEvent("B1ACNV13302-104", "Status", "Running", 0.0),
+        ])
+        map_view.state_model.on_signal(SignalEvent("B1ACNV13301-104", "Status", "Error", 0.0))
+        assert applied == []
+
+        qtbot.waitUntil(lambda: len(applied) == 2)
+        assert sorted(applied) == ["B1ACNV13301-104", "B1ACNV13302-104"]
+
+
+class TestTimeInput:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("10:05", time(10, 5)),
+            ("10:05:30", time(10, 5, 30)),
+            ("10:05:30.250", time(10, 5, 30, 250000)),
+            ("9:05", time(9, 5)),
+        ],
+    )
+    def test_parse_time_only(self, text, expected):
+        assert MapViewerView._parse_time_only(text) == expected
+
+    @pytest.mark.parametrize("text", ["25:00", "10:61:00", "ab:cd", "", "10"])
+    def test_parse_time_only_rejects(self, text):
+        with pytest.raises(ValueError):
+            MapViewerView._parse_time_only(text)
@@ -117,6 +117,12 @@ class TestMCSLogParser(unittest.TestCase):
         self.assertEqual(self.parser._parse_value_for_type("False", SignalType.BOOLEAN), False)
         self.assertEqual(self.parser._parse_value_for_type("50", SignalType.INTEGER), 50)
         self.assertEqual(self.parser._parse_value_for_type("hello", SignalType.STRING), "hello")
+
+    def test_string_values_are_shared(self):
+        """Repeated string values resolve to one shared object."""
+        first = self.parser._parse_value_for_type("".join(["Que", "ued"]), SignalType.STRING)
+        second = self.parser._parse_value_for_type("".join(["Queu", "ed"]), SignalType.STRING)
+        self.assertIs(first, second)
     
     def test_empty_values_skipped(self):
         """Test that empty values and 'None' values are skipped."""
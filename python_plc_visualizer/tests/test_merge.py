@@ -0,0 +1,79 @@
+"""Tests for merging parsed logs from multiple files."""
+
+from datetime import datetime, timedelta
+
+from plc_visualizer.models import LogEntry, ParseError, ParsedLog, ParseResult, SignalType
+from plc_visualizer.utils import merge_parse_results, merge_parsed_logs
+
+BASE_TIME = datetime(2024, 1, 1, 8, 0, 0)
+
+
+def _log(seconds, device="DEV1", signal="SIG"):
+    return ParsedLog(entries=[
+        LogEntry(device, signal, BASE_TIME + timedelta(seconds=offset), True, SignalType.BOOLEAN)
+        for offset in seconds
+    ])
+
+
+def _offsets(parsed_log):
+    return [(entry.timestamp - BASE_TIME).total_seconds() for entry in parsed_log.entries]
+
+
+class TestMergeParsedLogs:
+    def test_nothing_to_merge(self):
+        assert merge_parsed_logs([]) is None
+        assert merge_parsed_logs([None]) is None
+
+    def test_consecutive_logs_are_concatenated_in_time_order(self):
+        merged = merge_parsed_logs([_log([20, 30]), _log([0, 10])])
+
+        assert _offsets(merged) == [0, 10, 20, 30]
+        assert merged.time_range == (BASE_TIME, BASE_TIME + timedelta(seconds=30))
+
+    def test_overlapping_logs_are_interleaved(self):
+        merged = merge_parsed_logs([_log([0, 20, 40]), _log([10, 30])])
+
+        assert _offsets(merged) == [0, 10, 20, 30, 40]
+
+    def test_sorted_flag_survives_merge(self):
+        first, second = _log([0, 10]), _log([20])
+
+        assert not merge_parsed_logs([first, second]).sorted_by_timestamp
+
+        first.sorted_by_timestamp = second.sorted_by_timestamp = True
+        assert merge_parsed_logs([first, second]).sorted_by_timestamp
+        # Overlapping logs are sorted during the merge regardless
+        assert merge_parsed_logs([_log([0, 20]), _log([10])]).sorted_by_timestamp
+
+    def test_signals_and_devices_are_combined(self):
+        merged = merge_parsed_logs([_log([0], "A", "X"), _log([5], "B", "Y"), _log([], "C", "Z")])
+
+        assert merged.signals == {"A::X", "B::Y"}
+        assert merged.devices == {"A", "B"}
+        assert _offsets(merged) == [0, 5]
+        assert merged.time_range == (BASE_TIME, BASE_TIME + timedelta(seconds=5))
+
+
+class TestMergeParseResults:
+    def test_errors_are_tagged_with_their_file(self):
+        own = ParseError(line=1, content="x", reason="bad", file_path="a.log")
+        untagged = ParseError(line=2, content="y", reason="bad")
+
+        merged = merge_parse_results({
+            "a.log": ParseResult(data=_log([0]), errors=[own]),
+            "b.log": ParseResult(data=_log([5]), errors=[untagged]),
+        })
+
+        assert merged.errors[0] is own
+        assert merged.errors[1].file_path == "b.log"
+        assert untagged.file_path is None
+        assert _offsets(merged.data) == [0, 5]
+
+    def test_silent_failures_get_a_placeholder_error(self):
+        merged = merge_parse_results({
+            "a.log": ParseResult(data=None),
+            "b.log": ParseResult(data=_log([0])),
+        })
+
+        assert [(error.file_path, error.line) for error in merged.errors] == [("a.log", 0)]
+        assert merged.data.entry_count == 1
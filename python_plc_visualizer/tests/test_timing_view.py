@@ -0,0 +1,288 @@
+"""Tests for the timing diagram view's viewport wiring."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from PySide6.QtCore import Qt
+
+from plc_visualizer.app.session_manager import SessionManager
+from plc_visualizer.models import LogEntry, ParsedLog, SignalType
+from plc_visualizer.utils import SignalData, SignalState, waveform_mipmap
+from plc_visualizer.ui.windows import timing_window
+from plc_visualizer.ui.windows.timing_window import TimingDiagramView
+
+
+BASE_TIME = datetime(2024, 1, 1, 10, 0, 0)
+FULL_SECONDS = 100
+
+
+@pytest.fixture
+def sample_log_data():
+    """Create a 100 second parsed log with one boolean signal."""
+    device_id = "TEST_DEVICE"
+    end_time = BASE_TIME + timedelta(seconds=FULL_SECONDS)
+    entries = [
+        LogEntry(device_id, "SIGNAL_A", BASE_TIME, True, SignalType.BOOLEAN),
+        LogEntry(device_id, "SIGNAL_A", end_time, False, SignalType.BOOLEAN),
+    ]
+    parsed_log = ParsedLog(
+        entries=entries,
+        signals={f"{device_id}::SIGNAL_A"},
+        devices={device_id},
+        time_range=(BASE_TIME, end_time),
+    )
+    signal_data = [
+        SignalData(
+            name="SIGNAL_A",
+            device_id=device_id,
+            key=f"{device_id}::SIGNAL_A",
+            signal_type=SignalType.BOOLEAN,
+            states=[
+                SignalState(
+                    start_time=BASE_TIME,
+                    end_time=end_time,
+                    value=True,
+                    start_offset=0.0,
+                    end_offset=float(FULL_SECONDS),
+                )
+            ],
+            _entries_count=2,
+        )
+    ]
+    return parsed_log, signal_data
+
+
+@pytest.fixture
+def session_manager():
+    return SessionManager()
+
+
+@pytest.fixture
+def timing_view(qtbot, session_manager, sample_log_data):
+    view = TimingDiagramView(session_manager.viewport_state, session_manager)
+    qtbot.addWidget(view)
+    view.set_data(*sample_log_data)
+    return view
+
+
+class TestScrollPosition:
+    def test_scroll_tracks_visible_range(self, qtbot, timing_view):
+        viewport = timing_view.viewport_state
+        viewport.set_time_range(BASE_TIME + timedelta(seconds=45), BASE_TIME + timedelta(seconds=55))
+
+        scroll_bar = timing_view.pan_controls.scroll_bar
+        qtbot.waitUntil(lambda: scroll_bar.value() == 500)
+        assert scroll_bar.pageStep() == 100
+
+    def test_follows_full_range_changed_elsewhere(self, qtbot, timing_view):
+        viewport = timing_view.viewport_state
+        # Another view sharing the viewport loads a longer log
+        viewport.set_full_time_range(BASE_TIME, BASE_TIME + timedelta(seconds=2 * FULL_SECONDS))
+        viewport.set_time_range(BASE_TIME + timedelta(seconds=95), BASE_TIME + timedelta(seconds=105))
+
+        qtbot.waitUntil(lambda: timing_view.pan_controls.scroll_bar.value() == 500)
+
+    def test_rapid_changes_push_controls_once(self, qtbot, timing_view, monkeypatch):
+        synced = []
+        monkeypatch.setattr(timing_view, "_sync_range_controls", lambda start, end: synced.append(start))
+        viewport = timing_view.viewport_state
+
+        for offset in (10, 20, 30):
+            viewport.set_time_range(BASE_TIME + timedelta(seconds=offset), BASE_TIME + timedelta(seconds=offset + 10))
+        assert synced == []
+
+        qtbot.waitUntil(lambda: len(synced) == 1)
+        assert synced == [BASE_TIME + timedelta(seconds=30)]
+
+    def test_unchanged_range_skips_widget_updates(self, timing_view, monkeypatch):
+        scrolls, selections = [], []
+        monkeypatch.setattr(timing_view.pan_controls, "set_scroll_position", lambda *args: scrolls.append(args))
+        monkeypatch.setattr(
+            timing_view.time_range_selector, "set_visible_time_range", lambda *args: selections.append(args)
+        )
+        start, end = BASE_TIME + timedelta(seconds=30), BASE_TIME + timedelta(seconds=40)
+
+        timing_view._sync_range_controls(start, end)
+        timing_view._sync_range_controls(start, end)
+        assert len(scrolls) == 1
+        assert len(selections) == 1
+
+        timing_view._forget_synced_controls()
+        timing_view._sync_range_controls(start, end)
+        assert len(scrolls) == 2
+        assert len(selections) == 2
+
+    def test_scroll_uses_the_synced_range_duration(self, timing_view, monkeypatch):
+        scrolls = []
+        monkeypatch.setattr(timing_view.pan_controls, "set_scroll_position", lambda *args: scrolls.append(args))
+        viewport = timing_view.viewport_state
+        viewport.set_time_range(BASE_TIME + timedelta(seconds=45), BASE_TIME + timedelta(seconds=55))
+
+        # A queued range from before the viewport moved must not be mixed with its current duration
+        timing_view._sync_range_controls(BASE_TIME + timedelta(seconds=20), BASE_TIME + timedelta(seconds=40))
+        assert scrolls[-1] == (pytest.approx(0.25), pytest.approx(0.2))
+
+
+class TestPanning:
+    def test_arrow_keys_pan_by_tenth_of_window(self, qtbot, timing_view):
+        viewport = timing_view.viewport_state
+        viewport.set_time_range(BASE_TIME + timedelta(seconds=40), BASE_TIME + timedelta(seconds=60))
+
+        qtbot.keyClick(timing_view, Qt.Key_Right)
+        assert viewport.visible_time_range[0] == BASE_TIME + timedelta(seconds=42)
+
+        qtbot.keyClick(timing_view, Qt.Key_Left)
+        qtbot.keyClick(timing_view, Qt.Key_Left)
+        assert viewport.visible_time_range[0] == BASE_TIME + timedelta(seconds=38)
+
+    def test_up_down_keys_scroll_signals(self, qtbot, timing_view):
+        scrollbar = timing_view.waveform_view.verticalScrollBar()
+        scrollbar.setRange(0, 500)
+        scrollbar.setSingleStep(20)
+        scrollbar.setValue(100)
+
+        qtbot.keyClick(timing_view, Qt.Key_Down)
+        assert scrollbar.value() == 120
+
+        qtbot.keyClick(timing_view, Qt.Key_Up)
+        qtbot.keyClick(timing_view, Qt.Key_Up)
+        assert scrollbar.value() == 80
+
+    def test_pan_step_follows_zoom(self, timing_view):
+        viewport = timing_view.viewport_state
+        viewport.set_time_range(BASE_TIME + timedelta(seconds=40), BASE_TIME + timedelta(seconds=60))
+        viewport.zoom_in(factor=2.0)
+
+        start = viewport.visible_time_range[0]
+        timing_view._on_pan_right()
+        assert viewport.visible_time_range[0] - start == timedelta(seconds=1)
+
+    def test_scrollbar_moves_viewport(self, timing_view):
+        viewport = timing_view.viewport_state
+        viewport.set_time_range(BASE_TIME, BASE_TIME + timedelta(seconds=10))
+
+        timing_view.pan_controls.scroll_bar.setValue(500)
+        assert viewport.visible_time_range == (
+            BASE_TIME + timedelta(seconds=45),
+            BASE_TIME + timedelta(seconds=55),
+        )
+
+
+class TestZooming:
+    def test_zoom_buttons_scale_window(self, timing_view):
+        viewport = timing_view.viewport_state
+        viewport.set_time_range(BASE_TIME + timedelta(seconds=40), BASE_TIME + timedelta(seconds=70))
+
+        timing_view.zoom_controls.zoom_in_btn.click()
+        assert viewport.visible_duration_seconds == pytest.approx(20.0)
+
+        timing_view.zoom_controls.zoom_out_btn.click()
+        assert viewport.visible_duration_seconds == pytest.approx(30.0)
+
+
+def _dense_signal(count):
+    """Boolean signal toggling every 10ms from BASE_TIME."""
+    states = [
+        SignalState(
+            start_time=BASE_TIME + timedelta(seconds=index * 0.01),
+            end_time=BASE_TIME + timedelta(seconds=(index + 1) * 0.01),
+            value=index % 2 == 0,
+        )
+        for index in range(count)
+    ]
+    signal = SignalData(
+        name="DENSE",
+        device_id="TEST_DEVICE",
+        key="TEST_DEVICE::DENSE",
+        signal_type=SignalType.BOOLEAN,
+        states=states,
+    )
+    signal.build_time_index(BASE_TIME)
+    return signal
+
+
+class TestMipmapPrebuild:
+    @pytest.fixture
+    def prebuilt(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(waveform_mipmap, "build_waveform_mipmap", calls.append)
+        return calls
+
+    def test_small_loads_skip_prebuild(self, timing_view, sample_log_data, prebuilt):
+        timing_view.set_data(sample_log_data[0], [_dense_signal(1000)])
+
+        assert prebuilt == []
+
+    def test_large_loads_prebuild(self, timing_view, sample_log_data, prebuilt, monkeypatch):
+        monkeypatch.setattr(timing_window, "_MIPMAP_PREBUILD_STATES", 500)
+        signals = [_dense_signal(1000)]
+
+        timing_view.set_data(sample_log_data[0], signals)
+
+        assert prebuilt == [signals]
+
+
+class TestSignalDataMap:
+    def test_reload_keeps_map_and_drops_stale_keys(self, timing_view, sample_log_data):
+        parsed_log, signals = sample_log_data
+        data_map = timing_view._signal_data_map
+        dense = _dense_signal(10)
+
+        timing_view.set_data(parsed_log, [signals[0], dense])
+        assert timing_view._signal_data_map is data_map
+        assert data_map == {signals[0].key: signals[0], dense.key: dense}
+
+        timing_view.set_data(parsed_log, [dense])
+        assert data_map == {dense.key: dense}
+
+    def test_replacement_object_wins_for_same_key(self, timing_view, sample_log_data):
+        parsed_log, _ = sample_log_data
+        first, second = _dense_signal(10), _dense_signal(10)
+
+        timing_view.set_data(parsed_log, [first])
+        timing_view.set_data(parsed_log, [second])
+
+        assert timing_view._signal_data_map[second.key] is second
+
+    def test_signal_list_is_not_copied(self, timing_view, sample_log_data):
+        parsed_log, _ = sample_log_data
+        signals = [_dense_signal(10)]
+
+        timing_view.set_data(parsed_log, signals)
+
+        assert timing_view._signal_data_list is signals
+
+    def test_same_objects_skip_reload(self, timing_view, sample_log_data, monkeypatch):
+        parsed_log, _ = sample_log_data
+        signals = [_dense_signal(10)]
+        timing_view.set_data(parsed_log, signals)
+        viewport = timing_view.viewport_state
+        viewport.set_time_range(BASE_TIME + timedelta(seconds=30), BASE_TIME + timedelta(seconds=40))
+        reloads = []
+        monkeypatch.setattr(timing_view.waveform_view, "set_data", lambda *args: reloads.append(args))
+
+        timing_view.set_data(parsed_log, signals)
+        assert reloads == []
+        assert viewport.visible_time_range[0] == BASE_TIME + timedelta(seconds=30)
+
+        timing_view.set_data(parsed_log, list(signals))
+        assert len(reloads) == 1
+
+
+class TestLoadSignals:
+    def test_load_emits_once_after_controls_are_set(self, qtbot, session_manager, sample_log_data):
+        view = TimingDiagramView(session_manager.viewport_state, session_manager)
+        qtbot.addWidget(view)
+        viewport = session_manager.viewport_state
+        seen = []
+        viewport.time_range_changed.connect(
+            lambda start, end: seen.append((start, end, view.time_range_selector._full_end))
+        )
+        durations = []
+        viewport.duration_changed.connect(durations.append)
+
+        view.set_data(*sample_log_data)
+
+        end_time = BASE_TIME + timedelta(seconds=FULL_SECONDS)
+        assert seen == [(BASE_TIME, BASE_TIME + timedelta(seconds=10), end_time)]
+        assert durations == [pytest.approx(10.0)]
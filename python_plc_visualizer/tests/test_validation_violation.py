@@ -0,0 +1,109 @@
+"""Tests for the validation violation model."""
+
+from datetime import datetime
+
+import pytest
+
+from plc_visualizer.validation import RuleLoader, Severity, ValidationReport, ValidationViolation
+
+
+def make_violation(severity, device_id: str = "DEV-1") -> ValidationViolation:
+    return ValidationViolation(
+        device_id=device_id,
+        signal_name="SIGNAL_A",
+        timestamp=datetime(2024, 1, 1, 10, 0, 0, 250000),
+        severity=severity,
+        rule_name="rule",
+        message="Something went wrong",
+    )
+
+
+class TestSeverity:
+    """Severity strings from rule files map onto the integer enum."""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ("error", Severity.ERROR),
+            ("WARNING", Severity.WARNING),
+            ("info", Severity.INFO),
+            (Severity.INFO, Severity.INFO),
+        ],
+    )
+    def test_coerce(self, raw, expected):
+        assert Severity.coerce(raw) is expected
+
+    def test_coerce_rejects_unknown(self):
+        with pytest.raises(ValueError):
+            Severity.coerce("fatal")
+
+    def test_coerce_falls_back_to_default(self, caplog):
+        assert Severity.coerce("fatal", Severity.WARNING) is Severity.WARNING
+        assert "fatal" in caplog.text
+
+    def test_str_is_lowercase_name(self):
+        assert str(Severity.WARNING) == "warning"
+
+
+class TestValidationViolation:
+    def test_string_severity_is_coerced(self):
+        violation = make_violation("warning")
+        assert violation.severity is Severity.WARNING
+
+    def test_unknown_severity_falls_back_to_error(self):
+        violation = make_violation("critical")
+        assert violation.severity is Severity.ERROR
+
+    def test_str_format(self):
+        violation = make_violation(Severity.ERROR)
+        assert str(violation) == (
+            "[ERROR] 2024-01-01 10:00:00.250 DEV-1 SIGNAL_A: Something went wrong"
+        )
+
+
+class TestRuleLoader:
+    RULES = """\
+validation_rules:
+  - name: "Conveyor"
+    patterns:
+      - id: "HANDSHAKE"
+        pattern_type: "sequence"
+        severity: "{severity}"
+        options:
+          partial_match_severity: "{partial}"
+"""
+
+    def load(self, tmp_path, severity, partial):
+        path = tmp_path / "rules.yaml"
+        path.write_text(self.RULES.format(severity=severity, partial=partial), encoding="utf-8")
+        pattern = RuleLoader.load(path)["validation_rules"][0]["patterns"][0]
+        return pattern["severity"], pattern["options"]["partial_match_severity"]
+
+    def test_severities_are_resolved_on_load(self, tmp_path):
+        assert self.load(tmp_path, "warning", "info") == (Severity.WARNING, Severity.INFO)
+
+    def test_unknown_severities_are_reported_with_the_rule(self, tmp_path, caplog):
+        assert self.load(tmp_path, "critical", "meh") == (Severity.ERROR, Severity.WARNING)
+        assert "rule 'Conveyor', pattern 'HANDSHAKE'" in caplog.text
+        assert "critical" in caplog.text
+
+
+class TestValidationReport:
+    def test_from_violations_sorts_and_counts(self):
+        report = ValidationReport.from_violations({
+            "DEV-B": [make_violation("error", "DEV-B"), make_violation("info", "DEV-B")],
+            "DEV-A": [make_violation("error", "DEV-A")],
+        })
+
+        assert report.sorted_device_ids == ("DEV-A", "DEV-B")
+        assert list(report.violations) == ["DEV-A", "DEV-B"]
+        assert report.counts == (2, 0, 1)
+        assert report.total == 3
+        assert report.error_count == 2
+        assert report.warning_count == 0
+        assert report.info_count == 1
+
+    def test_empty_report(self):
+        report = ValidationReport.from_violations({})
+        assert report.total == 0
+        assert report.counts == (0, 0, 0)
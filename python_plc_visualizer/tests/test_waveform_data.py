@@ -0,0 +1,137 @@
+"""Tests for signal state calculation and time indexing."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from plc_visualizer.models import LogEntry, ParsedLog, SignalType
+from plc_visualizer.utils import waveform_data
+from plc_visualizer.utils import (
+    SignalData,
+    SignalState,
+    calculate_signal_states,
+    compute_signal_states,
+    group_by_signal,
+    process_signals_for_waveform,
+)
+
+BASE_TIME = datetime(2024, 1, 1, 8, 0, 0)
+
+
+def _at(seconds):
+    return BASE_TIME + timedelta(seconds=seconds)
+
+
+def _entries(*changes):
+    return [LogEntry("DEV", "SIG", _at(offset), value, SignalType.STRING) for offset, value in changes]
+
+
+class TestTimeIndex:
+    def test_states_chain_end_to_start(self):
+        states = calculate_signal_states(_entries((1, "A"), (4, "B"), (6, "C")), (BASE_TIME, _at(10)))
+
+        assert [(s.start_offset, s.end_offset, s.value) for s in states] == [
+            (1.0, 4.0, "A"), (4.0, 6.0, "B"), (6.0, 10.0, "C"),
+        ]
+        assert states[0].end_time is states[1].start_time
+
+    def test_repeated_values_extend_the_current_state(self):
+        entries = _entries((1, "A"), (2, "A"), (3, "B"), (5, "B"), (6, "B"), (8, "A"))
+
+        states = calculate_signal_states(entries, (BASE_TIME, _at(10)))
+
+        assert [(s.start_offset, s.end_offset, s.value) for s in states] == [
+            (1.0, 3.0, "A"), (3.0, 8.0, "B"), (8.0, 10.0, "A"),
+        ]
+
+    @pytest.mark.parametrize("changes, transitions", [
+        (((1, "A"), (2, "A"), (3, "A")), 0),
+        (((1, "A"), (2, "A"), (3, "B"), (5, "B"), (6, "B"), (8, "A")), 2),
+    ])
+    def test_transition_count_ignores_repeated_values(self, changes, transitions):
+        def make_log():
+            return ParsedLog(entries=_entries(*changes), time_range=(BASE_TIME, _at(10)))
+
+        (eager,) = process_signals_for_waveform(make_log())
+        lazy_log = make_log()
+        (lazy,) = process_signals_for_waveform(lazy_log, lazy=True)
+
+        assert len(eager.states) == transitions + 1
+        assert eager.transition_count == lazy.transition_count == transitions
+        assert eager.has_transitions == lazy.has_transitions == (transitions > 0)
+
+        compute_signal_states(lazy, lazy_log)
+        assert lazy.transition_count == transitions
+        assert lazy.has_transitions == (transitions > 0)
+
+    def test_signal_objects_have_no_instance_dict(self):
+        (state,) = calculate_signal_states(_entries((1, "A")), (BASE_TIME, _at(10)))
+
+        assert not hasattr(state, "__dict__")
+        assert not hasattr(SignalData("SIG", "DEV", "DEV::SIG", SignalType.STRING), "__dict__")
+
+    def test_reanchoring_recomputes_offsets(self):
+        states = calculate_signal_states(_entries((1, "A"), (4, "B")), (BASE_TIME, _at(10)))
+        signal = SignalData("SIG", "DEV", "DEV::SIG", SignalType.STRING, states=states)
+
+        signal.build_time_index(_at(1))
+
+        assert list(signal.start_offsets) == [0.0, 3.0]
+        assert list(signal.end_offsets) == [3.0, 9.0]
+        assert states[1].start_offset == 3.0
+
+    def test_clip_returns_overlapping_state_indices(self):
+        states = calculate_signal_states(_entries((0, "A"), (2, "B"), (4, "C"), (6, "D")), (BASE_TIME, _at(8)))
+        signal = SignalData("SIG", "DEV", "DEV::SIG", SignalType.STRING, states=states)
+        signal.build_time_index(BASE_TIME)
+
+        assert signal.clip(1.0, 5.0) == (0, 3)
+        # Boundaries are half-open: a state ending at t_start is not visible
+        assert signal.clip(2.0, 4.0) == (1, 2)
+        assert signal.clip(9.0, 10.0) == (4, 4)
+
+    def test_matching_anchor_reuses_state_offsets(self):
+        states = calculate_signal_states(_entries((1, "A"), (4, "B")), (BASE_TIME, _at(10)))
+        states[1].start_offset = 99.0  # Only visible if the offsets are copied
+        signal = SignalData("SIG", "DEV", "DEV::SIG", SignalType.STRING, states=states)
+
+        signal.build_time_index(BASE_TIME, offsets_anchor=BASE_TIME)
+        assert list(signal.start_offsets) == [1.0, 99.0]
+
+        signal.build_time_index(BASE_TIME, offsets_anchor=_at(1))
+        assert list(signal.start_offsets) == [1.0, 4.0]
+
+    def test_gapped_states_keep_their_own_boundaries(self):
+        states = [
+            SignalState(start_time=_at(0), end_time=_at(2), value="A"),
+            SignalState(start_time=_at(5), end_time=_at(7.5), value="B"),
+        ]
+        signal = SignalData("SIG", "DEV", "DEV::SIG", SignalType.STRING, states=states)
+
+        signal.build_time_index(BASE_TIME)
+
+        assert list(signal.start_offsets) == [0.0, 5.0]
+        assert list(signal.end_offsets) == pytest.approx([2.0, 7.5])
+
+
+class TestLazyStates:
+    def test_lazy_signals_share_one_grouping(self):
+        entries = _entries((3, "B"), (1, "A"))
+        entries.append(LogEntry("DEV", "OTHER", _at(2), 5, SignalType.INTEGER))
+        parsed_log = ParsedLog(entries=entries)
+        signals = process_signals_for_waveform(parsed_log, lazy=True)
+        grouped = group_by_signal(parsed_log)
+
+        for signal in signals:
+            compute_signal_states(signal, parsed_log)
+
+        assert group_by_signal(parsed_log) is grouped
+        by_key = {signal.key: signal for signal in signals}
+        assert [state.value for state in by_key["DEV::SIG"].states] == ["A", "B"]
+        assert [state.value for state in by_key["DEV::OTHER"].states] == [5]
+
+    def test_presorted_logs_are_grouped_without_sorting(self, monkeypatch):
+        parsed_log = ParsedLog(entries=_entries((1, "A"), (2, "B")), sorted_by_timestamp=True)
+        monkeypatch.setattr(waveform_data, "attrgetter", None)  # Any sort would fail
+
+        assert [entry.value for entry in group_by_signal(parsed_log)[("DEV", "SIG")]] == ["A", "B"]
@@ -0,0 +1,171 @@
+"""Tests for the zoomed-out waveform mipmap."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from plc_visualizer.models import SignalType
+from plc_visualizer.ui.components.waveform.renderers import BooleanRenderer, StateRenderer
+from plc_visualizer.utils import SignalData, SignalState, build_waveform_mipmap
+from plc_visualizer.utils.waveform_mipmap import (
+    MIN_MIPMAP_STATES,
+    MIXED,
+    _reduce_level,
+    build_signal_mipmap,
+    select_mipmap_level,
+)
+
+BASE_TIME = datetime(2024, 1, 1, 8, 0, 0)
+
+
+def _make_signal(changes, end_seconds, signal_type=SignalType.BOOLEAN):
+    """Build a SignalData from (offset_seconds, value) pairs."""
+    states = []
+    for index, (offset, value) in enumerate(changes):
+        end = changes[index + 1][0] if index + 1 < len(changes) else end_seconds
+        states.append(SignalState(
+            start_time=BASE_TIME + timedelta(seconds=offset),
+            end_time=BASE_TIME + timedelta(seconds=end),
+            value=value,
+        ))
+    signal = SignalData(
+        name="SIG",
+        device_id="DEV",
+        key="DEV::SIG",
+        signal_type=signal_type,
+        states=states,
+    )
+    signal.build_time_index(BASE_TIME)
+    return signal
+
+
+def _toggling_signal(count, step=0.01, tail=100.0):
+    """Boolean signal toggling every ``step`` seconds, then idle until ``tail``."""
+    changes = [(index * step, index % 2 == 0) for index in range(count)]
+    return _make_signal(changes, tail)
+
+
+class TestBuildMipmap:
+    def test_small_signals_are_skipped(self):
+        signal = _make_signal([(0.0, False), (1.0, True)], 2.0)
+
+        assert build_signal_mipmap(signal) is None
+        assert signal.mipmap is None
+
+    def test_levels_get_coarser(self):
+        signal = _toggling_signal(1000)
+
+        mipmap = build_signal_mipmap(signal, levels=4, factor=4)
+
+        assert [level.bucket_width for level in mipmap] == pytest.approx(
+            [100.0 / 256, 100.0 / 64, 100.0 / 16, 100.0 / 4]
+        )
+        sizes = [len(level) for level in mipmap]
+        assert sizes == sorted(sizes, reverse=True)
+        assert sizes[0] < len(signal.states)
+
+    def test_levels_cover_the_signal_without_gaps(self):
+        signal = _toggling_signal(1000)
+
+        for level in build_signal_mipmap(signal, levels=4, factor=4):
+            assert level.start_offsets[0] == 0.0
+            assert level.end_offsets[-1] == pytest.approx(100.0)
+            for end, next_start in zip(level.end_offsets, level.start_offsets[1:]):
+                assert end == pytest.approx(next_start)
+
+    def test_dense_run_becomes_one_mixed_segment(self):
+        signal = _toggling_signal(1000)
+
+        coarsest = build_signal_mipmap(signal, levels=4, factor=4)[-1]
+
+        # 10s of toggling fits in the first 25s bucket; the idle tail keeps its value
+        assert list(coarsest.values) == [MIXED, signal.states[-1].value]
+        assert coarsest.end_offsets[0] == pytest.approx(25.0)
+
+    def test_build_waveform_mipmap_skips_lazy_signals(self):
+        dense = _toggling_signal(MIN_MIPMAP_STATES * 2)
+        lazy = SignalData(name="L", device_id="DEV", key="DEV::L", signal_type=SignalType.BOOLEAN)
+
+        build_waveform_mipmap([dense, lazy])
+
+        assert dense.mipmap
+        assert lazy.mipmap is None
+
+    def test_recomputing_states_drops_the_mipmap(self):
+        signal = _toggling_signal(1000)
+        build_signal_mipmap(signal)
+
+        signal.build_time_index(BASE_TIME)
+        assert signal.mipmap is None
+
+        build_signal_mipmap(signal)
+        signal.clear_states()
+        assert signal.mipmap is None
+
+    def test_select_level_stays_below_one_pixel(self):
+        signal = _toggling_signal(1000)
+        build_signal_mipmap(signal, levels=4, factor=4)
+
+        assert select_mipmap_level(signal, 0.1) is None
+        assert select_mipmap_level(signal, 1.0).bucket_width == pytest.approx(100.0 / 256)
+        assert select_mipmap_level(signal, 10.0).bucket_width == pytest.approx(100.0 / 16)
+
+    def test_cascaded_levels_match_direct_reduction(self):
+        changes = []
+        offset = 0.0
+        for index in range(3000):
+            changes.append((offset, f"S{index % 3}"))
+            offset += (0.001, 0.013, 1.7)[index % 3 if index < 2000 else 2]
+        signal = _make_signal(changes, offset + 5.0, SignalType.STRING)
+        values = [state.value for state in signal.states]
+
+        for level in build_signal_mipmap(signal):
+            direct = _reduce_level(signal.start_offsets, signal.end_offsets, values, level.bucket_width)
+            assert list(level.start_offsets) == list(direct.start_offsets)
+            assert list(level.end_offsets) == list(direct.end_offsets)
+            assert level.values == direct.values
+
+
+class TestRendererClipping:
+    def test_zoomed_out_clip_is_bounded_by_width(self):
+        signal = _toggling_signal(20000, step=0.005)
+        renderer = BooleanRenderer()
+        time_range = (BASE_TIME, BASE_TIME + timedelta(seconds=100))
+
+        clipped = renderer.clip_states(signal, time_range, 200)
+
+        assert len(clipped) <= 200
+        assert any(state.value is MIXED for state in clipped)
+        assert clipped[0].start_time == BASE_TIME
+        assert clipped[-1].end_offset == pytest.approx(100.0)
+        assert renderer.render(signal, time_range, 200, clipped_states=clipped)
+
+    def test_zoomed_in_clip_uses_raw_states(self):
+        signal = _toggling_signal(20000, step=0.005)
+        renderer = BooleanRenderer()
+        time_range = (BASE_TIME, BASE_TIME + timedelta(seconds=1))
+
+        clipped = renderer.clip_states(signal, time_range, 1000)
+
+        assert len(clipped) == 200
+        assert all(state.value is not MIXED for state in clipped)
+
+    def test_sparse_signal_ignores_width(self):
+        signal = _make_signal([(0.0, "A"), (50.0, "B")], 100.0, SignalType.STRING)
+        renderer = StateRenderer()
+        time_range = (BASE_TIME, BASE_TIME + timedelta(seconds=100))
+
+        assert [s.value for s in renderer.clip_states(signal, time_range, 10)] == ["A", "B"]
+        assert signal.mipmap is None
+
+    def test_mixed_spans_have_no_text(self):
+        changes = [(index * 0.0025, f"S{index % 3}") for index in range(20000)]
+        signal = _make_signal(changes, 100.0, SignalType.STRING)
+        renderer = StateRenderer()
+        time_range = (BASE_TIME, BASE_TIME + timedelta(seconds=100))
+
+        clipped = renderer.clip_states(signal, time_range, 200)
+        texts = renderer.get_text_items(signal, time_range, 200, clipped_states=clipped)
+
+        assert any(state.value is MIXED for state in clipped)
+        assert texts and all(text != "MIXED" for text, _ in texts)
@@ -0,0 +1,66 @@
+"""Tests for the waveform zoom controls slider mapping."""
+
+import pytest
+
+from plc_visualizer.ui.components.waveform.zoom_controls import ZoomControls
+
+
+@pytest.fixture
+def zoom_controls(qtbot):
+    controls = ZoomControls()
+    qtbot.addWidget(controls)
+    return controls
+
+
+def emitted_duration(qtbot, controls, value):
+    with qtbot.waitSignal(controls.duration_changed) as blocker:
+        controls.zoom_slider.setValue(value)
+    return blocker.args[0]
+
+
+def slider_duration(value):
+    """Duration the log-scale slider maps ``value`` to."""
+    return 300.0 * (0.001 / 300.0) ** (value / 1000)
+
+
+def test_slider_ends_map_to_duration_bounds(qtbot, zoom_controls):
+    assert emitted_duration(qtbot, zoom_controls, 1000) == 0.001
+    assert emitted_duration(qtbot, zoom_controls, 0) == 300.0
+
+
+def test_slider_scale_is_logarithmic(qtbot, zoom_controls):
+    # Halfway along the slider is the geometric mean of the bounds
+    assert emitted_duration(qtbot, zoom_controls, 500) == pytest.approx((0.001 * 300.0) ** 0.5)
+
+
+@pytest.mark.parametrize("value", [1, 137, 500, 999])
+def test_duration_round_trips_to_slider_position(qtbot, zoom_controls, value):
+    duration = emitted_duration(qtbot, zoom_controls, value)
+    zoom_controls.zoom_slider.setValue(0)
+
+    zoom_controls.set_visible_duration(duration)
+    assert zoom_controls.zoom_slider.value() == value
+
+
+def test_custom_bounds_use_their_own_scale(zoom_controls):
+    zoom_controls.set_visible_duration(1.0, min_duration=0.01, max_duration=100.0)
+    assert zoom_controls.zoom_slider.value() == 500
+
+
+def test_dragging_throttles_and_release_flushes(qtbot, zoom_controls):
+    slider = zoom_controls.zoom_slider
+    emitted = []
+    zoom_controls.duration_changed.connect(emitted.append)
+
+    slider.setSliderDown(True)
+    for value in range(100, 200):
+        slider.setValue(value)
+    assert emitted == []
+
+    qtbot.waitUntil(lambda: len(emitted) == 1, timeout=1000)
+    assert emitted == [pytest.approx(slider_duration(199))]
+
+    slider.setValue(300)
+    slider.setSliderDown(False)
+    assert emitted[-1] == pytest.approx(slider_duration(300))
+    assert len(emitted) == 2
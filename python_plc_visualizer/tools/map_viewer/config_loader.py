@@ -7,9 +7,15 @@ import yaml
 from .device_mapping import DeviceUnitMap
 from .color_policy import ColorPolicy, ColorRule
 
-def load_mapping_and_policy(yaml_path: str) -> tuple[DeviceUnitMap, ColorPolicy]:
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _load_yaml(yaml_path: str) -> dict:
     with open(yaml_path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+def load_mapping_and_policy(yaml_path: str) -> tuple[DeviceUnitMap, ColorPolicy]:
+    cfg = _load_yaml(yaml_path)
     rules_cfg: List[dict] = cfg.get("rules", [])
     rules = [
         ColorRule(
@@ -45,8 +51,7 @@ def load_xml_parsing_config(yaml_path: str) -> dict:
     - forecolor_mapping: Dict[str, str]
     """
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
+        cfg = _load_yaml(yaml_path)
         xml_cfg = cfg.get("xml_parsing", {})
         
         return {
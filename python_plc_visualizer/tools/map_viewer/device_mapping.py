@@ -14,8 +14,15 @@ class DeviceUnitMap:
         # rules: [{pattern: "B1ACNV*-104@*", unit_id: "B1ACNV13301-104"}]
         # or [{pattern: "B1ACNV*@*", unit_id: "*"}] to extract from device_id
         self.rules = rules or []
+        # Resolved lookups, filled on demand for the device ids actually seen
+        self._resolved: Dict[str, Optional[str]] = {}
 
     def map(self, device_id: str) -> Optional[str]:
+        if device_id not in self._resolved:
+            self._resolved[device_id] = self._match(device_id)
+        return self._resolved[device_id]
+
+    def _match(self, device_id: str) -> Optional[str]:
         for r in self.rules:
             pat = r.get("pattern")
             uid = r.get("unit_id")
@@ -22,18 +22,28 @@ class MapParser(QObject):
         self._demo_units: list[str] = []
 
     def parse_file(self, xml_path: str) -> Dict[str, Dict[str, Any]]:
-        root = ET.parse(xml_path).getroot()
+        # Stream the file instead of building the whole tree: each Object is
+        # registered when it opens (keeping document order), filled in when it
+        # closes, and then cleared so its subtree can be freed.
         res: Dict[str, Dict[str, Any]] = {}
-        for obj in root.findall('.//Object[@name]'):
-            name = obj.get("name")
-            if not name:
+        pending: list[Optional[Dict[str, Any]]] = []
+        for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+            if elem.tag != "Object":
                 continue
-            entry: Dict[str, Any] = {}
-            for attr in ATTRIBUTES_TO_EXTRACT:
-                entry[attr] = obj.get(attr)
-            for child in CHILD_ELEMENTS_TO_EXTRACT:
-                entry[child] = obj.findtext(child)
-            res[name] = entry
+            if event == "start":
+                name = elem.get("name")
+                entry: Optional[Dict[str, Any]] = None
+                if name:
+                    entry = {attr: elem.get(attr) for attr in ATTRIBUTES_TO_EXTRACT}
+                    res[name] = entry
+                pending.append(entry)
+                continue
+
+            entry = pending.pop()
+            if entry is not None:
+                for child in CHILD_ELEMENTS_TO_EXTRACT:
+                    entry[child] = elem.findtext(child)
+            elem.clear()
 
         self.objectsParsed.emit(res)
         return res
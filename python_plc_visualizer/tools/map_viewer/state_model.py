@@ -115,6 +115,45 @@ class UnitStateModel(QObject):
             self._arrow_colors[unit_id] = arrow_color
             self._text_overlays[unit_id] = text_info
             self.stateChanged.emit(unit_id, block_color, arrow_color, text_info)
+
+    @Slot(object)
+    def on_signals(self, events: Iterable[tuple]):
+        """Apply a batch of signal events, emitting at most once per unit.
+
+        Events may be SignalEvents or plain ``(device_id, signal_name, value,
+        timestamp)`` tuples, so hot callers need not build a SignalEvent each.
+        Events are applied in order so later events for a unit see the colors
+        left by earlier ones; stateChanged fires only for units whose final
+        state differs from the state they had before the batch.
+        """
+        original: dict[str, tuple] = {}
+        for event in events:
+            device_id, signal_name, value, _timestamp = event
+            if self._enable_carrier_tracking and signal_name == "CurrentLocation":
+                self._handle_carrier_location_update(SignalEvent._make(event))
+                continue
+
+            unit_id = self._device_map.map(device_id) or device_id  # fallback: use device_id
+            prev_block_color = self._block_colors.get(unit_id)
+            prev_arrow_color = self._arrow_colors.get(unit_id)
+            if unit_id not in original:
+                original[unit_id] = (prev_block_color, prev_arrow_color, self._text_overlays.get(unit_id))
+
+            block_color, arrow_color, text_info = self._policy.color_for(
+                unit_id, signal_name, value, prev_block_color, prev_arrow_color
+            )
+            self._block_colors[unit_id] = block_color
+            self._arrow_colors[unit_id] = arrow_color
+            self._text_overlays[unit_id] = text_info
+
+        for unit_id, prev_state in original.items():
+            state = (
+                self._block_colors.get(unit_id),
+                self._arrow_colors.get(unit_id),
+                self._text_overlays.get(unit_id),
+            )
+            if state != prev_state:
+                self.stateChanged.emit(unit_id, *state)
     
     def _handle_carrier_location_update(self, event: SignalEvent):
         """Handle CurrentLocation signal update for carrier tracking.